@@ -14,6 +14,7 @@ from src.utils.file_utils import generate_unique_filename, ensure_directory_exis
 from src.utils.logging import get_logger
 from src.utils.transcription_cache import TranscriptionCache
 from src.utils.lazy_text_processor import LazyTextProcessor
+from src.utils.prompt_template import render_prompt
 from src.utils.error_messages import get_user_friendly_message
 from src.utils.cancellation_manager import CancellationManager
 from src.interfaces.message_queue import MessageQueue
@@ -993,7 +994,7 @@ class AutoMeetAI:
                         check_cancellation()
 
                         # Format the user prompt with the chunk text
-                        chunk_prompt = user_prompt_template.format(transcription=chunk_text)
+                        chunk_prompt = render_prompt(user_prompt_template, chunk_text)
 
                         # Generate analysis for this chunk
                         chunk_analysis = self.text_generation_service.generate(
@@ -1020,7 +1021,7 @@ class AutoMeetAI:
                 # Use standard processing for small transcriptions
                 try:
                     # Format the user prompt with the transcription text
-                    user_prompt = user_prompt_template.format(transcription=transcription.to_formatted_text())
+                    user_prompt = render_prompt(user_prompt_template, transcription.to_formatted_text())
                 except Exception as e:
                     raise ServiceError(f"Failed to format user prompt: {e}") from e
 
@@ -1,4 +1,4 @@
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Mapping
 from src.interfaces.config_provider import ConfigProvider
 from src.utils.logging import get_logger
 
@@ -86,6 +86,21 @@ class CompositeConfigProvider(ConfigProvider):
         for provider in self.providers:
             provider.set(key, value)
             
+    def update(self, values: Mapping[str, Any]) -> None:
+        """
+        Define vários valores de configuração em todos os provedores com uma única chamada por provedor.
+        
+        Args:
+            values: Mapeamento de chaves de configuração para valores
+        """
+        # Se não houver provedores, não faz nada
+        if not self.providers:
+            logger.warning("Nenhum provedor de configuração disponível para definir os valores")
+            return
+            
+        for provider in self.providers:
+            provider.update(values)
+            
     def get_all(self) -> Dict[str, Any]:
         """
         Obtém todas as configurações de todos os provedores.
@@ -1,5 +1,5 @@
 import os
-from typing import Any, Optional, Dict, Callable
+from typing import Any, Optional, Dict, Callable, Mapping
 from src.interfaces.config_provider import ConfigProvider
 from src.config.config_validator import ConfigValidator
 from src.utils.logging import get_logger
@@ -90,3 +90,12 @@ class EnvConfigProvider(ConfigProvider):
             value: The configuration value
         """
         self._config[key] = value
+
+    def update(self, values: Mapping[str, Any]) -> None:
+        """
+        Set several configuration values in in-memory storage at once.
+
+        Args:
+            values: Mapping of configuration keys to values
+        """
+        self._config.update(values)
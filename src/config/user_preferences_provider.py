@@ -1,6 +1,6 @@
 import os
 import json
-from typing import Any, Optional, Dict, Callable
+from typing import Any, Optional, Dict, Callable, Mapping
 from src.interfaces.config_provider import ConfigProvider
 from src.config.config_validator import ConfigValidator
 from src.utils.logging import get_logger
@@ -102,19 +102,42 @@ class UserPreferencesProvider(ConfigProvider):
             key: A chave de configuração
             value: O valor de configuração
         """
-        # Valida o valor se existir um validador para esta chave
+        # Atualiza as preferências
+        self._preferences[key] = self._validate(key, value)
+        
+        # Salva as preferências no arquivo
+        self._save_preferences()
+    
+    def update(self, values: Mapping[str, Any]) -> None:
+        """
+        Define vários valores de configuração e salva o arquivo de preferências uma única vez.
+        
+        Args:
+            values: Mapeamento de chaves de configuração para valores
+        """
+        self._preferences.update(
+            (key, self._validate(key, value)) for key, value in values.items()
+        )
+        self._save_preferences()
+    
+    def _validate(self, key: str, value: Any) -> Any:
+        """
+        Valida um valor se existir um validador para a chave.
+        
+        Args:
+            key: A chave de configuração
+            value: O valor de configuração
+            
+        Returns:
+            Any: O valor validado, ou o valor original se a validação falhar
+        """
         if key in self._validators:
             try:
-                value = self._validators[key](value)
+                return self._validators[key](value)
             except ValueError as e:
                 logger.warning(f"Valor de configuração inválido para {key}: {e}")
                 # Continua com o valor original se a validação falhar
-        
-        # Atualiza as preferências
-        self._preferences[key] = value
-        
-        # Salva as preferências no arquivo
-        self._save_preferences()
+        return value
     
     def get_all(self) -> Dict[str, Any]:
         """
@@ -1,4 +1,4 @@
-from typing import Dict, Type, Any, Optional, TypeVar, Generic, cast
+from typing import Dict, Any, Optional, TypeVar, Callable
 
 T = TypeVar('T')
 
@@ -8,15 +8,18 @@ class Container:
     Gerencia o ciclo de vida dos serviços e suas dependências.
     """
 
+    __slots__ = ("_registrations", "_instances", "_factories", "_resolvers")
+
     def __init__(self):
         """
         Inicializa o container com dicionários vazios para registros e instâncias.
         """
-        self._registrations: Dict[str, Type[Any]] = {}
+        self._registrations: Dict[str, type] = {}
         self._instances: Dict[str, Any] = {}
-        self._factories: Dict[str, callable] = {}
+        self._factories: Dict[str, Callable[..., Any]] = {}
+        self._resolvers: Dict[str, Callable[..., Any]] = {}
 
-    def register(self, name: str, cls: Type[T]) -> None:
+    def register(self, name: str, cls: type) -> None:
         """
         Registra uma classe no container.
 
@@ -36,7 +39,7 @@ class Container:
         """
         self._instances[name] = instance
 
-    def register_factory(self, name: str, factory: callable) -> None:
+    def register_factory(self, name: str, factory: Callable[..., Any]) -> None:
         """
         Registra uma fábrica para criar instâncias sob demanda.
 
@@ -46,6 +49,19 @@ class Container:
         """
         self._factories[name] = factory
 
+    def register_resolver(self, name: str, resolver: Callable[..., Any]) -> None:
+        """
+        Registra um resolvedor que cria uma nova instância a cada resolução.
+
+        Diferente das fábricas, o resultado não é armazenado: cada chamada de
+        resolve() invoca o resolvedor diretamente com os argumentos recebidos.
+
+        Args:
+            name: Nome para registrar o resolvedor
+            resolver: Callable (por exemplo, uma classe) que cria a instância
+        """
+        self._resolvers[name] = resolver
+
     def resolve(self, name: str, **kwargs) -> T:
         """
         Resolve uma dependência pelo nome.
@@ -64,6 +80,11 @@ class Container:
         if name in self._instances:
             return self._instances[name]
 
+        # Verificar se temos um resolvedor (instância nova a cada chamada)
+        resolver = self._resolvers.get(name)
+        if resolver is not None:
+            return resolver(**kwargs)
+
         # Verificar se temos uma fábrica
         if name in self._factories:
             instance = self._factories[name](**kwargs)
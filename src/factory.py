@@ -1,23 +1,94 @@
-from typing import Optional, Dict, Any, List, Type
+import os
+import importlib
+import operator
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Type, Tuple
 from src.config.env_config_provider import EnvConfigProvider
 from src.config.user_preferences_provider import UserPreferencesProvider
 from src.config.composite_config_provider import CompositeConfigProvider
-from src.services.moviepy_audio_converter import MoviePyAudioConverter
-from src.services.assemblyai_transcription_service import AssemblyAITranscriptionService
 from src.services.mock_transcription_service import MockTranscriptionService
-from src.services.whisper_transcription_service import WhisperTranscriptionService
-from src.services.openai_text_generation_service import OpenAITextGenerationService
 from src.services.null_text_generation_service import NullTextGenerationService
 from src.automeetai import AutoMeetAI
 from src.interfaces.factory import AutoMeetAIFactoryInterface
+from src.interfaces.config_provider import ConfigProvider
 from src.interfaces.transcription_service import TranscriptionService
+from src.interfaces.audio_converter import AudioConverter
+from src.interfaces.text_generation_service import TextGenerationService
 from src.interfaces.plugin import PluginRegistry, Plugin
 from src.container import Container
 from src.utils.logging import get_logger
+from src.utils.plugin_index import PluginIndex
 
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# Prefixo das variáveis de ambiente lidas pelo provedor de configuração
+ENV_PREFIX = "AUTOMEETAI_"
+
+# Mapeamento de tipos de serviço de transcrição para (módulo, classe).
+# Os módulos são importados apenas quando o serviço é selecionado, evitando
+# carregar SDKs pesados (openai, assemblyai) que não serão usados.
+_TRANSCRIPTION_SERVICES: Dict[str, Tuple[str, str]] = {
+    "mock": ("src.services.mock_transcription_service", "MockTranscriptionService"),
+    "assemblyai": ("src.services.assemblyai_transcription_service", "AssemblyAITranscriptionService"),
+    "whisper": ("src.services.whisper_transcription_service", "WhisperTranscriptionService")
+}
+_DEFAULT_TRANSCRIPTION_SERVICE = "assemblyai"
+
+
+def _load_transcription_service_class(service_type: str) -> Type[TranscriptionService]:
+    """
+    Importa e retorna a classe do serviço de transcrição para o tipo informado.
+
+    Args:
+        service_type: Tipo do serviço de transcrição (mock, assemblyai, whisper)
+
+    Returns:
+        Type[TranscriptionService]: A classe do serviço (AssemblyAI para tipos desconhecidos)
+    """
+    service_key = service_type.lower()
+    if service_key not in _TRANSCRIPTION_SERVICES:
+        # Default to AssemblyAI if an unknown type is specified
+        logger.warning(f"Unknown transcription service type: {service_type}. Using AssemblyAI.")
+        service_key = _DEFAULT_TRANSCRIPTION_SERVICE
+
+    module_name, class_name = _TRANSCRIPTION_SERVICES[service_key]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+# Metadados de um plugin lidos de uma só vez
+_PLUGIN_INFO_KEYS = ("name", "version", "description")
+_plugin_metadata = operator.attrgetter(*_PLUGIN_INFO_KEYS)
+
+
+def _create_audio_converter(**kwargs) -> AudioConverter:
+    """
+    Cria o conversor de áudio padrão (MoviePy), importando-o sob demanda.
+
+    Args:
+        **kwargs: Argumentos repassados ao construtor do conversor
+
+    Returns:
+        AudioConverter: O conversor de áudio
+    """
+    from src.services.moviepy_audio_converter import MoviePyAudioConverter
+    return MoviePyAudioConverter(**kwargs)
+
+
+def _create_text_generation_service(**kwargs) -> TextGenerationService:
+    """
+    Cria o serviço de geração de texto padrão (OpenAI), importando-o sob demanda.
+
+    Args:
+        **kwargs: Argumentos repassados ao construtor do serviço
+
+    Returns:
+        TextGenerationService: O serviço de geração de texto
+    """
+    from src.services.openai_text_generation_service import OpenAITextGenerationService
+    return OpenAITextGenerationService(**kwargs)
+
 
 class AutoMeetAIFactory(AutoMeetAIFactoryInterface):
     """
@@ -32,6 +103,9 @@ class AutoMeetAIFactory(AutoMeetAIFactoryInterface):
     e testabilidade da aplicação.
     """
 
+    # Número máximo de instâncias do AutoMeetAI mantidas no cache de create()
+    CREATE_CACHE_SIZE = 32
+
     def __init__(self):
         """
         Inicializa a fábrica com um contêiner de injeção de dependência.
@@ -44,22 +118,70 @@ class AutoMeetAIFactory(AutoMeetAIFactoryInterface):
         self.plugin_registry = PluginRegistry()
         self.plugins_loaded = False
         self.plugin_config = {}
+        self._create_cache: "OrderedDict[tuple, AutoMeetAI]" = OrderedDict()
+        self._create_lock = threading.Lock()
+        self._plugin_info_cache: Optional[Tuple[int, List[Dict[str, str]]]] = None
+        self._register_defaults()
+
+    def _register_defaults(self) -> None:
+        """
+        Registra no contêiner, uma única vez, as implementações padrão dos serviços.
+
+        São registrados resolvedores em vez das classes para que os módulos dos serviços
+        (e suas dependências pesadas) só sejam importados quando o serviço for usado, e
+        para que cada chamada de create() receba serviços ligados ao seu próprio provedor
+        de configuração. O serviço de transcrição não é registrado aqui, pois sua classe
+        depende do tipo solicitado em cada chamada de create().
+        """
+        self.container.register_resolver("audio_converter", _create_audio_converter)
+        self.container.register_resolver("text_generation_service", _create_text_generation_service)
+
+    def clear_cache(self) -> None:
+        """
+        Descarta as instâncias do AutoMeetAI armazenadas pelo método create().
 
-    def load_plugins(self, plugin_dir: str = "plugins") -> int:
+        Mudanças nas variáveis de ambiente AUTOMEETAI_* ou no arquivo de preferências
+        já invalidam o cache automaticamente; este método serve para os casos em que
+        uma nova instância, sem estado compartilhado, é necessária.
+        """
+        with self._create_lock:
+            self._create_cache.clear()
+
+    def load_plugins(self, plugin_dir: str = "plugins",
+                     index_file: Optional[str] = os.path.join("cache", "plugins_index.json")) -> int:
         """
         Carrega plugins do diretório especificado.
 
-        Este método utiliza o PluginRegistry para descobrir e carregar plugins
-        do diretório especificado. Os plugins carregados podem fornecer implementações
-        alternativas para os serviços utilizados pela aplicação.
+        Os metadados dos plugins (nome, versão, descrição e pontos de extensão) são
+        extraídos estaticamente e persistidos em um índice, de modo que os módulos
+        dos plugins só são importados quando uma implementação é efetivamente
+        solicitada. Arquivos cujos metadados não podem ser extraídos estaticamente
+        são importados imediatamente.
 
         Args:
             plugin_dir: Diretório onde procurar plugins
+            index_file: Caminho do índice de metadados dos plugins. Se None, os
+                plugins são importados imediatamente, sem usar o índice
 
         Returns:
             int: Número de plugins carregados
         """
-        count = self.plugin_registry.discover_plugins(plugin_dir)
+        self.clear_cache()
+
+        if index_file is None:
+            count = self.plugin_registry.discover_plugins(plugin_dir)
+            self.plugins_loaded = count > 0
+            return count
+
+        count = 0
+        for entry in PluginIndex(index_file).refresh(plugin_dir):
+            if entry["static"]:
+                for metadata in entry["plugins"]:
+                    if self.plugin_registry.register_lazy_plugin(metadata, entry["module_name"], entry["module_path"]):
+                        count += 1
+            else:
+                count += self.plugin_registry.load_plugin_module(entry["module_name"], entry["module_path"])
+
         self.plugins_loaded = count > 0
         return count
 
@@ -77,6 +199,7 @@ class AutoMeetAIFactory(AutoMeetAIFactoryInterface):
             Dict[str, bool]: Dicionário mapeando nomes de plugins para status de inicialização
         """
         self.plugin_config = plugin_config
+        self.clear_cache()
         return self.plugin_registry.initialize_plugins(plugin_config)
 
     def get_plugin_names(self) -> List[str]:
@@ -86,24 +209,33 @@ class AutoMeetAIFactory(AutoMeetAIFactoryInterface):
         Returns:
             List[str]: Lista de nomes dos plugins carregados
         """
-        return [plugin.name for plugin in self.plugin_registry.get_plugins()]
+        return [info["name"] for info in self.get_plugin_info()]
 
     def get_plugin_info(self) -> List[Dict[str, str]]:
         """
         Retorna informações sobre os plugins carregados.
 
+        O resultado é reaproveitado enquanto a revisão do registro de plugins não
+        mudar, portanto a lista retornada não deve ser modificada.
+
         Returns:
             List[Dict[str, str]]: Lista de dicionários contendo informações sobre os plugins
         """
-        return [
-            {
-                "name": plugin.name,
-                "version": plugin.version,
-                "description": plugin.description,
-                "extension_points": ", ".join(plugin.get_extension_points())
-            }
-            for plugin in self.plugin_registry.get_plugins()
+        cached = self._plugin_info_cache
+        if cached is not None and cached[0] == self.plugin_registry.revision:
+            return cached[1]
+
+        # get_plugins() pode carregar plugins preguiçosos e alterar a revisão
+        plugins = self.plugin_registry.get_plugins()
+        info = [
+            dict(
+                zip(_PLUGIN_INFO_KEYS, _plugin_metadata(plugin)),
+                extension_points=", ".join(plugin.get_extension_points())
+            )
+            for plugin in plugins
         ]
+        self._plugin_info_cache = (self.plugin_registry.revision, info)
+        return info
 
     def create(
         self,
@@ -133,6 +265,13 @@ class AutoMeetAIFactory(AutoMeetAIFactoryInterface):
         As chaves de API podem ser fornecidas diretamente como parâmetros ou através
         de variáveis de ambiente (AUTOMEETAI_ASSEMBLYAI_API_KEY e AUTOMEETAI_OPENAI_API_KEY).
 
+        Instâncias criadas sem fila de mensagens são armazenadas em cache pela configuração
+        efetiva: os argumentos, as variáveis de ambiente AUTOMEETAI_* e o estado do arquivo
+        de preferências do usuário. Chamadas repetidas com a mesma configuração retornam a
+        mesma instância compartilhada (e com estado), sem reconstruir os provedores de
+        configuração e os serviços; uma nova instância é criada quando o ambiente ou o
+        arquivo de preferências mudam. Use clear_cache() para obter sempre uma nova instância.
+
         Args:
             assemblyai_api_key: Chave de API para o serviço AssemblyAI
             openai_api_key: Chave de API para o serviço OpenAI
@@ -150,33 +289,130 @@ class AutoMeetAIFactory(AutoMeetAIFactoryInterface):
         Returns:
             AutoMeetAI: Uma instância configurada do AutoMeetAI
         """
-        # Create configuration providers
-        env_config_provider = EnvConfigProvider()
+        build_args = (
+            assemblyai_api_key,
+            openai_api_key,
+            include_text_generation,
+            use_cache,
+            cache_dir,
+            use_plugins,
+            plugin_preferences,
+            transcription_service_type,
+            use_user_preferences,
+            user_preferences_file
+        )
 
-        # Create a composite config provider
-        composite_provider = CompositeConfigProvider()
+        # A fila de mensagens inicia workers, então cada chamada deve criar uma nova instância
+        if use_message_queue:
+            from src.services.in_memory_message_queue import InMemoryMessageQueue
+
+            app = self._build(*build_args)
+            queue = InMemoryMessageQueue(lambda path: app.process_video(path))
+            app.set_message_queue(queue)
+            app.iniciar_fila(queue_workers)
+            return app
+
+        cache_key = (
+            assemblyai_api_key,
+            openai_api_key,
+            include_text_generation,
+            use_cache,
+            cache_dir,
+            use_plugins,
+            frozenset(plugin_preferences.items()) if plugin_preferences else None,
+            transcription_service_type,
+            use_user_preferences,
+            user_preferences_file,
+            self.plugins_loaded,
+            self._config_state(use_user_preferences, user_preferences_file)
+        )
+
+        with self._create_lock:
+            app = self._create_cache.get(cache_key)
+            if app is not None:
+                self._create_cache.move_to_end(cache_key)
+                return app
+
+            app = self._build(*build_args)
+            self._create_cache[cache_key] = app
+            if len(self._create_cache) > self.CREATE_CACHE_SIZE:
+                self._create_cache.popitem(last=False)
+            return app
+
+    @staticmethod
+    def _config_state(use_user_preferences: bool, user_preferences_file: str) -> tuple:
+        """
+        Retorna um retrato da configuração externa lida pelos provedores de create().
+
+        Args:
+            use_user_preferences: Indica se as preferências do usuário são utilizadas
+            user_preferences_file: Caminho para o arquivo de preferências do usuário
+
+        Returns:
+            tuple: Variáveis de ambiente AUTOMEETAI_* e, se usado, o instante de
+                modificação e o tamanho do arquivo de preferências
+        """
+        env_state = tuple(sorted(
+            (key, value) for key, value in os.environ.items() if key.startswith(ENV_PREFIX)
+        ))
+        file_state = None
+        if use_user_preferences:
+            try:
+                stat = os.stat(user_preferences_file)
+                file_state = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+        return env_state, file_state
+
+    def _build(
+        self,
+        assemblyai_api_key: Optional[str],
+        openai_api_key: Optional[str],
+        include_text_generation: bool,
+        use_cache: bool,
+        cache_dir: str,
+        use_plugins: bool,
+        plugin_preferences: Optional[Dict[str, str]],
+        transcription_service_type: str,
+        use_user_preferences: bool,
+        user_preferences_file: str
+    ) -> AutoMeetAI:
+        """
+        Constrói uma nova instância do AutoMeetAI, sem consultar o cache.
+
+        Args:
+            Os mesmos argumentos de create(), exceto os relacionados à fila de mensagens
 
-        # Add environment config provider first (highest precedence)
-        composite_provider.add_provider(env_config_provider)
+        Returns:
+            AutoMeetAI: Uma instância configurada do AutoMeetAI
+        """
+        # Create configuration providers
+        env_config_provider = EnvConfigProvider(ENV_PREFIX)
+        config_provider: ConfigProvider = env_config_provider
 
-        # Add user preferences provider if enabled
+        # Add user preferences provider if enabled. Only then is a composite provider
+        # needed; with a single provider the environment provider is used directly,
+        # avoiding an extra indirection on every configuration lookup.
         if use_user_preferences:
             user_preferences_provider = UserPreferencesProvider(user_preferences_file)
-            composite_provider.add_provider(user_preferences_provider)
+
+            # Environment config provider comes first (highest precedence)
+            config_provider = CompositeConfigProvider([config_provider, user_preferences_provider])
             logger.info(f"Usando preferências do usuário do arquivo: {user_preferences_file}")
 
-        # Set API keys if provided
+        # Set API keys if provided. They are kept in memory by the environment provider,
+        # which takes precedence over the user preferences, so the preferences file is
+        # not rewritten (and the create() cache is not invalidated) on every call.
+        overrides = {}
         if assemblyai_api_key:
-            composite_provider.set("assemblyai_api_key", assemblyai_api_key)
-
+            overrides["assemblyai_api_key"] = assemblyai_api_key
         if openai_api_key:
-            composite_provider.set("openai_api_key", openai_api_key)
+            overrides["openai_api_key"] = openai_api_key
+        if overrides:
+            env_config_provider.update(overrides)
 
         # Register services in the container
-        self.container.register_instance("config_provider", composite_provider)
-
-        # Assign composite_provider to config_provider for use in resolving services
-        config_provider = composite_provider
+        self.container.register_instance("config_provider", config_provider)
 
         # Initialize plugin preferences if not provided
         if plugin_preferences is None:
@@ -194,7 +430,12 @@ class AutoMeetAIFactory(AutoMeetAIFactoryInterface):
 
         # If using plugins, try to get implementations from plugins first
         if use_plugin_implementations:
-            for extension_point in services.keys():
+            # Only probe extension points that some plugin implements or that have
+            # an explicitly preferred plugin
+            candidate_points = services.keys() & (
+                self.plugin_registry.get_active_extension_points() | plugin_preferences.keys()
+            )
+            for extension_point in candidate_points:
                 # Check if there's a preferred plugin for this extension point
                 preferred_plugin = plugin_preferences.get(extension_point)
 
@@ -214,36 +455,23 @@ class AutoMeetAIFactory(AutoMeetAIFactoryInterface):
 
         # Register default implementations for services not provided by plugins
         if services["audio_converter"] is None:
-            self.container.register("audio_converter", MoviePyAudioConverter)
             services["audio_converter"] = self.container.resolve("audio_converter", config_provider=config_provider)
 
         if services["transcription_service"] is None:
             # Select the transcription service based on the specified type
-            transcription_service_class: Type[TranscriptionService]
-
-            if transcription_service_type.lower() == "mock":
-                transcription_service_class = MockTranscriptionService
-            elif transcription_service_type.lower() == "assemblyai":
-                transcription_service_class = AssemblyAITranscriptionService
-            elif transcription_service_type.lower() == "whisper":
-                transcription_service_class = WhisperTranscriptionService
-            else:
-                # Default to AssemblyAI if an unknown type is specified
-                self.logger.warning(f"Unknown transcription service type: {transcription_service_type}. Using AssemblyAI.")
-                transcription_service_class = AssemblyAITranscriptionService
+            transcription_service_class = _load_transcription_service_class(transcription_service_type)
 
-            self.container.register("transcription_service", transcription_service_class)
+            self.container.register_resolver("transcription_service", transcription_service_class)
             services["transcription_service"] = self.container.resolve("transcription_service", config_provider=config_provider)
 
         if services["text_generation_service"] is None:
             if include_text_generation:
-                self.container.register("text_generation_service", OpenAITextGenerationService)
                 services["text_generation_service"] = self.container.resolve("text_generation_service", config_provider=config_provider)
             else:
                 services["text_generation_service"] = NullTextGenerationService()
 
         # Create the application
-        app = AutoMeetAI(
+        return AutoMeetAI(
             config_provider=config_provider,
             audio_converter=services["audio_converter"],
             transcription_service=services["transcription_service"],
@@ -251,13 +479,3 @@ class AutoMeetAIFactory(AutoMeetAIFactoryInterface):
             use_cache=use_cache,
             cache_dir=cache_dir
         )
-
-        # Configure message queue if requested
-        if use_message_queue:
-            from src.services.in_memory_message_queue import InMemoryMessageQueue
-
-            queue = InMemoryMessageQueue(lambda path: app.process_video(path))
-            app.set_message_queue(queue)
-            app.iniciar_fila(queue_workers)
-
-        return app
@@ -1,4 +1,4 @@
-from typing import Dict, Type, Optional
+from typing import Dict, Type, Optional, Tuple
 
 from src.interfaces.output_formatter import OutputFormatter
 from src.formatters.text_formatter import TextFormatter
@@ -16,6 +16,9 @@ class FormatterFactory:
     Fábrica para criar formatadores de saída.
     Implementa o padrão Factory para criar instâncias de formatadores
     com base no formato solicitado.
+
+    As instâncias são reaproveitadas entre chamadas, por isso os formatadores
+    registrados devem ser stateless (toda configuração chega via ``options``).
     """
 
     # Mapeamento de nomes de formato para classes de formatador
@@ -27,6 +30,22 @@ class FormatterFactory:
         "htm": HTMLFormatter
     }
 
+    # Instâncias já criadas, por nome de formato
+    _instances: Dict[str, OutputFormatter] = {}
+
+    @staticmethod
+    def _normalize(format_name: str) -> str:
+        """
+        Normaliza um nome de formato para uso como chave de registro.
+
+        Args:
+            format_name: Nome do formato
+
+        Returns:
+            str: O nome sem espaços nas extremidades e em caixa baixa
+        """
+        return format_name.strip().casefold()
+
     @classmethod
     def get_formatter(cls, format_name: str) -> OutputFormatter:
         """
@@ -36,13 +55,21 @@ class FormatterFactory:
             format_name: Nome do formato (text, json, html, etc.)
 
         Returns:
-            OutputFormatter: Uma instância do formatador
+            OutputFormatter: A instância (compartilhada) do formatador
 
         Raises:
             UnsupportedFormatError: Se o formato não for suportado
         """
+        # Caminho rápido: nomes já normalizados são encontrados diretamente
+        formatter = cls._instances.get(format_name)
+        if formatter is not None:
+            return formatter
+
         # Normalizar o nome do formato
-        format_name = format_name.lower().strip()
+        format_name = cls._normalize(format_name)
+        formatter = cls._instances.get(format_name)
+        if formatter is not None:
+            return formatter
 
         # Obter a classe do formatador
         formatter_class = cls._formatters.get(format_name)
@@ -51,8 +78,8 @@ class FormatterFactory:
             logger.warning(f"Formato não suportado: {format_name}")
             raise UnsupportedFormatError(f"Formato não suportado: {format_name}")
 
-        # Criar e retornar uma instância do formatador
-        return formatter_class()
+        # Criar e armazenar a instância do formatador
+        return cls._instances.setdefault(format_name, formatter_class())
 
     @classmethod
     def register_formatter(cls, format_name: str, formatter_class: Type[OutputFormatter]) -> None:
@@ -63,15 +90,33 @@ class FormatterFactory:
             format_name: Nome do formato
             formatter_class: Classe do formatador
         """
-        cls._formatters[format_name.lower().strip()] = formatter_class
+        format_name = cls._normalize(format_name)
+        cls._formatters[format_name] = formatter_class
+        cls._instances.pop(format_name, None)
         logger.info(f"Formatador registrado para o formato: {format_name}")
 
     @classmethod
-    def get_supported_formats(cls) -> list[str]:
+    def supports_streaming(cls, format_name: str) -> bool:
+        """
+        Verifica se o formatador de um formato formata falas a partir de um iterador.
+
+        Args:
+            format_name: Nome do formato
+
+        Returns:
+            bool: True se o formatador implementa format_stream sem materializar as falas
+
+        Raises:
+            UnsupportedFormatError: Se o formato não for suportado
+        """
+        return cls.get_formatter(format_name).supports_streaming
+
+    @classmethod
+    def get_supported_formats(cls) -> Tuple[str, ...]:
         """
-        Obtém a lista de formatos suportados.
+        Obtém os formatos suportados.
 
         Returns:
-            list[str]: Lista de nomes de formatos suportados
+            Tuple[str, ...]: Nomes de formatos suportados
         """
-        return list(cls._formatters.keys())
+        return tuple(cls._formatters)
@@ -1,13 +1,44 @@
+import io
 import html
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from string import Template
+from typing import Dict, Any, Optional, Tuple, TextIO
 
 from src.interfaces.output_formatter import OutputFormatter
-from src.models.transcription_result import TranscriptionResult
+from src.formatters.timestamp import format_timestamp
+from src.models.transcription_result import TranscriptionResult, Utterance
 from src.utils.logging import get_logger
 
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+_escape = html.escape
+
+# Modelos das partes fixas do documento ({title} e {prefix} são substituídos na formatação)
+_HTML_HEADER_TMPL = """<!DOCTYPE html>
+<html>
+<head>
+<title>{title}</title>
+<meta charset="utf-8">
+<style>"""
+
+_HTML_BODY_TMPL = """</style>
+</head>
+<body>
+<div class="{prefix}-container">
+<div class="{prefix}-header">
+<h1>{title}</h1>
+</div>"""
+
+_HTML_METADATA_TMPL = """<div class="{prefix}-metadata">
+<p>Arquivo de áudio: {audio_file}</p>
+</div>"""
+
+_HTML_FOOTER = """</div>
+</div>
+</body>
+</html>"""
+
 
 class HTMLFormatter(OutputFormatter):
     """
@@ -15,25 +46,50 @@ class HTMLFormatter(OutputFormatter):
     Implementa a interface OutputFormatter para formatar resultados de transcrição como HTML.
     """
     
+    # Regras CSS base (${p} é substituído pelo prefixo das classes)
+    _CSS_TEMPLATE = Template("""\
+.${p}-container { max-width: 800px; margin: 0 auto; font-family: Arial, sans-serif; }
+.${p}-header { margin-bottom: 20px; }
+.${p}-metadata { color: #666; font-size: 0.9em; margin-bottom: 20px; }
+.${p}-utterance { margin-bottom: 10px; }
+.${p}-speaker { font-weight: bold; }
+.${p}-timestamp { color: #888; font-size: 0.8em; margin-right: 10px; }
+.${p}-text { }""")
+    
     def format(self, transcription: TranscriptionResult, options: Optional[Dict[str, Any]] = None) -> str:
         """
         Formata um resultado de transcrição como HTML.
         
         Args:
             transcription: O resultado da transcrição a ser formatado
+            options: Opções de formatação (opcional); ver format_to_stream
+                
+        Returns:
+            str: O resultado formatado como HTML
+        """
+        buf = io.StringIO()
+        self.format_to_stream(transcription, buf, options)
+        return buf.getvalue()
+    
+    def format_to_stream(self, transcription: TranscriptionResult, fp: TextIO,
+                         options: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Formata um resultado de transcrição como HTML, escrevendo diretamente no stream.
+        
+        Args:
+            transcription: O resultado da transcrição a ser formatado
+            fp: Stream de texto onde o HTML será escrito
             options: Opções de formatação (opcional)
                 - title: Título da página HTML (padrão: "Transcrição")
                 - include_timestamps: Se True, inclui timestamps no início de cada fala (padrão: True)
                 - include_metadata: Se True, inclui metadados como o arquivo de áudio (padrão: True)
                 - css_class_prefix: Prefixo para as classes CSS (padrão: "transcription")
                 - speaker_colors: Dicionário mapeando falantes para cores CSS (padrão: None)
-                
-        Returns:
-            str: O resultado formatado como HTML
         """
         if not transcription or not transcription.utterances:
             logger.warning("Tentativa de formatar uma transcrição vazia ou nula")
-            return "<html><body><p>Nenhuma transcrição disponível.</p></body></html>"
+            fp.write("<html><body><p>Nenhuma transcrição disponível.</p></body></html>")
+            return
             
         # Configurações padrão
         title = "Transcrição"
@@ -51,78 +107,99 @@ class HTMLFormatter(OutputFormatter):
             speaker_colors = options.get("speaker_colors", speaker_colors)
         
         # Escapar o título para evitar injeção de HTML
-        title_safe = html.escape(title)
-        
-        # Iniciar o documento HTML
-        result = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
-            f"<title>{title_safe}</title>",
-            "<meta charset=\"utf-8\">",
-            "<style>",
-            f".{css_class_prefix}-container {{ max-width: 800px; margin: 0 auto; font-family: Arial, sans-serif; }}",
-            f".{css_class_prefix}-header {{ margin-bottom: 20px; }}",
-            f".{css_class_prefix}-metadata {{ color: #666; font-size: 0.9em; margin-bottom: 20px; }}",
-            f".{css_class_prefix}-utterance {{ margin-bottom: 10px; }}",
-            f".{css_class_prefix}-speaker {{ font-weight: bold; }}",
-            f".{css_class_prefix}-timestamp {{ color: #888; font-size: 0.8em; margin-right: 10px; }}",
-            f".{css_class_prefix}-text {{ }}",
-        ]
-        
-        # Adicionar estilos específicos para cada falante, se fornecidos
-        for speaker, color in speaker_colors.items():
-            speaker_safe = html.escape(speaker).replace(" ", "_")
-            result.append(f".{css_class_prefix}-speaker-{speaker_safe} {{ color: {color}; }}")
+        title_safe = _escape(title)
+        
+        # Escrever o documento diretamente no stream, sem lista intermediária
+        write = fp.write
+        
+        # Cabeçalho e estilos (base e específicos de cada falante) do documento
+        write(_HTML_HEADER_TMPL.format(title=title_safe))
+        write("\n")
+        write(self._render_css(css_class_prefix, tuple(speaker_colors.items())))
+        write("\n")
         
         # Finalizar a seção de estilos e iniciar o corpo
-        result.extend([
-            "</style>",
-            "</head>",
-            "<body>",
-            f"<div class=\"{css_class_prefix}-container\">",
-            f"<div class=\"{css_class_prefix}-header\">",
-            f"<h1>{title_safe}</h1>",
-            "</div>"
-        ])
+        write(_HTML_BODY_TMPL.format(title=title_safe, prefix=css_class_prefix))
+        write("\n")
         
         # Adicionar metadados, se solicitado
         if include_metadata and transcription.audio_file:
-            audio_file_safe = html.escape(transcription.audio_file)
-            result.append(f"<div class=\"{css_class_prefix}-metadata\">")
-            result.append(f"<p>Arquivo de áudio: {audio_file_safe}</p>")
-            result.append("</div>")
+            write(_HTML_METADATA_TMPL.format(
+                audio_file=_escape(transcription.audio_file),
+                prefix=css_class_prefix
+            ))
+            write("\n")
         
         # Adicionar as falas
-        result.append(f"<div class=\"{css_class_prefix}-content\">")
+        write(f"<div class=\"{css_class_prefix}-content\">\n")
         
+        # Escapar cada falante distinto e montar suas classes CSS uma única vez
+        speaker_cache = {}
+        for speaker in {utterance.speaker for utterance in transcription.utterances}:
+            speaker_safe = _escape(speaker)
+            speaker_cache[speaker] = (
+                speaker_safe,
+                f"{css_class_prefix}-speaker {css_class_prefix}-speaker-{speaker_safe.replace(' ', '_')}"
+            )
+        fmt_utt = self._fmt_utt
         for utterance in transcription.utterances:
-            speaker_safe = html.escape(utterance.speaker)
-            speaker_class = f"{css_class_prefix}-speaker-{speaker_safe.replace(' ', '_')}"
-            text_safe = html.escape(utterance.text)
-            
-            result.append(f"<div class=\"{css_class_prefix}-utterance\">")
+            write(fmt_utt(utterance, css_class_prefix, include_timestamps, speaker_cache))
+            write("\n")
+        
+        # Finalizar o documento HTML
+        write(_HTML_FOOTER)
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _render_css(prefix: str, speaker_colors: Tuple[Tuple[str, str], ...]) -> str:
+        """
+        Gera as regras CSS do documento para um prefixo e um conjunto de cores de falantes.
+        
+        O resultado é memorizado, pois o prefixo e as cores costumam se repetir entre chamadas.
+        
+        Args:
+            prefix: Prefixo para as classes CSS
+            speaker_colors: Pares (falante, cor), na ordem em que foram informados
             
-            # Adicionar timestamp, se solicitado
-            if include_timestamps and utterance.start is not None:
-                minutes = int(utterance.start / 60)
-                seconds = int(utterance.start % 60)
-                result.append(f"<span class=\"{css_class_prefix}-timestamp\">[{minutes:02d}:{seconds:02d}]</span>")
+        Returns:
+            str: As regras CSS, uma por linha
+        """
+        rules = [HTMLFormatter._CSS_TEMPLATE.substitute(p=prefix)]
+        rules.extend(
+            f".{prefix}-speaker-{_escape(speaker).replace(' ', '_')} {{ color: {color}; }}"
+            for speaker, color in speaker_colors
+        )
+        return "\n".join(rules)
+    
+    @staticmethod
+    def _fmt_utt(utterance: Utterance, prefix: str, include_timestamps: bool,
+                 speaker_cache: Dict[str, Tuple[str, str]]) -> str:
+        """
+        Formata uma única fala como um bloco HTML.
+        
+        Args:
+            utterance: A fala a ser formatada
+            prefix: Prefixo para as classes CSS
+            include_timestamps: Se True, inclui o timestamp da fala
+            speaker_cache: Mapeamento do falante para seu nome escapado e suas classes CSS
             
-            # Adicionar falante e texto
-            result.append(f"<span class=\"{css_class_prefix}-speaker {speaker_class}\">{speaker_safe}:</span> ")
-            result.append(f"<span class=\"{css_class_prefix}-text\">{text_safe}</span>")
-            result.append("</div>")
+        Returns:
+            str: O bloco HTML da fala
+        """
+        speaker_safe, speaker_class = speaker_cache[utterance.speaker]
         
-        # Finalizar o documento HTML
-        result.extend([
-            "</div>",
-            "</div>",
-            "</body>",
-            "</html>"
-        ])
-        
-        return "\n".join(result)
+        # Adicionar timestamp, se solicitado
+        timestamp = ""
+        if include_timestamps and utterance.start is not None:
+            timestamp = f"<span class=\"{prefix}-timestamp\">[{format_timestamp(utterance.start)}]</span>\n"
+        
+        return (
+            f"<div class=\"{prefix}-utterance\">\n"
+            f"{timestamp}"
+            f"<span class=\"{speaker_class}\">{speaker_safe}:</span> \n"
+            f"<span class=\"{prefix}-text\">{_escape(utterance.text)}</span>\n"
+            f"</div>"
+        )
     
     def get_file_extension(self) -> str:
         """
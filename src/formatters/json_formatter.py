@@ -1,6 +1,6 @@
 import json
-from typing import Dict, Any, Optional, List
-from dataclasses import asdict
+import operator
+from typing import Dict, Any, Optional, Tuple, TextIO, Iterable, Iterator
 
 from src.interfaces.output_formatter import OutputFormatter
 from src.models.transcription_result import TranscriptionResult, Utterance
@@ -9,6 +9,109 @@ from src.utils.logging import get_logger
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# Campos serializados de cada fala, lidos de uma vez por um attrgetter (implementado em C)
+_UTT_KEYS = ("speaker", "text", "start", "end")
+_get_utt = operator.attrgetter(*_UTT_KEYS)
+
+# orjson é opcional: quando disponível, é usado no lugar do encoder padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any], pretty: bool) -> str:
+    """
+    Serializa um dicionário como JSON, usando orjson no modo indentado quando disponível.
+
+    O JSON compacto sempre usa o encoder padrão: o orjson não põe espaço após ``,`` e ``:``,
+    e a saída do formatador não pode depender de pacotes opcionais.
+
+    Args:
+        data: O dicionário a ser serializado
+        pretty: Se True, indenta o JSON com 2 espaços
+
+    Returns:
+        str: O JSON gerado
+    """
+    if pretty and orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2 if pretty else None, ensure_ascii=False)
+
+
+def _partial_utterance_dict(values: Tuple[Any, ...]) -> Dict[str, Any]:
+    """
+    Converte os atributos de uma fala sem algum dos timestamps em dicionário.
+
+    Args:
+        values: Tupla (speaker, text, start, end) obtida com ``_get_utt``
+
+    Returns:
+        Dict[str, Any]: O dicionário da fala, sem os timestamps ausentes
+    """
+    speaker, text, start, end = values
+    utterance_dict = {"speaker": speaker, "text": text}
+    if start is not None:
+        utterance_dict["start"] = start
+    if end is not None:
+        utterance_dict["end"] = end
+    return utterance_dict
+
+
+def _utterance_dicts(utterances: Iterable[Utterance]) -> Iterator[Dict[str, Any]]:
+    """
+    Converte as falas em dicionários, omitindo os timestamps ausentes.
+
+    Args:
+        utterances: Iterável com as falas da transcrição
+
+    Returns:
+        Iterator[Dict[str, Any]]: Os dicionários das falas, gerados sob demanda
+    """
+    return (
+        dict(zip(_UTT_KEYS, values))
+        if values[2] is not None and values[3] is not None
+        else _partial_utterance_dict(values)
+        for values in map(_get_utt, utterances)
+    )
+
+
+def _iter_json(head: Dict[str, Any], utterance_dicts: Iterable[Dict[str, Any]], pretty: bool) -> Iterator[str]:
+    """
+    Gera em partes o JSON de ``{**head, "utterances": [...]}``, uma fala por vez.
+
+    O resultado é idêntico ao de ``_dumps`` sobre o documento completo, mas a lista
+    de falas nunca é materializada.
+
+    Args:
+        head: Campos do documento que precedem as falas
+        utterance_dicts: Iterável com os dicionários das falas
+        pretty: Se True, indenta o JSON com 2 espaços
+
+    Returns:
+        Iterator[str]: Partes do JSON, na ordem
+    """
+    # O esqueleto termina com a lista de falas vazia ("[]"), que é preenchida no meio
+    skeleton = _dumps({**head, "utterances": []}, pretty)
+    split = skeleton.rindex("[]") + 1
+    yield skeleton[:split]
+
+    if pretty:
+        separator = "\n    "
+        for utterance_dict in utterance_dicts:
+            yield separator + _dumps(utterance_dict, True).replace("\n", "\n    ")
+            separator = ",\n    "
+        if separator != "\n    ":
+            yield "\n  "
+    else:
+        # No JSON compacto, o encoder padrão separa os itens com ", "
+        separator = ""
+        for utterance_dict in utterance_dicts:
+            yield separator + _dumps(utterance_dict, False)
+            separator = ", "
+
+    yield skeleton[split:]
+
 
 class JSONFormatter(OutputFormatter):
     """
@@ -16,6 +119,8 @@ class JSONFormatter(OutputFormatter):
     Implementa a interface OutputFormatter para formatar resultados de transcrição como JSON.
     """
     
+    supports_streaming = True
+    
     def format(self, transcription: TranscriptionResult, options: Optional[Dict[str, Any]] = None) -> str:
         """
         Formata um resultado de transcrição como JSON.
@@ -33,7 +138,104 @@ class JSONFormatter(OutputFormatter):
         if not transcription:
             logger.warning("Tentativa de formatar uma transcrição nula")
             return "{}"
+        
+        result_dict, pretty_print = self._build_result(transcription, options)
+        return _dumps(result_dict, pretty_print)
+    
+    def format_to_stream(self, transcription: TranscriptionResult, fp: TextIO,
+                         options: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Formata um resultado de transcrição como JSON, escrevendo diretamente no stream.
+        
+        Sem orjson, o JSON é escrito em partes por ``json.dump``, sem montar o documento
+        inteiro em memória; com orjson, o documento é serializado de uma vez (mais rápido).
+        
+        Args:
+            transcription: O resultado da transcrição a ser formatado
+            fp: Stream de texto onde o JSON será escrito
+            options: Opções de formatação (opcional); ver format
+        """
+        if not transcription:
+            logger.warning("Tentativa de formatar uma transcrição nula")
+            fp.write("{}")
+            return
+        
+        result_dict, pretty_print = self._build_result(transcription, options)
+        if orjson is not None:
+            fp.write(_dumps(result_dict, pretty_print))
+        else:
+            json.dump(result_dict, fp, indent=2 if pretty_print else None, ensure_ascii=False)
+    
+    def format_stream(self, utterances: Iterable[Utterance], text: str, audio_file: str,
+                      options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Formata como JSON as falas de um iterável, percorrendo-o uma única vez.
+        
+        Cada fala é serializada separadamente, de modo que nem as falas nem os seus
+        dicionários são mantidos todos em memória ao mesmo tempo.
+        
+        Args:
+            utterances: Iterável com as falas da transcrição
+            text: Texto completo da transcrição
+            audio_file: Caminho do arquivo de áudio
+            options: Opções de formatação (opcional); ver format
             
+        Returns:
+            str: O resultado formatado como JSON
+        """
+        return "".join(self.format_stream_parts(utterances, text, audio_file, options))
+    
+    def format_stream_parts(self, utterances: Iterable[Utterance], text: str, audio_file: str,
+                            options: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Gera em partes o JSON das falas de um iterável, uma fala por vez.
+        
+        Args:
+            utterances: Iterável com as falas da transcrição
+            text: Texto completo da transcrição
+            audio_file: Caminho do arquivo de áudio
+            options: Opções de formatação (opcional); ver format
+            
+        Returns:
+            Iterator[str]: Partes do JSON, na ordem
+        """
+        head, pretty_print = self._build_head(audio_file, text, options)
+        return _iter_json(head, _utterance_dicts(utterances), pretty_print)
+    
+    @classmethod
+    def _build_result(cls, transcription: TranscriptionResult,
+                      options: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+        """
+        Monta o dicionário a ser serializado como JSON.
+        
+        Args:
+            transcription: O resultado da transcrição a ser formatado
+            options: Opções de formatação (opcional); ver format
+            
+        Returns:
+            Tuple[Dict[str, Any], bool]: O dicionário e se o JSON deve ser indentado
+        """
+        result_dict, pretty_print = cls._build_head(transcription.audio_file, transcription.text, options)
+        
+        # Adicionar falas
+        result_dict["utterances"] = list(_utterance_dicts(transcription.utterances))
+        
+        return result_dict, pretty_print
+    
+    @staticmethod
+    def _build_head(audio_file: str, text: str,
+                    options: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+        """
+        Monta os campos do JSON que precedem as falas.
+        
+        Args:
+            audio_file: Caminho do arquivo de áudio
+            text: Texto completo da transcrição
+            options: Opções de formatação (opcional); ver format
+            
+        Returns:
+            Tuple[Dict[str, Any], bool]: O dicionário e se o JSON deve ser indentado
+        """
         # Configurações padrão
         pretty_print = True
         include_metadata = True
@@ -51,35 +253,14 @@ class JSONFormatter(OutputFormatter):
         # Adicionar metadados, se solicitado
         if include_metadata:
             result_dict["metadata"] = {
-                "audio_file": transcription.audio_file
+                "audio_file": audio_file
             }
         
         # Adicionar texto completo, se solicitado
         if include_full_text:
-            result_dict["text"] = transcription.text
-        
-        # Adicionar falas
-        utterances_list: List[Dict[str, Any]] = []
-        
-        for utterance in transcription.utterances:
-            utterance_dict = {
-                "speaker": utterance.speaker,
-                "text": utterance.text
-            }
-            
-            # Adicionar timestamps, se disponíveis
-            if utterance.start is not None:
-                utterance_dict["start"] = utterance.start
-            if utterance.end is not None:
-                utterance_dict["end"] = utterance.end
-                
-            utterances_list.append(utterance_dict)
-        
-        result_dict["utterances"] = utterances_list
+            result_dict["text"] = text
         
-        # Converter para JSON
-        indent = 2 if pretty_print else None
-        return json.dumps(result_dict, indent=indent, ensure_ascii=False)
+        return result_dict, pretty_print
     
     def get_file_extension(self) -> str:
         """
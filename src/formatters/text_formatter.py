@@ -1,7 +1,8 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterable, Iterator
 
 from src.interfaces.output_formatter import OutputFormatter
-from src.models.transcription_result import TranscriptionResult
+from src.formatters.timestamp import format_timestamp
+from src.models.transcription_result import TranscriptionResult, Utterance
 from src.utils.logging import get_logger
 
 # Initialize logger for this module
@@ -14,6 +15,8 @@ class TextFormatter(OutputFormatter):
     Implementa a interface OutputFormatter para formatar resultados de transcrição como texto simples.
     """
     
+    supports_streaming = True
+    
     def format(self, transcription: TranscriptionResult, options: Optional[Dict[str, Any]] = None) -> str:
         """
         Formata um resultado de transcrição como texto simples.
@@ -31,7 +34,70 @@ class TextFormatter(OutputFormatter):
         if not transcription or not transcription.utterances:
             logger.warning("Tentativa de formatar uma transcrição vazia ou nula")
             return ""
+        
+        return self._format_utterances(transcription.utterances, options)
+    
+    def format_stream(self, utterances: Iterable[Utterance], text: str, audio_file: str,
+                      options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Formata como texto simples as falas de um iterável, percorrendo-o uma única vez.
+        
+        Args:
+            utterances: Iterável com as falas da transcrição
+            text: Texto completo da transcrição (não utilizado)
+            audio_file: Caminho do arquivo de áudio (não utilizado)
+            options: Opções de formatação (opcional); ver format
             
+        Returns:
+            str: O resultado formatado como texto simples
+        """
+        return self._format_utterances(utterances, options)
+    
+    def format_stream_parts(self, utterances: Iterable[Utterance], text: str, audio_file: str,
+                            options: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Gera o texto das falas de um iterável, uma linha por fala.
+        
+        Args:
+            utterances: Iterável com as falas da transcrição
+            text: Texto completo da transcrição (não utilizado)
+            audio_file: Caminho do arquivo de áudio (não utilizado)
+            options: Opções de formatação (opcional); ver format
+            
+        Returns:
+            Iterator[str]: As linhas, separadas por quebras de linha como em format_stream
+        """
+        separator = ""
+        for line in self._iter_lines(utterances, options):
+            yield separator + line
+            separator = "\n"
+    
+    @classmethod
+    def _format_utterances(cls, utterances: Iterable[Utterance], options: Optional[Dict[str, Any]]) -> str:
+        """
+        Monta o texto das falas, uma por linha.
+        
+        Args:
+            utterances: Iterável com as falas da transcrição
+            options: Opções de formatação (opcional); ver format
+            
+        Returns:
+            str: As falas formatadas
+        """
+        return "\n".join(cls._iter_lines(utterances, options))
+    
+    @staticmethod
+    def _iter_lines(utterances: Iterable[Utterance], options: Optional[Dict[str, Any]]) -> Iterator[str]:
+        """
+        Gera a linha de texto de cada fala.
+        
+        Args:
+            utterances: Iterável com as falas da transcrição
+            options: Opções de formatação (opcional); ver format
+            
+        Returns:
+            Iterator[str]: As linhas, sem quebra de linha
+        """
         # Configurações padrão
         include_timestamps = False
         speaker_prefix = ""
@@ -43,22 +109,19 @@ class TextFormatter(OutputFormatter):
             speaker_prefix = options.get("speaker_prefix", speaker_prefix)
             speaker_suffix = options.get("speaker_suffix", speaker_suffix)
         
-        result = []
-        
-        for utterance in transcription.utterances:
-            line = ""
-            
-            # Adicionar timestamp, se solicitado
-            if include_timestamps and utterance.start is not None:
-                minutes = int(utterance.start / 60)
-                seconds = int(utterance.start % 60)
-                line += f"[{minutes:02d}:{seconds:02d}] "
-            
-            # Adicionar falante e texto
-            line += f"{speaker_prefix}{utterance.speaker}{speaker_suffix}{utterance.text}"
-            result.append(line)
+        # Montar cada linha com uma única f-string
+        if include_timestamps:
+            return (
+                f"[{format_timestamp(utterance.start)}] {speaker_prefix}{utterance.speaker}{speaker_suffix}{utterance.text}"
+                if utterance.start is not None
+                else f"{speaker_prefix}{utterance.speaker}{speaker_suffix}{utterance.text}"
+                for utterance in utterances
+            )
         
-        return "\n".join(result)
+        return (
+            f"{speaker_prefix}{utterance.speaker}{speaker_suffix}{utterance.text}"
+            for utterance in utterances
+        )
     
     def get_file_extension(self) -> str:
         """
@@ -0,0 +1,21 @@
+# Representações "00".."59" pré-calculadas para evitar formatação por fala
+_PAD = tuple(f"{i:02d}" for i in range(60))
+
+
+def format_timestamp(start: float) -> str:
+    """
+    Formata um instante em segundos como "MM:SS".
+
+    Minutos acima de 59 não são convertidos em horas (por exemplo, "75:03") e instantes
+    negativos são tratados como zero.
+
+    Args:
+        start: Instante em segundos
+
+    Returns:
+        str: O timestamp formatado
+    """
+    minutes, seconds = divmod(max(int(start), 0), 60)
+    if minutes < 60:
+        return f"{_PAD[minutes]}:{_PAD[seconds]}"
+    return f"{minutes:02d}:{seconds:02d}"
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Optional, Mapping
 
 
 class ConfigProvider(ABC):
@@ -32,4 +32,17 @@ class ConfigProvider(ABC):
             key: The configuration key
             value: The configuration value
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def update(self, values: Mapping[str, Any]) -> None:
+        """
+        Set several configuration values at once.
+        
+        The default implementation calls set() for each item; providers
+        that can apply the values in bulk should override it.
+        
+        Args:
+            values: Mapping of configuration keys to values
+        """
+        for key, value in values.items():
+            self.set(key, value)
@@ -1,7 +1,13 @@
+import os
+import stat
+import tempfile
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TextIO, Iterable
 
-from src.models.transcription_result import TranscriptionResult
+from src.models.transcription_result import TranscriptionResult, Utterance
+
+# Tamanho do buffer de escrita usado por format_to_file
+FILE_BUFFER_SIZE = 1 << 16
 
 
 class OutputFormatter(ABC):
@@ -12,6 +18,9 @@ class OutputFormatter(ABC):
     os resultados de transcrição de diferentes maneiras.
     """
     
+    # Indica se format_stream percorre as falas uma única vez, sem materializá-las
+    supports_streaming = False
+    
     @abstractmethod
     def format(self, transcription: TranscriptionResult, options: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -34,4 +43,134 @@ class OutputFormatter(ABC):
         Returns:
             str: A extensão de arquivo (sem o ponto)
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def format_stream(self, utterances: Iterable[Utterance], text: str, audio_file: str,
+                      options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Formata falas fornecidas por um iterável, sem exigir um TranscriptionResult.
+        
+        A implementação padrão materializa as falas em um TranscriptionResult e chama
+        format(); formatadores com ``supports_streaming`` percorrem o iterável uma
+        única vez, sem manter todas as falas em memória.
+        
+        Args:
+            utterances: Iterável com as falas da transcrição
+            text: Texto completo da transcrição
+            audio_file: Caminho do arquivo de áudio
+            options: Opções de formatação específicas para este formatador
+            
+        Returns:
+            str: O resultado formatado
+        """
+        transcription = TranscriptionResult(utterances=list(utterances), text=text, audio_file=audio_file)
+        return self.format(transcription, options)
+    
+    def format_stream_parts(self, utterances: Iterable[Utterance], text: str, audio_file: str,
+                            options: Optional[Dict[str, Any]] = None) -> Iterable[str]:
+        """
+        Formata falas fornecidas por um iterável, gerando o resultado em partes.
+        
+        A concatenação das partes é igual ao resultado de format_stream(). A implementação
+        padrão produz uma única parte; formatadores com ``supports_streaming`` geram o
+        resultado à medida que percorrem as falas.
+        
+        Args:
+            utterances: Iterável com as falas da transcrição
+            text: Texto completo da transcrição
+            audio_file: Caminho do arquivo de áudio
+            options: Opções de formatação específicas para este formatador
+            
+        Returns:
+            Iterable[str]: Partes do resultado formatado, na ordem
+        """
+        return (self.format_stream(utterances, text, audio_file, options),)
+    
+    def format_stream_to_file(self, utterances: Iterable[Utterance], text: str, audio_file: str,
+                              output_file: str, options: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Formata falas fornecidas por um iterável diretamente em um arquivo (UTF-8).
+        
+        As partes de format_stream_parts() são escritas à medida que são geradas, sem
+        montar o documento inteiro em memória.
+        
+        Args:
+            utterances: Iterável com as falas da transcrição
+            text: Texto completo da transcrição
+            audio_file: Caminho do arquivo de áudio
+            output_file: Caminho do arquivo de saída
+            options: Opções de formatação específicas para este formatador
+        """
+        with open(output_file, 'w', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as f:
+            f.writelines(self.format_stream_parts(utterances, text, audio_file, options))
+    
+    def format_to_stream(self, transcription: TranscriptionResult, fp: TextIO,
+                         options: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Formata um resultado de transcrição escrevendo diretamente em um stream de texto.
+        
+        A implementação padrão escreve o resultado de format(); formatadores que
+        produzem documentos grandes podem sobrescrevê-la para escrever em partes,
+        sem montar o documento inteiro em memória.
+        
+        Args:
+            transcription: O resultado da transcrição a ser formatado
+            fp: Stream de texto onde o resultado será escrito
+            options: Opções de formatação específicas para este formatador
+        """
+        fp.write(self.format(transcription, options))
+    
+    def format_to_file(self, transcription: TranscriptionResult, output_file: str,
+                       options: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Formata um resultado de transcrição diretamente em um arquivo (UTF-8).
+        
+        A saída é escrita em um arquivo temporário no mesmo diretório, que só substitui
+        o arquivo de destino (via ``os.replace``) quando a formatação termina sem erros.
+        Assim, uma falha na formatação não deixa um arquivo parcial no lugar do existente.
+        
+        Args:
+            transcription: O resultado da transcrição a ser formatado
+            output_file: Caminho do arquivo de saída
+            options: Opções de formatação específicas para este formatador
+        """
+        output_dir = os.path.dirname(os.path.abspath(output_file))
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', buffering=FILE_BUFFER_SIZE, dir=output_dir,
+            prefix=f".{os.path.basename(output_file)}.", suffix=".tmp", delete=False
+        ) as f:
+            temp_path = f.name
+            try:
+                self.format_to_stream(transcription, f, options)
+            except BaseException:
+                f.close()
+                os.unlink(temp_path)
+                raise
+
+        try:
+            os.chmod(temp_path, _output_file_mode(output_file))
+            os.replace(temp_path, output_file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def _output_file_mode(output_file: str) -> int:
+    """
+    Retorna as permissões que o arquivo de saída teria se fosse escrito com ``open``.
+
+    O arquivo temporário é criado com permissões restritas (0600); para não alterá-las,
+    são mantidas as do arquivo existente ou, para um arquivo novo, as padrão (0666 sem a umask).
+
+    Args:
+        output_file: Caminho do arquivo de saída
+
+    Returns:
+        int: Permissões a aplicar ao arquivo temporário antes de substituir o destino
+    """
+    try:
+        return stat.S_IMODE(os.stat(output_file).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
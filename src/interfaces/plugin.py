@@ -1,5 +1,16 @@
+import os
+import sys
+import threading
+import importlib.util
+from collections import defaultdict
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Type, Optional
+from typing import Dict, Any, List, Type, Optional, FrozenSet
+
+from src.utils.logging import get_logger
+
+# Initialize logger for this module
+logger = get_logger(__name__)
+
 
 class Plugin(ABC):
     """
@@ -67,6 +78,8 @@ class Plugin(ABC):
         - "text_generation_service": Para serviços de geração de texto
         - "output_formatter": Para formatadores de saída
         
+        Outros nomes também são aceitos e definem novos pontos de extensão.
+        
         Returns:
             List[str]: Lista de pontos de extensão implementados por este plugin
         """
@@ -92,23 +105,59 @@ class PluginRegistry:
     
     Esta classe é responsável por descobrir, registrar e gerenciar plugins.
     Segue o padrão Singleton para garantir um único registro de plugins em toda a aplicação.
+    
+    As operações que alteram o registro são protegidas por um único ``RLock``, de modo
+    que o registro pode ser usado a partir de várias threads (por exemplo, pelos
+    serviços FastAPI). As leituras retornam cópias e não adquirem o lock.
     """
     
     _instance = None
+    _instance_lock = threading.Lock()
     
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(PluginRegistry, cls).__new__(cls)
-            cls._instance._plugins = {}
-            cls._instance._extension_points = {
-                "audio_converter": [],
-                "transcription_service": [],
-                "text_generation_service": [],
-                "output_formatter": []
-            }
-            cls._instance._initialized = False
+        if cls._instance is not None:
+            return cls._instance
+        
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls._create_instance()
         return cls._instance
     
+    @classmethod
+    def _create_instance(cls) -> "PluginRegistry":
+        """
+        Cria e inicializa a instância única do registro.
+        
+        Returns:
+            PluginRegistry: A nova instância
+        """
+        instance = super(PluginRegistry, cls).__new__(cls)
+        instance._lock = threading.RLock()
+        instance._plugins = {}
+        # Plugins de cada ponto de extensão, indexados pelo nome do plugin; os plugins
+        # podem declarar novos pontos de extensão sem alterações no registro
+        instance._extension_points = defaultdict(dict)
+        instance._initialized = False
+        instance._plugin_config = {}
+        instance._lazy_plugins = {}
+        instance._lazy_modules = {}
+        instance._active_points = set()
+        instance._rev = 0
+        instance._discovery_cache = {}
+        return instance
+    
+    @property
+    def revision(self) -> int:
+        """
+        Número de revisão do registro, incrementado sempre que plugins são
+        registrados ou inicializados. Permite que chamadores mantenham caches
+        de informações derivadas dos plugins.
+        
+        Returns:
+            int: A revisão atual do registro
+        """
+        return self._rev
+    
     def register_plugin(self, plugin: Plugin) -> bool:
         """
         Registra um plugin no sistema.
@@ -119,17 +168,100 @@ class PluginRegistry:
         Returns:
             bool: True se o registro foi bem-sucedido, False caso contrário
         """
-        if plugin.name in self._plugins:
-            return False
+        with self._lock:
+            if plugin.name in self._plugins:
+                return False
+            
+            self._plugins[plugin.name] = plugin
+            
+            # Registra o plugin em seus pontos de extensão
+            for ext_point in plugin.get_extension_points():
+                self._extension_points[ext_point][plugin.name] = plugin
+                self._active_points.add(ext_point)
+            
+            self._rev += 1
+            return True
+    
+    def register_lazy_plugin(self, metadata: Dict[str, Any], module_name: str, module_path: str) -> bool:
+        """
+        Registra um plugin a partir de seus metadados, adiando a importação do módulo.
         
-        self._plugins[plugin.name] = plugin
+        O módulo só é importado e o plugin instanciado quando ele é efetivamente
+        solicitado (por exemplo, via get_plugin ou get_plugins_for_extension_point).
+        
+        Args:
+            metadata: Metadados do plugin (class_name, name, version, description, extension_points)
+            module_name: Nome do módulo que define o plugin
+            module_path: Caminho do arquivo do módulo
+            
+        Returns:
+            bool: True se o registro foi bem-sucedido, False caso contrário
+        """
+        name = metadata["name"]
+        with self._lock:
+            if name in self._plugins or name in self._lazy_plugins:
+                return False
+            
+            self._lazy_plugins[name] = {
+                "module_name": module_name,
+                "module_path": module_path,
+                **metadata
+            }
+            self._active_points.update(metadata["extension_points"])
+            self._rev += 1
+            return True
+    
+    def _load_lazy_plugin(self, name: str) -> Optional[Plugin]:
+        """
+        Importa e instancia um plugin registrado de forma preguiçosa.
         
-        # Registra o plugin em seus pontos de extensão
-        for ext_point in plugin.get_extension_points():
-            if ext_point in self._extension_points:
-                self._extension_points[ext_point].append(plugin)
+        Se os plugins já foram inicializados, o plugin carregado é inicializado
+        com a configuração armazenada em initialize_plugins.
         
-        return True
+        Args:
+            name: Nome do plugin
+            
+        Returns:
+            Optional[Plugin]: O plugin carregado ou None se não puder ser carregado
+        """
+        with self._lock:
+            # A entrada só é removida após a carga, para que outras threads que a
+            # encontrem aguardem o lock em vez de concluir que o plugin não existe
+            entry = self._lazy_plugins.get(name)
+            if entry is None:
+                return self._plugins.get(name)
+            
+            try:
+                # Um mesmo módulo pode definir vários plugins; importa-o apenas uma vez
+                module = self._lazy_modules.get(entry["module_path"])
+                if module is None:
+                    module = self._import_module(entry["module_name"], entry["module_path"])
+                    self._lazy_modules[entry["module_path"]] = module
+                
+                plugin = getattr(module, entry["class_name"])()
+            except Exception:
+                logger.exception("Erro ao carregar plugin %s", name)
+                return None
+            finally:
+                del self._lazy_plugins[name]
+            
+            if not self.register_plugin(plugin):
+                return self._plugins.get(plugin.name)
+            
+            if self._initialized:
+                try:
+                    plugin.initialize(self._plugin_config.get(name, {}))
+                except Exception:
+                    logger.exception("Erro ao inicializar plugin %s", name)
+            
+            return plugin
+    
+    def _load_all_lazy_plugins(self) -> None:
+        """
+        Carrega todos os plugins registrados de forma preguiçosa.
+        """
+        for name in list(self._lazy_plugins):
+            self._load_lazy_plugin(name)
     
     def get_plugin(self, name: str) -> Optional[Plugin]:
         """
@@ -141,7 +273,10 @@ class PluginRegistry:
         Returns:
             Optional[Plugin]: O plugin solicitado ou None se não encontrado
         """
-        return self._plugins.get(name)
+        plugin = self._plugins.get(name)
+        if plugin is None and name in self._lazy_plugins:
+            plugin = self._load_lazy_plugin(name)
+        return plugin
     
     def get_plugins(self) -> List[Plugin]:
         """
@@ -150,6 +285,7 @@ class PluginRegistry:
         Returns:
             List[Plugin]: Lista de todos os plugins registrados
         """
+        self._load_all_lazy_plugins()
         return list(self._plugins.values())
     
     def get_plugins_for_extension_point(self, extension_point: str) -> List[Plugin]:
@@ -162,10 +298,46 @@ class PluginRegistry:
         Returns:
             List[Plugin]: Lista de plugins que implementam o ponto de extensão
         """
-        if extension_point not in self._extension_points:
+        for name, entry in list(self._lazy_plugins.items()):
+            if extension_point in entry["extension_points"]:
+                self._load_lazy_plugin(name)
+        
+        plugins = self._extension_points.get(extension_point)
+        if plugins is None:
             return []
         
-        return self._extension_points[extension_point]
+        return list(plugins.values())
+    
+    def get_plugin_for_extension_point(self, extension_point: str, plugin_name: str) -> Optional[Plugin]:
+        """
+        Obtém um plugin pelo nome, desde que ele implemente o ponto de extensão.
+        
+        Args:
+            extension_point: Nome do ponto de extensão
+            plugin_name: Nome do plugin
+            
+        Returns:
+            Optional[Plugin]: O plugin ou None se ele não implementar o ponto de extensão
+        """
+        if plugin_name in self._lazy_plugins:
+            self._load_lazy_plugin(plugin_name)
+        
+        plugins = self._extension_points.get(extension_point)
+        if plugins is None:
+            return None
+        
+        return plugins.get(plugin_name)
+    
+    def get_active_extension_points(self) -> FrozenSet[str]:
+        """
+        Retorna os pontos de extensão implementados por pelo menos um plugin registrado.
+        
+        Inclui os plugins registrados de forma preguiçosa, sem importá-los.
+        
+        Returns:
+            FrozenSet[str]: Nomes dos pontos de extensão com alguma implementação
+        """
+        return frozenset(self._active_points)
     
     def get_implementation(self, extension_point: str, plugin_name: str) -> Optional[Any]:
         """
@@ -178,26 +350,115 @@ class PluginRegistry:
         Returns:
             Optional[Any]: A implementação ou None se não encontrada
         """
-        plugin = self.get_plugin(plugin_name)
+        plugin = self.get_plugin_for_extension_point(extension_point, plugin_name)
         if not plugin:
             return None
         
         return plugin.get_implementation(extension_point)
     
+    @staticmethod
+    def _import_module(module_name: str, module_path: str) -> Any:
+        """
+        Importa um módulo a partir do caminho do arquivo.
+        
+        O módulo é registrado em ``sys.modules`` antes de ser executado, como faz o
+        sistema de importação, para que ferramentas de introspecção (``pickle``,
+        ``inspect``, ``dataclasses``) encontrem o módulo dos plugins. Um módulo já
+        carregado de outro arquivo com o mesmo nome nunca é substituído.
+        
+        Args:
+            module_name: Nome do módulo
+            module_path: Caminho do arquivo do módulo
+            
+        Returns:
+            Any: O módulo importado
+        """
+        # Adiciona o diretório do plugin ao path para permitir importações relativas a ele
+        plugin_dir = os.path.dirname(module_path)
+        if plugin_dir not in sys.path:
+            sys.path.append(plugin_dir)
+        
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        module = importlib.util.module_from_spec(spec)
+        
+        existing = sys.modules.get(module_name)
+        register = existing is None or getattr(existing, "__file__", None) == spec.origin
+        if register:
+            sys.modules[module_name] = module
+        
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            if register:
+                sys.modules.pop(module_name, None)
+            raise
+        return module
+    
+    def load_plugin_module(self, module_name: str, module_path: str) -> int:
+        """
+        Importa um módulo de plugin e registra os plugins definidos nele.
+        
+        Args:
+            module_name: Nome do módulo
+            module_path: Caminho do arquivo do módulo
+            
+        Returns:
+            int: Número de plugins registrados a partir do módulo
+        """
+        return len(self._load_plugin_module(module_name, module_path))
+    
+    def _load_plugin_module(self, module_name: str, module_path: str) -> List[str]:
+        """
+        Importa um módulo de plugin e registra os plugins definidos nele.
+        
+        Args:
+            module_name: Nome do módulo
+            module_path: Caminho do arquivo do módulo
+            
+        Returns:
+            List[str]: Nomes dos plugins registrados a partir do módulo
+        """
+        registered = []
+        
+        try:
+            # Carrega o módulo
+            module = self._import_module(module_name, module_path)
+            
+            # Procura por classes que herdam de Plugin definidas no próprio módulo,
+            # considerando apenas os nomes exportados (__all__) ou públicos
+            namespace = vars(module)
+            names = namespace.get("__all__") or [name for name in namespace if not name.startswith("_")]
+            for attr_name in names:
+                attr = namespace.get(attr_name)
+                if (isinstance(attr, type) and issubclass(attr, Plugin) and attr is not Plugin
+                        and attr.__module__ == module.__name__):
+                    try:
+                        # Instancia o plugin
+                        plugin = attr()
+                        if self.register_plugin(plugin):
+                            registered.append(plugin.name)
+                    except Exception:
+                        logger.exception("Erro ao instanciar plugin %s", attr_name)
+        
+        except Exception:
+            logger.exception("Erro ao carregar plugin %s", module_name)
+        
+        return registered
+    
     def discover_plugins(self, plugin_dir: str = "plugins") -> int:
         """
         Descobre e carrega plugins de um diretório.
         
+        Arquivos já processados cujo ``mtime`` não mudou e cujos plugins continuam
+        registrados não são importados novamente, de modo que descobertas repetidas
+        custam apenas uma chamada ``stat`` por arquivo.
+        
         Args:
             plugin_dir: Diretório onde procurar plugins
             
         Returns:
             int: Número de plugins descobertos e carregados
         """
-        import os
-        import importlib.util
-        import sys
-        
         count = 0
         
         # Garante que o diretório existe
@@ -208,32 +469,27 @@ class PluginRegistry:
         if plugin_dir not in sys.path:
             sys.path.append(plugin_dir)
         
-        # Procura por arquivos Python no diretório de plugins
-        for filename in os.listdir(plugin_dir):
-            if filename.endswith(".py") and not filename.startswith("__"):
-                module_name = filename[:-3]  # Remove a extensão .py
-                module_path = os.path.join(plugin_dir, filename)
-                
-                try:
-                    # Carrega o módulo
-                    spec = importlib.util.spec_from_file_location(module_name, module_path)
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
+        # A varredura é serializada para que cada módulo seja importado uma única vez
+        with self._lock:
+            # Procura por arquivos Python no diretório de plugins
+            with os.scandir(plugin_dir) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if not filename.endswith(".py") or filename.startswith("__"):
+                        continue
                     
-                    # Procura por classes que herdam de Plugin
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if isinstance(attr, type) and issubclass(attr, Plugin) and attr != Plugin:
-                            try:
-                                # Instancia o plugin
-                                plugin = attr()
-                                if self.register_plugin(plugin):
-                                    count += 1
-                            except Exception as e:
-                                print(f"Erro ao instanciar plugin {attr_name}: {e}")
-                
-                except Exception as e:
-                    print(f"Erro ao carregar plugin {module_name}: {e}")
+                    module_path = os.path.join(plugin_dir, filename)
+                    mtime = entry.stat().st_mtime_ns
+                    
+                    # Pula arquivos inalterados cujos plugins já estão registrados
+                    cached = self._discovery_cache.get(module_path)
+                    if cached is not None and cached[0] == mtime and all(name in self._plugins for name in cached[1]):
+                        continue
+                    
+                    module_name = filename[:-3]  # Remove a extensão .py
+                    registered = self._load_plugin_module(module_name, module_path)
+                    self._discovery_cache[module_path] = (mtime, registered)
+                    count += len(registered)
         
         return count
     
@@ -243,20 +499,26 @@ class PluginRegistry:
         
         Args:
             config: Dicionário mapeando nomes de plugins para suas configurações
-            
+        
         Returns:
             Dict[str, bool]: Dicionário mapeando nomes de plugins para status de inicialização
         """
         results = {}
         
-        for name, plugin in self._plugins.items():
-            plugin_config = config.get(name, {})
-            try:
-                success = plugin.initialize(plugin_config)
-                results[name] = success
-            except Exception as e:
-                print(f"Erro ao inicializar plugin {name}: {e}")
-                results[name] = False
-        
-        self._initialized = True
-        return results
\ No newline at end of file
+        with self._lock:
+            # Plugins registrados de forma preguiçosa precisam existir para serem inicializados
+            self._plugin_config = config
+            self._load_all_lazy_plugins()
+            
+            for name, plugin in self._plugins.items():
+                plugin_config = config.get(name, {})
+                try:
+                    success = plugin.initialize(plugin_config)
+                    results[name] = success
+                except Exception:
+                    logger.exception("Erro ao inicializar plugin %s", name)
+                    results[name] = False
+            
+            self._initialized = True
+            self._rev += 1
+            return results
\ No newline at end of file
@@ -1,10 +1,13 @@
-from fastapi import FastAPI, HTTPException, Header, Depends
+import functools
+import hmac
+import threading
+from concurrent.futures import Future
+from fastapi import FastAPI, HTTPException, Header, Depends, Response
 from pydantic import BaseModel
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from src.config.env_config_provider import EnvConfigProvider
 from src.config.config_validator import ConfigValidator
-from src.factory import AutoMeetAIFactory
 from src.models.transcription_result import TranscriptionResult
 from src.exceptions import AutoMeetAIError
 from src.utils.logging import configure_logger, get_logger
@@ -23,24 +26,38 @@ if API_AUTH_TOKEN:
         logger.warning(f"Invalid API authentication token: {exc}")
         # Continue using the original token instead of setting it to None
 
+# Encoded once so each request only pays for a constant-time comparison
+API_AUTH_TOKEN_BYTES = API_AUTH_TOKEN.encode("utf-8") if API_AUTH_TOKEN else None
 
-def require_api_key(x_api_key: str = Header(None)) -> None:
-    """Validates the API key provided by the client."""
-    if not API_AUTH_TOKEN:
-        logger.warning("API authentication token is not configured. API authentication is disabled.")
-        return
-    if x_api_key != API_AUTH_TOKEN:
-        raise HTTPException(status_code=401, detail="Invalid API key")
 
+if API_AUTH_TOKEN:
+    def require_api_key(x_api_key: str = Header(None)) -> None:
+        """Validates the API key provided by the client."""
+        if not hmac.compare_digest((x_api_key or "").encode("utf-8"), API_AUTH_TOKEN_BYTES):
+            raise HTTPException(status_code=401, detail="Invalid API key")
+else:
+    logger.warning("API authentication token is not configured. API authentication is disabled.")
+
+    def require_api_key() -> None:
+        """No-op dependency used when API authentication is disabled."""
+
+
+@functools.lru_cache(maxsize=1)
+def get_automeetai() -> Any:
+    """Build the AutoMeetAI instance on first use instead of at import time."""
+    from src.factory import AutoMeetAIFactory
 
-factory = AutoMeetAIFactory()
-automeetai = factory.create()
+    return AutoMeetAIFactory().create()
 
 
-@app.get("/health")
-def health() -> Dict[str, str]:
+# Health checks are frequent, so their body is encoded once
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
+@app.get("/health", include_in_schema=False)
+def health() -> Response:
     """Simple health check endpoint."""
-    return {"status": "ok"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 class AnalysisRequest(BaseModel):
@@ -51,16 +68,46 @@ class AnalysisRequest(BaseModel):
     user_prompt: str = "Analise a transcrição a seguir:\n{transcription}"
 
 
-@app.post("/analysis", dependencies=[Depends(require_api_key)])
-def analyze(request: AnalysisRequest) -> Dict[str, Any]:
-    """Analyze a transcription text and return the result."""
-    transcription = TranscriptionResult(utterances=[], text=request.text, audio_file="input.mp3")
+# Analyses currently running, keyed by request content. Concurrent identical
+# requests wait for the running call instead of issuing their own LLM request.
+_IN_FLIGHT: Dict[Tuple[str, str, str], Future] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+
+def _run_analysis(automeetai: Any, request: AnalysisRequest) -> Optional[str]:
+    """Run an analysis, sharing the result with identical concurrent requests."""
+    key = (request.text, request.system_prompt, request.user_prompt)
+    with _IN_FLIGHT_LOCK:
+        future = _IN_FLIGHT.get(key)
+        owner = future is None
+        if owner:
+            future = _IN_FLIGHT[key] = Future()
+    if not owner:
+        return future.result()
+
     try:
+        transcription = TranscriptionResult(utterances=[], text=request.text, audio_file="input.mp3")
         result = automeetai.analyze_transcription(
             transcription=transcription,
             system_prompt=request.system_prompt,
             user_prompt_template=request.user_prompt,
         )
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _IN_FLIGHT_LOCK:
+            del _IN_FLIGHT[key]
+
+
+@app.post("/analysis", dependencies=[Depends(require_api_key)])
+def analyze(request: AnalysisRequest, automeetai: Any = Depends(get_automeetai)) -> Dict[str, Any]:
+    """Analyze a transcription text and return the result."""
+    try:
+        result = _run_analysis(automeetai, request)
         if result is None:
             raise HTTPException(status_code=500, detail="Analysis failed")
         return {"analysis": result}
@@ -1,19 +1,46 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException, Header, Depends
+from fastapi import FastAPI, UploadFile, File, HTTPException, Header, Depends, Response
+from fastapi.responses import JSONResponse
+import hmac
 import os
+import asyncio
+import functools
+import operator
+import shutil
 import tempfile
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
 
 from src.config.env_config_provider import EnvConfigProvider
 from src.config.config_validator import ConfigValidator
-from src.factory import AutoMeetAIFactory
-from src.models.transcription_result import TranscriptionResult
+from src.models.transcription_result import TranscriptionResult, Utterance
 from src.exceptions import AutoMeetAIError
+from src.config.default_config import DEFAULT_MAX_WORKERS
 from src.utils.logging import configure_logger, get_logger
 
+# msgspec and orjson are optional: when one is available, responses are encoded with
+# it and utterance dataclasses are serialized natively, without building intermediate dicts
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    class ResponseClass(JSONResponse):
+        """JSON response encoded in C by msgspec."""
+
+        def render(self, content: Any) -> bytes:
+            return msgspec.json.encode(content)
+else:
+    try:
+        import orjson  # noqa: F401
+        from fastapi.responses import ORJSONResponse as ResponseClass
+    except ImportError:
+        ResponseClass = JSONResponse
+
 configure_logger()
 logger = get_logger(__name__)
 
-app = FastAPI(title="AutoMeetAI Transcription Service")
+app = FastAPI(title="AutoMeetAI Transcription Service", default_response_class=ResponseClass)
 
 # Authentication token from environment
 _config = EnvConfigProvider()
@@ -25,6 +52,9 @@ if API_AUTH_TOKEN:
         logger.warning(f"Invalid API authentication token: {exc}")
         # Continue using the original token instead of setting it to None
 
+# Encoded once so each request only pays for a constant-time comparison
+API_AUTH_TOKEN_BYTES = API_AUTH_TOKEN.encode("utf-8") if API_AUTH_TOKEN else None
+
 
 
 def require_api_key(x_api_key: str = Header(None)) -> None:
@@ -32,18 +62,47 @@ def require_api_key(x_api_key: str = Header(None)) -> None:
     if not API_AUTH_TOKEN:
         logger.error("API authentication token is not configured.")
         raise HTTPException(status_code=500, detail="API authentication not configured")
-    if x_api_key != API_AUTH_TOKEN:
+    if not hmac.compare_digest((x_api_key or "").encode("utf-8"), API_AUTH_TOKEN_BYTES):
         raise HTTPException(status_code=401, detail="Invalid API key")
 
 
-factory = AutoMeetAIFactory()
-automeetai = factory.create()
+@functools.lru_cache(maxsize=1)
+def get_automeetai() -> Any:
+    """Build the AutoMeetAI instance on first use instead of at import time."""
+    from src.factory import AutoMeetAIFactory
+
+    return AutoMeetAIFactory().create()
+
+# Uploads are copied to disk in chunks of this size instead of being read whole
+UPLOAD_CHUNK_SIZE = 1 << 20
 
+# Video processing is blocking, so it runs on a bounded worker pool instead of the
+# event loop; the pool size caps how many jobs run at once. No asyncio primitive is
+# created here: on Python < 3.10 it would bind to the import-time event loop.
+MAX_CONCURRENT_JOBS = int(_config.get("max_concurrent_transcriptions", DEFAULT_MAX_WORKERS))
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_JOBS, thread_name_prefix="transcription")
 
-@app.get("/health")
-def health() -> Dict[str, str]:
+
+# Health checks are frequent, so their body is encoded once
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
+@app.get("/health", include_in_schema=False)
+def health() -> Response:
     """Simple health check endpoint."""
-    return {"status": "ok"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+# Utterance fields returned by /transcriptions, read in one C-level call
+_UTTERANCE_FIELDS = ("speaker", "text", "start", "end")
+_get_utterance_fields = operator.attrgetter(*_UTTERANCE_FIELDS)
+
+
+def _serialize_utterances(utterances: List[Utterance]) -> List[Any]:
+    """Return utterances in a form the response class can encode."""
+    if ResponseClass is JSONResponse:
+        return [dict(zip(_UTTERANCE_FIELDS, _get_utterance_fields(u))) for u in utterances]
+    return utterances
 
 
 @app.post("/transcriptions", dependencies=[Depends(require_api_key)])
@@ -52,44 +111,48 @@ async def transcribe(
     speaker_labels: bool = True,
     speakers_expected: int = 2,
     language_code: str = "pt",
-) -> Dict[str, Any]:
+    automeetai: Any = Depends(get_automeetai),
+) -> Response:
     """Process a video file and return its transcription."""
     temp_path = None
     try:
+        loop = asyncio.get_running_loop()
         suffix = os.path.splitext(file.filename)[1] or ".mp4"
         with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            tmp.write(await file.read())
             temp_path = tmp.name
+            # Copy the spooled upload in one blocking call off the event loop
+            await loop.run_in_executor(
+                None, shutil.copyfileobj, file.file, tmp, UPLOAD_CHUNK_SIZE
+            )
 
-        transcription = automeetai.process_video(
-            video_file=temp_path,
-            transcription_config={
-                "speaker_labels": speaker_labels,
-                "speakers_expected": speakers_expected,
-                "language_code": language_code,
-            },
+        transcription = await loop.run_in_executor(
+            EXECUTOR,
+            functools.partial(
+                automeetai.process_video,
+                video_file=temp_path,
+                transcription_config={
+                    "speaker_labels": speaker_labels,
+                    "speakers_expected": speakers_expected,
+                    "language_code": language_code,
+                },
+            ),
         )
         if not transcription:
             raise HTTPException(status_code=500, detail="Transcription failed")
-        return {
+        # Returning the response directly skips FastAPI's jsonable_encoder pass
+        return ResponseClass({
             "text": transcription.text,
-            "utterances": [
-                {
-                    "speaker": u.speaker,
-                    "text": u.text,
-                    "start": u.start,
-                    "end": u.end,
-                }
-                for u in transcription.utterances
-            ],
-        }
+            "utterances": _serialize_utterances(transcription.utterances),
+        })
     except AutoMeetAIError as exc:
         logger.error(f"Error processing transcription: {exc}")
         message = getattr(exc, "user_friendly_message", str(exc))
         raise HTTPException(status_code=400, detail=message) from exc
     finally:
-        if temp_path and os.path.exists(temp_path):
+        if temp_path:
             try:
                 os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
             except OSError:
                 logger.warning(f"Failed to remove temporary file {temp_path}")
@@ -1,15 +1,148 @@
-from typing import List, Optional, Dict, Any, Iterator, Union, Callable
+from typing import List, Optional, Dict, Any, Iterator, Union, Callable, Tuple
 from dataclasses import dataclass
 import os
 import json
+import mmap
 import tempfile
+import threading
+import weakref
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from src.utils.logging import get_logger
 from src.exceptions import UnsupportedFormatError, FormattingFailedError, FileError
 from src.models.transcription_result import Utterance, TranscriptionResult
+from src.formatters.formatter_factory import FormatterFactory
 
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# orjson é opcional: quando disponível, é usado no lugar do decoder/encoder padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pysimdjson é opcional: quando disponível, é o decoder preferido (escolhe em tempo de
+# execução a implementação SIMD suportada pelo processador)
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Um parser simdjson por thread: o parser reaproveita seus buffers, mas não é thread-safe
+_simdjson_parsers = threading.local()
+
+
+def _simdjson_loads(data: bytes) -> Any:
+    """
+    Decodifica um documento JSON com o parser simdjson da thread atual.
+
+    Args:
+        data: O documento JSON
+
+    Returns:
+        Any: O valor decodificado, convertido em objetos Python (listas e dicionários)
+    """
+    parser = getattr(_simdjson_parsers, "parser", None)
+    if parser is None:
+        parser = _simdjson_parsers.parser = simdjson.Parser()
+    return parser.parse(data, True)
+
+
+# Decoder escolhido uma única vez, na importação: simdjson, orjson ou o json padrão
+if simdjson is not None:
+    _loads = _simdjson_loads
+elif orjson is not None:
+    _loads = orjson.loads
+else:
+    _loads = json.loads
+
+# Número máximo de linhas acumuladas em memória antes de cada escrita no arquivo temporário
+_WRITE_BATCH_LINES = 1 << 16
+
+# Bytes que não são espaço em branco segundo ``bytes.strip``, indexados pelo valor do byte
+_NON_WHITESPACE = np.ones(256, dtype=bool)
+_NON_WHITESPACE[list(b' \t\n\r\x0b\x0c')] = False
+
+# Número máximo de threads usadas para salvar vários formatos ao mesmo tempo
+_MAX_SAVE_WORKERS = 8
+
+
+def _dumps_line(data: Any) -> bytes:
+    """
+    Serializa um valor como uma linha JSON compacta em bytes, usando orjson quando disponível.
+
+    Args:
+        data: O valor a ser serializado
+
+    Returns:
+        bytes: A linha JSON, terminada em quebra de linha
+    """
+    if orjson is not None:
+        return orjson.dumps(data) + b'\n'
+    return json.dumps(data, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def _cleanup_tempfile(iterator: 'UtteranceIterator', path: Optional[str]) -> None:
+    """
+    Fecha o iterador de utterances e remove o arquivo temporário associado.
+
+    Args:
+        iterator: O iterador que mantém o arquivo mapeado
+        path: Caminho do arquivo a ser removido, ou None para apenas fechar o iterador
+    """
+    # Fecha o arquivo antes de removê-lo
+    iterator.close()
+    
+    if path is not None:
+        try:
+            os.remove(path)
+        except Exception as e:
+            logger.warning(f"Erro ao remover arquivo temporário {path}: {e}")
+
+
+def _utterance_from_record(data: Union[List[Any], Dict[str, Any]]) -> Utterance:
+    """
+    Converte um registro decodificado de uma linha do arquivo em um Utterance.
+
+    Os arquivos temporários guardam cada fala como um array posicional
+    ``[speaker, text, start, end]``, sem repetir os nomes dos campos em cada linha;
+    arquivos fornecidos externamente podem usar objetos JSON com esses campos.
+
+    Args:
+        data: O registro decodificado (array ou objeto)
+
+    Returns:
+        Utterance: A fala correspondente
+    """
+    if isinstance(data, list):
+        return Utterance(*data)
+    return Utterance(
+        speaker=data.get('speaker', ''),
+        text=data.get('text', ''),
+        start=data.get('start'),
+        end=data.get('end')
+    )
+
+
+def _decode_lines(lines: List[bytes]) -> List[Utterance]:
+    """
+    Decodifica várias linhas do arquivo de utterances com uma única chamada ao decoder.
+
+    As linhas são unidas em um único array JSON, o que evita o custo fixo de uma
+    chamada ao decoder por fala.
+
+    Args:
+        lines: Linhas JSON não vazias (a quebra de linha final é opcional)
+
+    Returns:
+        List[Utterance]: As falas correspondentes, na mesma ordem
+    """
+    if not lines:
+        return []
+    return [_utterance_from_record(data) for data in _loads(b'[' + b','.join(lines) + b']')]
+
 
 class UtteranceIterator:
     """
@@ -17,64 +150,189 @@ class UtteranceIterator:
     Carrega os utterances em chunks para reduzir o uso de memória.
     """
     
-    def __init__(self, utterances_file: str, chunk_size: int = 100):
+    def __init__(self, utterances_file: str, chunk_size: int = 100, total_count: Optional[int] = None,
+                 offsets: Optional[array] = None):
         """
         Inicializa o iterador de utterances.
         
+        O arquivo não é lido aqui: se não forem informados, o total de utterances e o
+        índice de posições só são calculados quando solicitados pela primeira vez.
+        
         Args:
             utterances_file: Caminho para o arquivo contendo os utterances
             chunk_size: Número de utterances a serem carregados por vez
+            total_count: Número de utterances no arquivo, se já for conhecido
+            offsets: Posição em bytes do início de cada utterance no arquivo, se já for conhecida
         """
         self.utterances_file = utterances_file
         self.chunk_size = chunk_size
         self.current_index = 0
-        self.total_count = 0
+        self._offsets = offsets
+        self._total_count = len(offsets) if offsets is not None else total_count
+        self._mm = None
+        # Fecha o mapeamento se o iterador for descartado sem chamar close()
+        self._mm_finalizer: Optional[weakref.finalize] = None
+        self._pos = 0
+        self._batch: Iterator[Utterance] = iter(())
+    
+    @property
+    def total_count(self) -> int:
+        """
+        Número total de utterances no arquivo, calculado na primeira consulta.
         
-        # Conta o número total de utterances no arquivo
-        with open(self.utterances_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():  # Ignora linhas vazias
-                    self.total_count += 1
+        Returns:
+            int: O número total de utterances
+        """
+        if self._total_count is None:
+            self._get_offsets()
+        return self._total_count
+    
+    def _get_offsets(self) -> array:
+        """
+        Retorna o índice com a posição em bytes de cada utterance, construindo-o na primeira chamada.
+        
+        Returns:
+            array: Posições (``uint64``) do início de cada linha não vazia do arquivo
+        """
+        if self._offsets is None:
+            self._offsets = self._scan_offsets(self.utterances_file)
+            self._total_count = len(self._offsets)
+        return self._offsets
+    
+    @staticmethod
+    def _scan_offsets(utterances_file: str) -> array:
+        """
+        Localiza o início de cada linha não vazia de um arquivo de utterances.
+        
+        O arquivo é mapeado em memória e percorrido com operações vetorizadas do NumPy,
+        sem um laço Python por linha.
+        
+        Args:
+            utterances_file: Caminho para o arquivo de utterances
+            
+        Returns:
+            array: Posições (``uint64``) do início de cada linha não vazia do arquivo
+        """
+        with open(utterances_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return array('Q')
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = np.frombuffer(mm, dtype=np.uint8)
+                
+                # Cada linha começa no início do arquivo ou logo após uma quebra de linha
+                starts = np.flatnonzero(data == ord('\n')) + 1
+                starts = np.concatenate(([0], starts[starts < len(data)]))
+                
+                # Ignora linhas vazias: só as que começam com espaço em branco (raras em
+                # JSONL) precisam ser verificadas por inteiro
+                non_blank = _NON_WHITESPACE[data[starts]]
+                ends = np.append(starts[1:], len(data))
+                for i in np.flatnonzero(~non_blank).tolist():
+                    non_blank[i] = bool(mm[starts[i]:ends[i]].strip())
+                
+                # O buffer mapeado precisa ser liberado antes de fechar o mmap
+                del data
+        return array('Q', starts[non_blank].astype(np.uint64).tobytes())
     
     def __iter__(self):
         """
-        Retorna o próprio iterador.
+        Retorna o próprio iterador, reiniciando-o se uma iteração já tiver começado.
+        
+        O arquivo só é mapeado na primeira chamada a ``__next__``.
         """
-        self.current_index = 0
+        if self._mm is not None or self.current_index:
+            self.close()
+            self.current_index = 0
+            self._batch = iter(())
         return self
     
     def __next__(self) -> Utterance:
         """
         Retorna o próximo utterance.
         
+        Os utterances são decodificados em lotes de ``chunk_size`` linhas.
+        
         Returns:
             Utterance: O próximo utterance
             
         Raises:
             StopIteration: Quando não há mais utterances
         """
-        if self.current_index >= self.total_count:
-            raise StopIteration
+        utterance = next(self._batch, None)
+        if utterance is None:
+            self._batch = iter(self._read_batch())
+            utterance = next(self._batch)
+        
+        self.current_index += 1
+        return utterance
+    
+    def _read_batch(self) -> List[Utterance]:
+        """
+        Lê e decodifica o próximo lote de utterances do arquivo mapeado.
+        
+        O arquivo é mapeado em memória e cada linha é delimitada com ``mmap.find``,
+        que procura a quebra de linha em C sobre o buffer mapeado.
+        
+        Returns:
+            List[Utterance]: Até ``chunk_size`` utterances
             
-        # Abre o arquivo e avança até o índice atual
-        with open(self.utterances_file, 'r', encoding='utf-8') as f:
-            for i, line in enumerate(f):
-                if i == self.current_index:
-                    self.current_index += 1
-                    if not line.strip():  # Ignora linhas vazias
-                        continue
-                    
-                    # Converte a linha JSON em um objeto Utterance
-                    utterance_data = json.loads(line)
-                    return Utterance(
-                        speaker=utterance_data.get('speaker', ''),
-                        text=utterance_data.get('text', ''),
-                        start=utterance_data.get('start'),
-                        end=utterance_data.get('end')
-                    )
-        
-        # Não deveria chegar aqui, mas por segurança
-        raise StopIteration
+        Raises:
+            StopIteration: Quando não há mais utterances
+        """
+        if self._mm is None:
+            if self.current_index or not self._map_file():
+                raise StopIteration
+        
+        mm = self._mm
+        size = len(mm)
+        batch_size = max(self.chunk_size, 1)
+        lines: List[bytes] = []
+        while len(lines) < batch_size:
+            start = self._pos
+            if start >= size:
+                break
+            
+            end = mm.find(b'\n', start)
+            if end == -1:
+                end = size
+            self._pos = end + 1
+            
+            line = mm[start:end]
+            if line.strip():  # Ignora linhas vazias
+                lines.append(line)
+        
+        if not lines:
+            # Fim do arquivo: a contagem passa a ser conhecida sem nova leitura
+            self._total_count = self.current_index
+            self.close()
+            raise StopIteration
+        
+        return _decode_lines(lines)
+    
+    def _map_file(self) -> bool:
+        """
+        Mapeia o arquivo de utterances em memória para uma nova iteração.
+        
+        Returns:
+            bool: False se o arquivo estiver vazio (arquivos vazios não podem ser mapeados)
+        """
+        with open(self.utterances_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self._total_count = 0
+                return False
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mm_finalizer = weakref.finalize(self, self._mm.close)
+        self._pos = 0
+        return True
+    
+    def close(self) -> None:
+        """
+        Libera o mapeamento usado pela iteração em andamento, se houver.
+        """
+        if self._mm is not None:
+            self._mm_finalizer()
+            self._mm = None
+            self._mm_finalizer = None
     
     def __len__(self) -> int:
         """
@@ -85,10 +343,31 @@ class UtteranceIterator:
         """
         return self.total_count
     
+    def __getitem__(self, index: int) -> Utterance:
+        """
+        Retorna o utterance na posição informada, lendo apenas a sua linha.
+        
+        Args:
+            index: Índice do utterance (índices negativos contam a partir do fim)
+            
+        Returns:
+            Utterance: O utterance na posição informada
+            
+        Raises:
+            IndexError: Se o índice estiver fora do intervalo
+        """
+        offsets = self._get_offsets()
+        with open(self.utterances_file, 'rb') as f:
+            f.seek(offsets[index])
+            return _utterance_from_record(_loads(f.readline()))
+    
     def get_chunk(self, start_index: int, chunk_size: Optional[int] = None) -> List[Utterance]:
         """
         Retorna um chunk de utterances.
         
+        O índice de posições delimita o trecho do arquivo ocupado pelo chunk, que é
+        lido com uma única chamada a ``read`` e decodificado de uma só vez.
+        
         Args:
             start_index: Índice inicial do chunk
             chunk_size: Tamanho do chunk (se None, usa o tamanho padrão)
@@ -98,65 +377,115 @@ class UtteranceIterator:
         """
         if chunk_size is None:
             chunk_size = self.chunk_size
-            
-        result = []
-        count = 0
         
-        with open(self.utterances_file, 'r', encoding='utf-8') as f:
-            for i, line in enumerate(f):
-                if not line.strip():  # Ignora linhas vazias
-                    continue
-                    
-                if i >= start_index and count < chunk_size:
-                    # Converte a linha JSON em um objeto Utterance
-                    utterance_data = json.loads(line)
-                    utterance = Utterance(
-                        speaker=utterance_data.get('speaker', ''),
-                        text=utterance_data.get('text', ''),
-                        start=utterance_data.get('start'),
-                        end=utterance_data.get('end')
-                    )
-                    result.append(utterance)
-                    count += 1
-                    
-                if count >= chunk_size:
-                    break
-                    
-        return result
+        offsets = self._get_offsets()
+        if chunk_size <= 0 or start_index >= len(offsets):
+            return []
+        
+        start_index = max(start_index, 0)
+        end_index = start_index + chunk_size
+        with open(self.utterances_file, 'rb') as f:
+            f.seek(offsets[start_index])
+            if end_index < len(offsets):
+                data = f.read(offsets[end_index] - offsets[start_index])
+            else:
+                data = f.read()
+        
+        # Ignora linhas vazias
+        return _decode_lines([line for line in data.split(b'\n') if line.strip()])
 
 
 class OptimizedTranscriptionResult:
     """
     Versão otimizada do TranscriptionResult para grandes transcrições.
     Usa carregamento preguiçoso e paginação para reduzir o uso de memória.
+    
+    O arquivo temporário de utterances é removido por ``close()`` ou ao sair de um
+    bloco ``with``; caso contrário, quando o objeto for coletado. Arquivos fornecidos
+    pelo chamador nunca são removidos.
     """
     
     def __init__(self, utterances: Union[List[Utterance], str], text: str, audio_file: str):
         """
         Inicializa o resultado da transcrição otimizado.
         
+        Prefira ``from_file`` ou ``from_list`` quando o tipo de ``utterances`` já for conhecido.
+        
         Args:
             utterances: Lista de utterances ou caminho para o arquivo de utterances
             text: Texto completo da transcrição
             audio_file: Caminho para o arquivo de áudio
         """
-        self.text = text
-        self.audio_file = audio_file
-        self._utterances_loaded = False
-        self._utterances_file = None
-        self._utterances_iterator = None
-        
         # Se utterances for uma string, assume que é um caminho para o arquivo
         if isinstance(utterances, str):
-            self._utterances_file = utterances
+            self._init_state(utterances, None, text, audio_file, owns_file=False)
         else:
             # Se utterances for uma lista, salva em um arquivo temporário
-            self._utterances_file = self._save_utterances_to_file(utterances)
+            self._init_state(*self._save_utterances_to_file(utterances), text, audio_file, owns_file=True)
+    
+    @classmethod
+    def from_file(cls, path: str, text: str, audio_file: str) -> 'OptimizedTranscriptionResult':
+        """
+        Cria um resultado a partir de um arquivo de utterances existente.
+        
+        Args:
+            path: Caminho para o arquivo de utterances (JSONL)
+            text: Texto completo da transcrição
+            audio_file: Caminho para o arquivo de áudio
             
+        Returns:
+            OptimizedTranscriptionResult: O resultado da transcrição otimizado
+        """
+        result = cls.__new__(cls)
+        result._init_state(path, None, text, audio_file, owns_file=False)
+        return result
+    
+    @classmethod
+    def from_list(cls, utterances: List[Utterance], text: str, audio_file: str) -> 'OptimizedTranscriptionResult':
+        """
+        Cria um resultado a partir de uma lista de utterances, salvos em um arquivo temporário.
+        
+        Args:
+            utterances: Lista de utterances
+            text: Texto completo da transcrição
+            audio_file: Caminho para o arquivo de áudio
+            
+        Returns:
+            OptimizedTranscriptionResult: O resultado da transcrição otimizado
+        """
+        result = cls.__new__(cls)
+        result._init_state(*cls._save_utterances_to_file(utterances), text, audio_file, owns_file=True)
+        return result
+    
+    def _init_state(self, utterances_file: str, offsets: Optional[array], text: str, audio_file: str,
+                    owns_file: bool) -> None:
+        """
+        Inicializa o estado do resultado a partir do arquivo de utterances.
+        
+        Args:
+            utterances_file: Caminho para o arquivo de utterances
+            offsets: Posição em bytes de cada utterance no arquivo, se já for conhecida
+            text: Texto completo da transcrição
+            audio_file: Caminho para o arquivo de áudio
+            owns_file: Se o arquivo foi criado por este objeto e deve ser removido na limpeza
+        """
+        self.text = text
+        self.audio_file = audio_file
+        self._utterances_file = utterances_file
+        self._owns_file = owns_file
+        # Caches de resultados derivados: os utterances não mudam após a construção
+        self._formatted_text_cache: Optional[str] = None
+        self._columns: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]] = None
+        
         # Cria o iterador de utterances
-        self._utterances_iterator = UtteranceIterator(self._utterances_file)
+        self._utterances_iterator = UtteranceIterator(utterances_file, offsets=offsets)
+        
+        # Registra a limpeza dos recursos; só o arquivo criado por este objeto é removido
+        temp_path = utterances_file if owns_file else None
+        self._finalizer = weakref.finalize(self, _cleanup_tempfile, self._utterances_iterator, temp_path)
     
-    def _save_utterances_to_file(self, utterances: List[Utterance]) -> str:
+    @staticmethod
+    def _save_utterances_to_file(utterances: List[Utterance]) -> Tuple[str, array]:
         """
         Salva os utterances em um arquivo temporário.
         
@@ -164,35 +493,48 @@ class OptimizedTranscriptionResult:
             utterances: Lista de utterances
             
         Returns:
-            str: Caminho para o arquivo temporário
+            Tuple[str, array]: Caminho para o arquivo temporário e a posição em bytes
+            de cada utterance no arquivo
         """
         # Cria um arquivo temporário
         fd, temp_file = tempfile.mkstemp(suffix='.jsonl', prefix='utterances_')
         os.close(fd)
         
-        # Salva os utterances no arquivo
-        with open(temp_file, 'w', encoding='utf-8') as f:
+        # Salva cada utterance como um array posicional [speaker, text, start, end],
+        # registrando a posição de cada linha para acesso direto aos chunks
+        offsets = array('Q')
+        position = 0
+        batch: List[bytes] = []
+        with open(temp_file, 'wb') as f:
             for utterance in utterances:
-                utterance_data = {
-                    'speaker': utterance.speaker,
-                    'text': utterance.text,
-                    'start': utterance.start,
-                    'end': utterance.end
-                }
-                f.write(json.dumps(utterance_data) + '\n')
+                line = _dumps_line([utterance.speaker, utterance.text, utterance.start, utterance.end])
+                batch.append(line)
+                offsets.append(position)
+                position += len(line)
+                
+                # As linhas são gravadas em lotes, com uma única escrita por lote
+                if len(batch) >= _WRITE_BATCH_LINES:
+                    f.write(b''.join(batch))
+                    batch.clear()
+            
+            if batch:
+                f.write(b''.join(batch))
                 
-        return temp_file
+        return temp_file, offsets
     
-    def __del__(self):
+    def close(self) -> None:
         """
-        Limpa os recursos quando o objeto é destruído.
+        Libera os recursos, removendo o arquivo temporário de utterances.
+        
+        Chamadas repetidas não têm efeito.
         """
-        # Remove o arquivo temporário se foi criado
-        if self._utterances_file and self._utterances_file.startswith(tempfile.gettempdir()):
-            try:
-                os.remove(self._utterances_file)
-            except Exception as e:
-                logger.warning(f"Erro ao remover arquivo temporário {self._utterances_file}: {e}")
+        self._finalizer()
+    
+    def __enter__(self) -> 'OptimizedTranscriptionResult':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     @property
     def utterances(self) -> Iterator[Utterance]:
@@ -226,18 +568,76 @@ class OptimizedTranscriptionResult:
         """
         return len(self._utterances_iterator)
     
+    def _get_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        Retorna os tempos e falantes dos utterances em colunas, carregadas na primeira chamada.
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]: Inícios e fins (``float64``,
+            NaN quando desconhecidos), o código de falante de cada utterance e os nomes
+            dos falantes indexados por código
+        """
+        if self._columns is None:
+            starts: List[Optional[float]] = []
+            ends: List[Optional[float]] = []
+            codes: List[int] = []
+            speaker_codes: Dict[str, int] = {}
+            
+            for utterance in self.utterances:
+                starts.append(utterance.start)
+                ends.append(utterance.end)
+                codes.append(speaker_codes.setdefault(utterance.speaker, len(speaker_codes)))
+            
+            # Com dtype float64, valores None são convertidos em NaN
+            self._columns = (
+                np.array(starts, dtype=np.float64),
+                np.array(ends, dtype=np.float64),
+                np.array(codes, dtype=np.intp),
+                list(speaker_codes)
+            )
+        return self._columns
+    
+    def total_duration(self) -> float:
+        """
+        Retorna a soma das durações dos utterances.
+        
+        Utterances sem início ou fim não são contabilizados.
+        
+        Returns:
+            float: A duração total, na mesma unidade de ``start`` e ``end``
+        """
+        starts, ends, _, _ = self._get_columns()
+        return float(np.nansum(ends - starts))
+    
+    def duration_per_speaker(self) -> Dict[str, float]:
+        """
+        Retorna a duração total das falas de cada falante.
+        
+        Utterances sem início ou fim não são contabilizados.
+        
+        Returns:
+            Dict[str, float]: Duração por falante, na ordem em que os falantes aparecem
+        """
+        starts, ends, codes, speakers = self._get_columns()
+        durations = np.nan_to_num(ends - starts)
+        totals = np.bincount(codes, weights=durations, minlength=len(speakers))
+        return dict(zip(speakers, totals.tolist()))
+    
     def to_formatted_text(self) -> str:
         """
         Converte o resultado da transcrição para um texto formatado.
         
+        O texto é gerado uma única vez, na primeira chamada, e reutilizado nas
+        seguintes, já que os utterances não mudam após a criação do objeto.
+        
         Returns:
             str: O texto formatado da transcrição
         """
-        result = []
-        for utterance in self.utterances:
-            result.append(f"{utterance.speaker}: {utterance.text}")
-            
-        return "\n".join(result)
+        if self._formatted_text_cache is None:
+            self._formatted_text_cache = "\n".join(
+                f"{utterance.speaker}: {utterance.text}" for utterance in self.utterances
+            )
+        return self._formatted_text_cache
     
     def format(self, format_name: str, options: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -254,18 +654,16 @@ class OptimizedTranscriptionResult:
             UnsupportedFormatError: Se o formato não for suportado
             FormattingFailedError: Se ocorrer um erro durante a formatação
         """
-        # Importar aqui para evitar importação circular
-        from src.formatters.formatter_factory import FormatterFactory
-        
         try:
-            # Converte para TranscriptionResult padrão para compatibilidade com formatadores existentes
-            # Isso é ineficiente para grandes transcrições, mas é necessário para compatibilidade
-            # Futuramente, os formatadores devem ser atualizados para suportar OptimizedTranscriptionResult
-            standard_result = self.to_standard_result()
-            
             # O método get_formatter agora lança UnsupportedFormatError se o formato não for suportado
             formatter = FormatterFactory.get_formatter(format_name)
-            return formatter.format(standard_result, options)
+            
+            # Formatadores com suporte a streaming percorrem as falas direto do arquivo
+            if formatter.supports_streaming:
+                return formatter.format_stream(self.utterances, self.text, self.audio_file, options)
+            
+            # Os demais recebem um TranscriptionResult padrão, com todas as falas em memória
+            return formatter.format(self.to_standard_result(), options)
         except UnsupportedFormatError:
             # Repassar a exceção UnsupportedFormatError
             logger.error(f"Formato não suportado: {format_name}")
@@ -302,17 +700,23 @@ class OptimizedTranscriptionResult:
                 else:
                     format_name = "txt"  # Formato padrão
                     
-            # Formatar o conteúdo - pode lançar UnsupportedFormatError ou FormattingFailedError
-            content = self.format(format_name, options)
+            # Obter o formatador - pode lançar UnsupportedFormatError
+            formatter = FormatterFactory.get_formatter(format_name)
             
-            # Salvar no arquivo
+            # Formatar diretamente no arquivo, sem montar o documento inteiro em memória
             try:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                if formatter.supports_streaming:
+                    formatter.format_stream_to_file(self.utterances, self.text, self.audio_file,
+                                                    output_file, options)
+                else:
+                    formatter.format_to_file(self.to_standard_result(), output_file, options)
             except PermissionError as e:
                 raise FileError(f"Erro de permissão ao salvar arquivo {output_file}: {e}") from e
             except OSError as e:
                 raise FileError(f"Erro ao salvar arquivo {output_file}: {e}") from e
+            except Exception as e:
+                logger.error(f"Erro ao formatar transcrição como {format_name}: {e}")
+                raise FormattingFailedError(f"Erro ao formatar transcrição como {format_name}: {e}") from e
                 
             logger.info(f"Transcrição salva em {output_file}")
             return True
@@ -338,38 +742,62 @@ class OptimizedTranscriptionResult:
         Returns:
             Dict[str, bool]: Dicionário mapeando formatos para status de sucesso
         """
-        results = {}
+        if not formats:
+            return {}
+        
+        # O iterador de utterances não é thread-safe, então as falas são carregadas
+        # uma única vez e todos os formatos são gerados a partir do mesmo resultado padrão
+        try:
+            result = self.to_standard_result()
+        except Exception as e:
+            logger.error(f"Erro ao carregar utterances para salvar os formatos: {e}")
+            return {format_name: False for format_name in formats}
         
-        for format_name in formats:
+        # Cada formato é formatado e gravado em sua própria thread
+        with ThreadPoolExecutor(max_workers=min(len(formats), _MAX_SAVE_WORKERS)) as executor:
+            futures = [
+                (format_name, executor.submit(
+                    self._save_format, result, base_output_file, format_name,
+                    options.get(format_name) if options else None
+                ))
+                for format_name in formats
+            ]
+            return {format_name: future.result() for format_name, future in futures}
+    
+    @staticmethod
+    def _save_format(result: TranscriptionResult, base_output_file: str, format_name: str,
+                     format_options: Optional[Dict[str, Any]]) -> bool:
+        """
+        Salva um resultado padrão em um único formato, sem lançar exceções.
+        
+        Args:
+            result: O resultado da transcrição no formato padrão
+            base_output_file: Caminho base para o arquivo de saída (sem extensão)
+            format_name: Nome do formato
+            format_options: Opções específicas para este formato
+            
+        Returns:
+            bool: True se o arquivo foi salvo com sucesso, False caso contrário
+        """
+        try:
+            # Obter o formatador - pode lançar UnsupportedFormatError
+            formatter = FormatterFactory.get_formatter(format_name)
+            
+            # Obter a extensão do arquivo para este formato
+            extension = formatter.get_file_extension()
+            output_file = f"{base_output_file}.{extension}"
+            
+            # Salvar no formato - pode lançar várias exceções
             try:
-                # Importar aqui para evitar importação circular
-                from src.formatters.formatter_factory import FormatterFactory
-                
-                # Obter o formatador - pode lançar UnsupportedFormatError
-                formatter = FormatterFactory.get_formatter(format_name)
-                
-                # Obter a extensão do arquivo para este formato
-                extension = formatter.get_file_extension()
-                output_file = f"{base_output_file}.{extension}"
-                
-                # Obter opções específicas para este formato, se fornecidas
-                format_options = None
-                if options and format_name in options:
-                    format_options = options[format_name]
-                    
-                # Salvar no formato - pode lançar várias exceções
-                try:
-                    self.save_to_file(output_file, format_name, format_options)
-                    results[format_name] = True
-                except Exception as e:
-                    logger.error(f"Erro ao salvar no formato {format_name}: {e}")
-                    results[format_name] = False
-                    
+                result.save_to_file(output_file, format_name, format_options)
+                return True
             except Exception as e:
-                logger.error(f"Erro ao processar formato {format_name}: {e}")
-                results[format_name] = False
+                logger.error(f"Erro ao salvar no formato {format_name}: {e}")
+                return False
                 
-        return results
+        except Exception as e:
+            logger.error(f"Erro ao processar formato {format_name}: {e}")
+            return False
     
     def to_standard_result(self) -> TranscriptionResult:
         """
@@ -399,7 +827,7 @@ class OptimizedTranscriptionResult:
         Returns:
             OptimizedTranscriptionResult: O resultado da transcrição otimizado
         """
-        return cls(
+        return cls.from_list(
             utterances=result.utterances,
             text=result.text,
             audio_file=result.audio_file
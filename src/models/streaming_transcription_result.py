@@ -1,9 +1,9 @@
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
-from src.models.transcription_result import Utterance, TranscriptionResult
+from src.models.transcription_result import Utterance, TranscriptionResult, DATACLASS_OPTIONS
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class StreamingTranscriptionResult:
     """
     Representa o resultado parcial de uma transcrição em streaming.
@@ -47,6 +47,9 @@ class StreamingSession:
         self.is_active: bool = False
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
+        # Textos dos resultados finais e a sua junção, calculada apenas quando lida
+        self._final_text_parts: List[str] = []
+        self._final_text_cache: Optional[str] = ""
     
     def add_result(self, result: StreamingTranscriptionResult) -> None:
         """
@@ -56,6 +59,8 @@ class StreamingSession:
             result: O resultado parcial a ser adicionado
         """
         if result.is_final:
+            self._final_text_parts.append(result.text)
+            self._final_text_cache = None
             self.final_results.append(result)
         else:
             self.partial_results.append(result)
@@ -67,8 +72,10 @@ class StreamingSession:
         Returns:
             str: O texto atual da transcrição
         """
-        # Texto de todos os resultados finais
-        final_text = " ".join([r.text for r in self.final_results])
+        # Texto de todos os resultados finais, unido uma vez a cada novo resultado final
+        if self._final_text_cache is None:
+            self._final_text_cache = " ".join(self._final_text_parts)
+        final_text = self._final_text_cache
         
         # Adiciona o texto do último resultado parcial, se houver
         if self.partial_results:
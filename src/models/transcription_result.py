@@ -1,14 +1,33 @@
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 import os
+import sys
+from functools import lru_cache
 from src.utils.logging import get_logger
 from src.exceptions import UnsupportedFormatError, FormattingFailedError, FileError
 
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# A partir do Python 3.10, os modelos usam __slots__ e não carregam um __dict__ por instância
+DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@lru_cache(maxsize=1)
+def _formatter_factory():
+    """
+    Retorna a classe FormatterFactory, importada na primeira chamada.
+
+    Os formatadores importam este módulo, então a importação não pode ser feita no topo.
+
+    Returns:
+        Type[FormatterFactory]: A fábrica de formatadores
+    """
+    from src.formatters.formatter_factory import FormatterFactory
+    return FormatterFactory
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class Speaker:
     """
     Representa um falante em uma transcrição.
@@ -17,7 +36,7 @@ class Speaker:
     name: str
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Utterance:
     """
     Representa uma única fala em uma transcrição.
@@ -28,7 +47,7 @@ class Utterance:
     end: Optional[float] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class TranscriptionResult:
     """
     Representa o resultado de uma transcrição.
@@ -47,11 +66,7 @@ class TranscriptionResult:
         Returns:
             str: The formatted transcription text
         """
-        result = []
-        for utterance in self.utterances:
-            result.append(f"{utterance.speaker}: {utterance.text}")
-
-        return "\n".join(result)
+        return "\n".join(f"{utterance.speaker}: {utterance.text}" for utterance in self.utterances)
 
     def format(self, format_name: str, options: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -68,12 +83,9 @@ class TranscriptionResult:
             UnsupportedFormatError: Se o formato não for suportado
             FormattingFailedError: Se ocorrer um erro durante a formatação
         """
-        # Importar aqui para evitar importação circular
-        from src.formatters.formatter_factory import FormatterFactory
-
         try:
             # O método get_formatter agora lança UnsupportedFormatError se o formato não for suportado
-            formatter = FormatterFactory.get_formatter(format_name)
+            formatter = _formatter_factory().get_formatter(format_name)
             return formatter.format(self, options)
         except UnsupportedFormatError:
             # Repassar a exceção UnsupportedFormatError
@@ -111,17 +123,19 @@ class TranscriptionResult:
                 else:
                     format_name = "txt"  # Formato padrão
 
-            # Formatar o conteúdo - pode lançar UnsupportedFormatError ou FormattingFailedError
-            content = self.format(format_name, options)
+            # Obter o formatador - pode lançar UnsupportedFormatError
+            formatter = _formatter_factory().get_formatter(format_name)
 
-            # Salvar no arquivo
+            # Formatar diretamente no arquivo, sem montar o documento inteiro em memória
             try:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                formatter.format_to_file(self, output_file, options)
             except PermissionError as e:
                 raise FileError(f"Erro de permissão ao salvar arquivo {output_file}: {e}") from e
             except OSError as e:
                 raise FileError(f"Erro ao salvar arquivo {output_file}: {e}") from e
+            except Exception as e:
+                logger.error(f"Erro ao formatar transcrição como {format_name}: {e}")
+                raise FormattingFailedError(f"Erro ao formatar transcrição como {format_name}: {e}") from e
 
             logger.info(f"Transcrição salva em {output_file}")
             return True
@@ -148,14 +162,12 @@ class TranscriptionResult:
             Dict[str, bool]: Dicionário mapeando formatos para status de sucesso
         """
         results = {}
+        factory = _formatter_factory()
 
         for format_name in formats:
             try:
-                # Importar aqui para evitar importação circular
-                from src.formatters.formatter_factory import FormatterFactory
-
                 # Obter o formatador - pode lançar UnsupportedFormatError
-                formatter = FormatterFactory.get_formatter(format_name)
+                formatter = factory.get_formatter(format_name)
 
                 # Obter a extensão do arquivo para este formato
                 extension = formatter.get_file_extension()
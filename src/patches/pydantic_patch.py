@@ -4,110 +4,28 @@ Monkey patch for pydantic to make BaseSettings available from pydantic-settings.
 This patch is needed because AssemblyAI is trying to import BaseSettings from pydantic,
 but in Pydantic v2, BaseSettings has been moved to the pydantic-settings package.
 
-This patch also provides a default API key for the AssemblyAI Settings class during testing.
+This patch also provides a default API key for the AssemblyAI Settings class during testing
+(when pytest is loaded or AUTOMEETAI_TEST_MODE=1), without overriding a key that is already set.
 
 Additionally, this patch fixes issues with RawTranscriptionConfig in assemblyai 0.22.0,
 which requires all fields to be present in the constructor.
 """
 
 import sys
-import importlib.util
-import types
+import logging
 import os
-import functools
+import threading
+from functools import lru_cache
 from importlib.abc import MetaPathFinder, Loader
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
-# Direct monkey patch for RawTranscriptionConfig.__init__
-# This needs to be done before any other imports
-def patch_raw_transcription_config():
-    try:
-        # Try to import the module
-        import assemblyai.types
-
-        # Default values for all required fields
-        defaults = {
-            "language_code": "en_us",
-            "punctuate": True,
-            "format_text": True,
-            "dual_channel": False,
-            "webhook_url": None,
-            "webhook_auth_header_name": None,
-            "webhook_auth_header_value": None,
-            "audio_start_from": None,
-            "audio_end_at": None,
-            "word_boost": [],
-            "boost_param": None,
-            "filter_profanity": False,
-            "redact_pii": False,
-            "redact_pii_audio": False,
-            "redact_pii_policies": None,
-            "redact_pii_sub": None,
-            "speaker_labels": False,
-            "speakers_expected": None,
-            "content_safety": False,
-            "content_safety_confidence": None,
-            "iab_categories": False,
-            "custom_spelling": None,
-            "disfluencies": False,
-            "sentiment_analysis": False,
-            "auto_chapters": False,
-            "entity_detection": False,
-            "summarization": False,
-            "summary_model": None,
-            "summary_type": None,
-            "auto_highlights": False,
-            "language_detection": True,
-            "speech_threshold": None,
-            "speech_model": None,
-        }
-
-        # Get the original __init__ method
-        original_init = assemblyai.types.RawTranscriptionConfig.__init__
-
-        # Create a new __init__ method that provides default values
-        @functools.wraps(original_init)
-        def patched_init(self, **kwargs):
-            # Start with defaults and update with provided kwargs
-            all_kwargs = defaults.copy()
-            all_kwargs.update(kwargs)
-
-            # Call the original __init__ with all required fields
-            original_init(self, **all_kwargs)
-
-        # Replace the original __init__ with our patched version
-        assemblyai.types.RawTranscriptionConfig.__init__ = patched_init
-
-        # Also patch the Config class to address Pydantic deprecation warnings
-        if hasattr(assemblyai.types.RawTranscriptionConfig, 'Config'):
-            # Replace class-based Config with ConfigDict
-            from pydantic import ConfigDict
-            assemblyai.types.RawTranscriptionConfig.model_config = ConfigDict(extra='allow')
-
-        print("Successfully patched RawTranscriptionConfig.__init__")
-    except (ImportError, AttributeError) as e:
-        print(f"Failed to patch RawTranscriptionConfig.__init__: {e}")
-        # Module not available yet, will be patched later
-        pass
-
-# Try to patch immediately
-patch_raw_transcription_config()
-
-# Import BaseSettings from pydantic_settings
-try:
-    from pydantic_settings import BaseSettings
-except ImportError:
-    # If pydantic_settings is not available, log a warning
-    import logging
-    logging.warning("Could not import BaseSettings from pydantic_settings. "
-                   "Please install pydantic-settings package.")
-    BaseSettings = None
-
-# Set a default API key for testing
-os.environ["ASSEMBLYAI_API_KEY"] = "test_api_key_12345678901234567890"
+# Module logger; without a configured handler it stays silent instead of writing to stdout
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Default values for RawTranscriptionConfig fields
-RAW_TRANSCRIPTION_CONFIG_DEFAULTS: Dict[str, Any] = {
+_RAW_TRANSCRIPTION_CONFIG_DEFAULTS: Dict[str, Any] = {
     "language_code": "pt",
     "punctuate": True,
     "format_text": True,
@@ -143,154 +61,230 @@ RAW_TRANSCRIPTION_CONFIG_DEFAULTS: Dict[str, Any] = {
     "speech_model": None,
 }
 
-# Check if pydantic is already imported
-if 'pydantic' in sys.modules:
-    # If pydantic is already imported, we need to patch it
-    import pydantic
-
-    # Directly add BaseSettings to pydantic module's __dict__ to avoid triggering __getattr__
-    if BaseSettings is not None:
-        pydantic.__dict__['BaseSettings'] = BaseSettings
-
-        # Also patch the __getattr__ function to handle BaseSettings
-        if hasattr(pydantic, '__getattr__'):
-            original_getattr = pydantic.__getattr__
-
-            def patched_getattr(name):
-                if name == 'BaseSettings':
-                    return BaseSettings
-                return original_getattr(name)
-
-            pydantic.__getattr__ = patched_getattr
-
-    # Patch RawTranscriptionConfig in assemblyai.types if it's imported
-    if 'assemblyai' in sys.modules and 'assemblyai.types' in sys.modules:
-        import assemblyai.types
-
-        # Store the original __init__ method
-        original_init = assemblyai.types.RawTranscriptionConfig.__init__
-
-        # Create a patched __init__ method that uses default values
-        def patched_init(self, **kwargs):
-            # Merge defaults with provided kwargs
-            merged_kwargs = RAW_TRANSCRIPTION_CONFIG_DEFAULTS.copy()
-            merged_kwargs.update(kwargs)
-
-            # Call the original __init__ with all required fields
-            original_init(self, **merged_kwargs)
-
-        # Replace the original __init__ with our patched version
-        assemblyai.types.RawTranscriptionConfig.__init__ = patched_init
-else:
-    # If pydantic is not imported yet, we need to create a module finder
-    # that will patch pydantic when it's imported
-    class PydanticFinder(MetaPathFinder):
-        def find_spec(self, fullname, path, target=None):
-            if fullname == 'pydantic':
-                # Temporarily remove ourselves from sys.meta_path to avoid recursion
-                finder = self
-                sys.meta_path.remove(finder)
-                try:
-                    # Get the original spec
-                    spec = importlib.util.find_spec(fullname, path)
-                finally:
-                    # Add ourselves back to sys.meta_path
-                    sys.meta_path.insert(0, finder)
-
-                if spec:
-                    # Create a loader that will patch the module
-                    original_loader = spec.loader
-
-                    class PydanticLoader(Loader):
-                        def create_module(self, spec):
-                            return original_loader.create_module(spec)
-
-                        def exec_module(self, module):
-                            # Execute the original module
-                            original_loader.exec_module(module)
-
-                            # Patch the module
-                            if BaseSettings is not None:
-                                # Directly add BaseSettings to module's __dict__ to avoid triggering __getattr__
-                                module.__dict__['BaseSettings'] = BaseSettings
-
-                                # Also patch the __getattr__ function to handle BaseSettings
-                                if hasattr(module, '__getattr__'):
-                                    original_getattr = module.__getattr__
-
-                                    def patched_getattr(name):
-                                        if name == 'BaseSettings':
-                                            return BaseSettings
-                                        return original_getattr(name)
-
-                                    module.__getattr__ = patched_getattr
-
-                                # Also add a hook to patch assemblyai.types.RawTranscriptionConfig when it's imported
-                                def patch_assemblyai_types():
-                                    if 'assemblyai' in sys.modules and 'assemblyai.types' in sys.modules:
-                                        import assemblyai.types
-
-                                        # Store the original __init__ method
-                                        original_init = assemblyai.types.RawTranscriptionConfig.__init__
-
-                                        # Create a patched __init__ method that uses default values
-                                        def patched_init(self, **kwargs):
-                                            # Merge defaults with provided kwargs
-                                            merged_kwargs = RAW_TRANSCRIPTION_CONFIG_DEFAULTS.copy()
-                                            merged_kwargs.update(kwargs)
-
-                                            # Call the original __init__ with all required fields
-                                            original_init(self, **merged_kwargs)
-
-                                        # Replace the original __init__ with our patched version
-                                        assemblyai.types.RawTranscriptionConfig.__init__ = patched_init
-
-                                # Schedule the patch to run after this module is loaded
-                                import threading
-                                threading.Timer(0.1, patch_assemblyai_types).start()
-
-                    spec.loader = PydanticLoader()
-                    return spec
+# Read-only view of the defaults for external consumers; the patch merges the dict above
+RAW_TRANSCRIPTION_CONFIG_DEFAULTS: Mapping[str, Any] = MappingProxyType(_RAW_TRANSCRIPTION_CONFIG_DEFAULTS)
+
+
+def _make_patched_init(original_init, defaults):
+    """Wrap RawTranscriptionConfig.__init__ so that missing fields take the given defaults.
+
+    The set of default keys is computed once, and calls that already provide every
+    field skip the merge entirely.
+    """
+    default_keys = frozenset(defaults)
+
+    def patched_init(self, _original_init=original_init, _defaults=defaults, _default_keys=default_keys,
+                     **kwargs):
+        if _default_keys.issubset(kwargs):
+            return _original_init(self, **kwargs)
+
+        # Merge defaults with provided kwargs in a single dict display
+        _original_init(self, **{**_defaults, **kwargs})
+
+    return patched_init
+
+
+@lru_cache(maxsize=1)
+def _get_base_settings():
+    """Import BaseSettings from pydantic-settings on first use, or return None if it is missing."""
+    try:
+        from pydantic_settings import BaseSettings
+    except ImportError:
+        logger.warning("Could not import BaseSettings from pydantic_settings. "
+                       "Please install pydantic-settings package.")
+        return None
+    return BaseSettings
+
+
+def _make_patched_getattr(original_getattr, module_dict):
+    """Wrap a module-level __getattr__ so that it also resolves BaseSettings.
+
+    pydantic-settings is only imported the first time BaseSettings is requested. The
+    class is then stored in the module's __dict__, so later lookups skip __getattr__.
+    The wrapped function and the module dict are bound as default arguments, so each
+    call reads them as locals instead of closure cells or module globals.
+    """
+    def patched_getattr(name, _original_getattr=original_getattr, _module_dict=module_dict):
+        # String equality checks identity first, so the interned literal matches immediately
+        if name == 'BaseSettings':
+            base_settings = _get_base_settings()
+            if base_settings is not None:
+                _module_dict['BaseSettings'] = base_settings
+                return base_settings
+        return _original_getattr(name)
+
+    return patched_getattr
+
+
+def patch_pydantic_module(module):
+    """Make BaseSettings available as an attribute of the given pydantic module.
+
+    The module is left untouched if it already defines BaseSettings (natively or from an
+    earlier patch), and its __getattr__ is never wrapped twice.
+    """
+    module_dict = module.__dict__
+    existing = module_dict.get('BaseSettings')
+    if existing is not None:
+        logger.debug(f"pydantic.BaseSettings already bound to {existing!r}")
+        return
+
+    # Read __getattr__ from the module dict: hasattr() would itself go through the module __getattr__
+    original_getattr = module_dict.get('__getattr__')
+    if getattr(original_getattr, '_automeetai_patched', False):
+        return
+    if original_getattr is not None:
+        # Resolve BaseSettings lazily through the module's __getattr__
+        patched_getattr = _make_patched_getattr(original_getattr, module_dict)
+        patched_getattr._automeetai_patched = True
+        module.__getattr__ = patched_getattr
+        return
+
+    # Without a module __getattr__ to hook, add BaseSettings to the module's __dict__ right away
+    base_settings = _get_base_settings()
+    if base_settings is not None:
+        module_dict['BaseSettings'] = base_settings
+
+
+def patch_raw_transcription_config_defaults(types_module):
+    """Fill missing RawTranscriptionConfig fields with RAW_TRANSCRIPTION_CONFIG_DEFAULTS.
+
+    The patch is applied at most once: calling this again is a no-op, so repeated
+    triggers never stack wrappers around __init__.
+    """
+    config_class = getattr(types_module, 'RawTranscriptionConfig', None)
+    if config_class is None or getattr(config_class.__init__, '_automeetai_defaults', False):
+        return
+
+    # Store the original __init__ method
+    original_init = config_class.__init__
+
+    # Create a patched __init__ method that uses default values
+    patched_init = _make_patched_init(original_init, _RAW_TRANSCRIPTION_CONFIG_DEFAULTS)
+    # Copy only the naming attributes: without __wrapped__, signature introspection
+    # resolves patched_init directly instead of following the wrapper chain
+    patched_init.__name__ = '__init__'
+    patched_init.__qualname__ = original_init.__qualname__
+    patched_init.__doc__ = original_init.__doc__
+    patched_init._automeetai_defaults = True
+
+    # Replace the original __init__ with our patched version
+    config_class.__init__ = patched_init
+
+
+def patch_assemblyai_types(types_module):
+    """Apply the RawTranscriptionConfig patches to a loaded assemblyai.types module."""
+    patch_raw_transcription_config_defaults(types_module)
+
+    # Also patch the Config class to address Pydantic deprecation warnings. Only Pydantic v2
+    # models read model_config; the pydantic.v1 models used by assemblyai are left as they are
+    config_class = getattr(types_module, 'RawTranscriptionConfig', None)
+    if config_class is not None and hasattr(config_class, 'Config') and isinstance(
+            getattr(config_class, 'model_config', None), dict):
+        # Replace class-based Config with ConfigDict, deferring schema construction until first use
+        from pydantic import ConfigDict
+        config_class.model_config = ConfigDict(extra='allow', defer_build=True)
+
+
+# Patches applied to each module right after it is executed, keyed by module name
+POST_IMPORT_PATCHES = {
+    'pydantic': patch_pydantic_module,
+    'assemblyai.types': patch_assemblyai_types,
+}
+
+
+class PydanticLoader(Loader):
+    """Loader that runs the original loader and then applies a post-import patch."""
+
+    def __init__(self, original_loader, patch):
+        self._original_loader = original_loader
+        self._patch = patch
+
+    def create_module(self, spec):
+        return self._original_loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Execute the original module
+        self._original_loader.exec_module(module)
+
+        # Patch the module
+        self._patch(module)
+
+
+# Per-thread reentrancy flag set while PydanticFinder resolves the original spec
+_finder_state = threading.local()
+
+
+class PydanticFinder(MetaPathFinder):
+    """Meta path finder that patches pydantic and assemblyai.types as soon as they are loaded.
+
+    Once every module of POST_IMPORT_PATCHES that was not loaded yet has been matched, the
+    finder removes itself from sys.meta_path, so later imports no longer go through it.
+    """
+
+    def __init__(self):
+        self._pending = {name for name in POST_IMPORT_PATCHES if name not in sys.modules}
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in self._pending or getattr(_finder_state, 'active', False):
             return None
 
-    # Register the finder
-    sys.meta_path.insert(0, PydanticFinder())
+        # Get the original spec, skipping ourselves on the nested lookup instead of
+        # removing and re-inserting the finder in sys.meta_path
+        import importlib.util
 
-    # Direct patch for assemblyai.types module
-    def patch_assemblyai_types_module():
+        _finder_state.active = True
         try:
-            import assemblyai.types
+            spec = importlib.util.find_spec(fullname)
+        finally:
+            _finder_state.active = False
+
+        if spec is None or spec.loader is None:
+            return None
+
+        # Wrap the original loader so that it patches the module
+        spec.loader = PydanticLoader(spec.loader, POST_IMPORT_PATCHES[fullname])
 
-            # Check if RawTranscriptionConfig exists
-            if hasattr(assemblyai.types, 'RawTranscriptionConfig'):
-                # Store the original __init__ method
-                original_init = assemblyai.types.RawTranscriptionConfig.__init__
+        self._pending.discard(fullname)
+        if not self._pending:
+            try:
+                sys.meta_path.remove(self)
+            except ValueError:
+                pass
+        return spec
 
-                # Create a patched __init__ method that uses default values
-                def patched_init(self, **kwargs):
-                    # Merge defaults with provided kwargs
-                    merged_kwargs = RAW_TRANSCRIPTION_CONFIG_DEFAULTS.copy()
-                    merged_kwargs.update(kwargs)
 
-                    # Call the original __init__ with all required fields
-                    original_init(self, **merged_kwargs)
+# Direct monkey patch for RawTranscriptionConfig.__init__
+def patch_raw_transcription_config():
+    # Reuse the loaded module when possible. Otherwise import it now, before BaseSettings is
+    # injected into pydantic, so assemblyai keeps binding its pydantic.v1 models
+    types_module = sys.modules.get('assemblyai.types')
+    try:
+        if types_module is None:
+            import assemblyai.types as types_module
 
-                # Replace the original __init__ with our patched version
-                assemblyai.types.RawTranscriptionConfig.__init__ = patched_init
+        patch_assemblyai_types(types_module)
 
-                # Also patch the Config class to address Pydantic deprecation warnings
-                if hasattr(assemblyai.types.RawTranscriptionConfig, 'Config'):
-                    # Replace class-based Config with ConfigDict
-                    from pydantic import ConfigDict
-                    assemblyai.types.RawTranscriptionConfig.model_config = ConfigDict(extra='allow')
+        logger.debug("Successfully patched RawTranscriptionConfig.__init__")
+    except (ImportError, AttributeError) as e:
+        logger.warning(f"Failed to patch RawTranscriptionConfig.__init__: {e}")
+        # Module not available yet, will be patched by PydanticFinder when imported
+        pass
+
+
+# Try to patch immediately
+patch_raw_transcription_config()
 
-        except (ImportError, AttributeError):
-            # Module not available yet, will be patched later
-            pass
+# Set a default API key for testing, keeping any real key provided by the environment
+_TEST_MODE = os.environ.get("AUTOMEETAI_TEST_MODE") == "1" or "pytest" in sys.modules
+if _TEST_MODE:
+    os.environ.setdefault("ASSEMBLYAI_API_KEY", "test_api_key_12345678901234567890")
 
-    # Try to patch immediately
-    patch_assemblyai_types_module()
+# Patch the modules that are already imported
+_pydantic_module = sys.modules.get('pydantic')
+if _pydantic_module is not None:
+    patch_pydantic_module(_pydantic_module)
 
-    # Also schedule a delayed patch to ensure it runs after all imports
-    import threading
-    threading.Timer(1.0, patch_assemblyai_types_module).start()
+# Register the finder for the modules that are not imported yet, unless one is already installed
+if any(name not in sys.modules for name in POST_IMPORT_PATCHES):
+    if not any(type(finder).__name__ == 'PydanticFinder' for finder in sys.meta_path):
+        sys.meta_path.insert(0, PydanticFinder())
@@ -2,6 +2,7 @@ from typing import Optional, Dict, Any, List, Union, Callable
 import time
 import threading
 import queue
+import socket
 import websocket
 import json
 import base64
@@ -16,6 +17,26 @@ try:
 except ImportError:
     PYAUDIO_AVAILABLE = False
 
+# pybase64 é opcional: quando disponível, codifica o áudio em base64 com instruções SIMD
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    _b64encode = base64.b64encode
+
+# orjson é opcional: quando disponível, decodifica as mensagens recebidas e codifica a configuração
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decoder e encoder JSON escolhidos uma única vez, na importação (ws.send aceita str ou bytes)
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
 from src.interfaces.streaming_transcription_service import StreamingTranscriptionService
 from src.interfaces.config_provider import ConfigProvider
 from src.utils.logging import get_logger
@@ -47,6 +68,31 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
     CHUNK = 1024
     FORMAT = pyaudio.paInt16 if PYAUDIO_AVAILABLE else 8  # 8 is the value for paInt16
 
+    # Quantidade máxima de áudio bruto (em bytes) agrupada em uma única mensagem do WebSocket
+    MAX_BATCH_BYTES = 16384
+
+    # Quantidade máxima de fragmentos aguardando envio; ao atingi-la, quem produz o áudio
+    # espera até SEND_QUEUE_TIMEOUT segundos, acompanhando a velocidade da rede
+    MAX_QUEUED_CHUNKS = 64
+    SEND_QUEUE_TIMEOUT = 5
+
+    # Moldura JSON das mensagens de áudio; o base64 não precisa de escape dentro da string JSON
+    AUDIO_PAYLOAD_PREFIX = b'{"audio_data":"'
+    AUDIO_PAYLOAD_SUFFIX = b'"}'
+
+    # Mensagem que pede ao servidor para encerrar a sessão
+    TERMINATE_PAYLOAD = b'{"terminate_session":true}'
+
+    # Opções do socket do WebSocket: desativa o algoritmo de Nagle para que os fragmentos
+    # de áudio e os resultados parciais não esperem pelo ACK atrasado do TCP
+    SOCKET_OPTIONS = ((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),)
+
+    # Tempo máximo (em segundos) de espera pela abertura da conexão WebSocket
+    CONNECT_TIMEOUT = 5
+
+    # Tempo máximo (em segundos) de espera por um resultado final após o fim de um arquivo
+    FINAL_RESULT_TIMEOUT = 1
+
     def __init__(self, config_provider: Optional[ConfigProvider] = None):
         """
         Inicializa o serviço de transcrição em streaming.
@@ -57,10 +103,13 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
         self.config_provider = config_provider
         self.session = StreamingSession()
         self.ws = None
-        self.audio_queue = queue.Queue()
+        self.audio_queue = queue.Queue(maxsize=self.MAX_QUEUED_CHUNKS)
         self.stop_threads = False
-        self.audio_thread = None
+        self.result_callback = None
         self.processing_thread = None
+        self.sender_thread = None
+        self._open_event = threading.Event()
+        self._final_event = threading.Event()
         self.pyaudio_instance = None
         self.stream = None
 
@@ -126,7 +175,15 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
             if config:
                 self.streaming_config.update(config)
 
-            # Configura o WebSocket
+            # Serializa uma única vez a configuração enviada na abertura da conexão
+            self._config_payload = _dumps({
+                "sample_rate": self.streaming_config["sample_rate"],
+                "language_code": self.streaming_config["language_code"],
+                "enable_speaker_diarization": self.streaming_config["speaker_labels"]
+            })
+
+            # Configura o WebSocket; _on_open sinaliza o evento quando a conexão é aberta
+            self._open_event = threading.Event()
             self.ws = websocket.WebSocketApp(
                 self.ASSEMBLYAI_STREAMING_URL,
                 on_open=self._on_open,
@@ -137,12 +194,28 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
             )
 
             # Inicia o WebSocket em uma thread separada
-            self.processing_thread = threading.Thread(target=self.ws.run_forever)
+            self.processing_thread = threading.Thread(
+                target=self.ws.run_forever,
+                kwargs={"sockopt": self.SOCKET_OPTIONS}
+            )
             self.processing_thread.daemon = True
             self.processing_thread.start()
 
-            # Aguarda a conexão ser estabelecida
-            time.sleep(1)
+            # Aguarda a conexão ser estabelecida (ou encerrada com erro)
+            if not self._open_event.wait(timeout=self.CONNECT_TIMEOUT):
+                self.logger.error(f"Tempo esgotado ao conectar ao WebSocket ({self.CONNECT_TIMEOUT}s).")
+                self.session.is_active = False
+                self.ws.close()
+                return False
+
+            if not self.session.is_active:
+                return False
+
+            # Inicia a thread que agrupa e envia os fragmentos de áudio da sessão
+            self.audio_queue = queue.Queue(maxsize=self.MAX_QUEUED_CHUNKS)
+            self.sender_thread = threading.Thread(target=self._send_audio_loop, args=(self.ws, self.audio_queue))
+            self.sender_thread.daemon = True
+            self.sender_thread.start()
 
             return self.session.is_active
 
@@ -166,16 +239,9 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
                 self.logger.error("Nenhuma sessão de streaming ativa.")
                 return None
 
-            # Envia o fragmento de áudio para o WebSocket
+            # Enfileira o fragmento de áudio para a thread de envio do WebSocket
             if self.ws and self.ws.sock and self.ws.sock.connected:
-                # Codifica o áudio em base64
-                audio_base64 = base64.b64encode(audio_chunk).decode("utf-8")
-
-                # Cria o payload
-                payload = json.dumps({"audio_data": audio_base64})
-
-                # Envia o payload
-                self.ws.send(payload)
+                self.audio_queue.put(audio_chunk, timeout=self.SEND_QUEUE_TIMEOUT)
 
                 # Retorna o último resultado parcial, se houver
                 if self.session.partial_results:
@@ -205,17 +271,25 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
             self.session.is_active = False
             self.session.end_time = time.time()
 
-            # Fecha o WebSocket
-            if self.ws:
-                self.ws.close()
-
-            # Interrompe as threads
+            # Interrompe a captura de áudio
             self.stop_threads = True
 
-            # Aguarda as threads terminarem
-            if self.audio_thread and self.audio_thread.is_alive():
-                self.audio_thread.join(timeout=2)
+            # Envia todos os fragmentos de áudio pendentes antes de encerrar a sessão
+            if self.sender_thread and self.sender_thread.is_alive():
+                self.audio_queue.put(None)
+                self.sender_thread.join()
 
+            # Encerra a sessão no servidor e fecha o WebSocket
+            if self.ws:
+                if self.ws.sock and self.ws.sock.connected:
+                    try:
+                        self.ws.send(self.TERMINATE_PAYLOAD, opcode=websocket.ABNF.OPCODE_TEXT)
+                    except Exception as e:
+                        self.logger.warning(f"Erro ao encerrar a sessão de streaming: {e}")
+                self.ws.close()
+            self.result_callback = None
+
+            # Aguarda a thread do WebSocket terminar
             if self.processing_thread and self.processing_thread.is_alive():
                 self.processing_thread.join(timeout=2)
 
@@ -265,59 +339,38 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
                 self.logger.error("PyAudio is not available. Cannot capture audio from microphone.")
                 return None
 
+            # Os resultados recebidos do WebSocket são repassados ao callback
+            self.result_callback = callback
+
             # Inicia a sessão de streaming
             if not self.start_streaming(config):
                 self.logger.error("Falha ao iniciar a sessão de streaming.")
+                self.result_callback = None
                 return None
 
+            # Reinicia a flag de parada
+            self.stop_threads = False
+
             # Inicializa PyAudio
             self.pyaudio_instance = pyaudio.PyAudio()
 
-            # Abre o stream de áudio
+            # Abre o stream de áudio em modo callback: o PortAudio entrega cada fragmento
+            # capturado a _on_audio, que apenas o enfileira para a thread de envio
             self.stream = self.pyaudio_instance.open(
                 format=self.FORMAT,
                 channels=self.CHANNELS,
                 rate=self.RATE,
                 input=True,
-                frames_per_buffer=self.CHUNK
+                frames_per_buffer=self.CHUNK,
+                stream_callback=self._on_audio
             )
 
-            # Reinicia a flag de parada
-            self.stop_threads = False
-
-            # Função para capturar áudio do microfone
-            def audio_capture():
-                start_time = time.time()
-
-                while not self.stop_threads:
-                    # Verifica se atingiu a duração máxima
-                    if duration and time.time() - start_time > duration:
-                        break
-
-                    # Lê um fragmento de áudio
-                    audio_chunk = self.stream.read(self.CHUNK, exception_on_overflow=False)
-
-                    # Transcreve o fragmento
-                    result = self.transcribe_chunk(audio_chunk)
-
-                    # Chama o callback com o resultado
-                    if result:
-                        callback(result)
-
-                # Finaliza a sessão quando terminar
-                self.stop_streaming()
-
-            # Inicia a thread de captura de áudio
-            self.audio_thread = threading.Thread(target=audio_capture)
-            self.audio_thread.daemon = True
-            self.audio_thread.start()
-
             # Se a duração for especificada, aguarda até o final
             if duration:
                 time.sleep(duration)
                 return self.stop_streaming()
 
-            # Caso contrário, retorna None e deixa a thread rodando
+            # Caso contrário, retorna None e deixa a captura rodando
             return None
 
         except Exception as e:
@@ -325,6 +378,76 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
             self.stop_streaming()
             return None
 
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        """
+        Callback do PyAudio chamado na thread de áudio do PortAudio a cada fragmento capturado.
+
+        Args:
+            in_data: O fragmento de áudio capturado
+            frame_count: Número de quadros do fragmento
+            time_info: Informações de tempo do PortAudio
+            status: Flags de status do PortAudio
+
+        Returns:
+            tuple: Dados de saída (nenhum) e a flag que indica se a captura deve continuar
+        """
+        if self.stop_threads:
+            return None, pyaudio.paComplete
+
+        if self.session.is_active:
+            # A thread de áudio não pode bloquear: com a fila cheia, o fragmento é descartado
+            try:
+                self.audio_queue.put_nowait(in_data)
+            except queue.Full:
+                self.logger.warning("Fila de envio de áudio cheia; fragmento do microfone descartado.")
+        return None, pyaudio.paContinue
+
+    def _send_audio_loop(self, ws, audio_queue: queue.Queue) -> None:
+        """
+        Envia os fragmentos de áudio enfileirados, agrupando os pendentes em uma única mensagem.
+
+        Os fragmentos já disponíveis na fila são concatenados (até cerca de MAX_BATCH_BYTES)
+        e codificados em base64 uma única vez, de modo que vários fragmentos do microfone
+        ou do arquivo viajam em um só quadro WebSocket. Cada fragmento é marcado como concluído
+        (``task_done``) após o envio, de modo que ``audio_queue.join()`` aguarda o esvaziamento
+        completo da fila. A thread termina ao receber None.
+
+        Args:
+            ws: O objeto WebSocket da sessão
+            audio_queue: Fila de fragmentos de áudio da sessão
+        """
+        running = True
+        while running:
+            audio_chunk = audio_queue.get()
+            if audio_chunk is None:
+                audio_queue.task_done()
+                break
+
+            # Drena os fragmentos pendentes sem bloquear
+            batch = [audio_chunk]
+            batch_size = len(audio_chunk)
+            while batch_size < self.MAX_BATCH_BYTES:
+                try:
+                    audio_chunk = audio_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if audio_chunk is None:
+                    audio_queue.task_done()
+                    running = False
+                    break
+                batch.append(audio_chunk)
+                batch_size += len(audio_chunk)
+
+            try:
+                # Monta o payload JSON diretamente em bytes com o áudio agrupado em base64
+                payload = b"".join((self.AUDIO_PAYLOAD_PREFIX, _b64encode(b"".join(batch)), self.AUDIO_PAYLOAD_SUFFIX))
+                ws.send(payload, opcode=websocket.ABNF.OPCODE_TEXT)
+            except Exception as e:
+                self.logger.error(f"Erro ao enviar áudio: {e}")
+            finally:
+                for _ in batch:
+                    audio_queue.task_done()
+
     def _on_open(self, ws):
         """
         Callback chamado quando a conexão WebSocket é aberta.
@@ -334,14 +457,9 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
         """
         self.logger.info("Conexão WebSocket estabelecida.")
 
-        # Envia a configuração inicial
-        config_payload = {
-            "sample_rate": self.streaming_config["sample_rate"],
-            "language_code": self.streaming_config["language_code"],
-            "enable_speaker_diarization": self.streaming_config["speaker_labels"]
-        }
-
-        ws.send(json.dumps(config_payload))
+        # Envia a configuração inicial, serializada em start_streaming
+        ws.send(self._config_payload, opcode=websocket.ABNF.OPCODE_TEXT)
+        self._open_event.set()
 
     def _on_message(self, ws, message):
         """
@@ -353,22 +471,30 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
         """
         try:
             # Decodifica a mensagem JSON
-            data = json.loads(message)
+            data = _loads(message)
 
             # Verifica se é um resultado de transcrição
             if "text" in data:
                 # Cria um objeto StreamingTranscriptionResult
+                speaker = data.get("speaker")
                 result = StreamingTranscriptionResult(
-                    text=data.get("text", ""),
+                    text=data["text"],
                     is_final=data.get("message_type") == "FinalTranscript",
                     confidence=data.get("confidence", 1.0),
-                    speaker=f"Speaker {data.get('speaker')}" if data.get('speaker') else None,
+                    speaker=f"Speaker {speaker}" if speaker else None,
                     start_time=data.get("start", None),
                     end_time=data.get("end", None)
                 )
 
                 # Adiciona o resultado à sessão
                 self.session.add_result(result)
+                if result.is_final:
+                    self._final_event.set()
+
+                # Repassa o resultado ao callback da captura do microfone, se houver
+                result_callback = self.result_callback
+                if result_callback:
+                    result_callback(result.to_dict())
 
                 self.logger.debug(f"Recebido: {result.text} (final: {result.is_final})")
 
@@ -385,6 +511,7 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
         """
         self.logger.error(f"Erro no WebSocket: {error}")
         self.session.is_active = False
+        self._open_event.set()
 
     def _on_close(self, ws, close_status_code, close_msg):
         """
@@ -397,6 +524,7 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
         """
         self.logger.info(f"Conexão WebSocket fechada: {close_msg} (código: {close_status_code})")
         self.session.is_active = False
+        self._open_event.set()
 
     def stream_file(self, 
                   audio_file: str,
@@ -412,7 +540,8 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
 
         Args:
             audio_file: Caminho para o arquivo de áudio a ser transcrito
-            chunk_size: Tamanho dos fragmentos de áudio em bytes
+            chunk_size: Número mínimo de quadros lidos do arquivo por fragmento (fragmentos
+                menores que MAX_BATCH_BYTES são ampliados até esse tamanho)
             callback: Função de callback chamada com cada resultado parcial
             progress_callback: Função de callback para reportar o progresso (0-100)
             config: Parâmetros de configuração opcionais para a transcrição
@@ -445,6 +574,10 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
                     # Calcula o tamanho total do arquivo em bytes
                     total_size = n_frames * sample_width * channels
 
+                    # Lê fragmentos de pelo menos MAX_BATCH_BYTES: o envio do arquivo é limitado pela
+                    # vazão, e fragmentos maiores reduzem as iterações, codificações e quadros enviados
+                    frames_per_chunk = max(chunk_size, self.MAX_BATCH_BYTES // (sample_width * channels))
+
                     # Ajusta a configuração com base nas informações do arquivo
                     streaming_config = {
                         "language_code": DEFAULT_LANGUAGE_CODE,
@@ -479,7 +612,7 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
 
                     while not self.stop_threads:
                         # Lê um chunk do arquivo
-                        audio_chunk = wf.readframes(chunk_size)
+                        audio_chunk = wf.readframes(frames_per_chunk)
 
                         # Se não há mais dados, termina o loop
                         if not audio_chunk:
@@ -501,8 +634,11 @@ class AssemblyAIStreamingTranscriptionService(StreamingTranscriptionService):
                             progress_callback(progress, f"Processando arquivo... {int(progress)}%")
                             last_progress = progress
 
-                    # Aguarda um pouco para garantir que todos os resultados foram processados
-                    time.sleep(1)
+                    # Aguarda o envio de todos os fragmentos enfileirados e, em seguida, o próximo
+                    # resultado final (ou o tempo máximo) com a transcrição dos últimos fragmentos
+                    self.audio_queue.join()
+                    self._final_event.clear()
+                    self._final_event.wait(timeout=self.FINAL_RESULT_TIMEOUT)
 
                     # Finaliza a sessão de streaming
                     if progress_callback:
@@ -0,0 +1,273 @@
+import os
+import ast
+import json
+import tempfile
+from typing import Dict, Any, List, Optional, Set
+
+from src.utils.logging import get_logger
+from src.utils.file_utils import ensure_directory_exists
+
+# Initialize logger for this module
+logger = get_logger(__name__)
+
+# Propriedades do plugin cujo valor literal é extraído estaticamente
+_STRING_PROPERTIES = ("name", "version", "description")
+
+# Pacote das interfaces da aplicação; suas classes, exceto as do módulo de Plugin,
+# não herdam de Plugin e podem ser usadas como base sem exigir a importação do módulo
+_INTERFACES_PACKAGE = "src.interfaces."
+_PLUGIN_MODULE = "src.interfaces.plugin"
+
+
+class _PluginClassVisitor(ast.NodeVisitor):
+    """
+    Visitante AST que extrai os metadados de subclasses de Plugin sem importar o módulo.
+
+    Só são considerados metadados definidos por literais (por exemplo, ``return "1.0.0"``).
+    Se algum metadado não puder ser resolvido estaticamente, a classe é marcada como
+    não estática e o módulo precisará ser importado para ser registrado. O mesmo vale
+    para classes com outras bases, que podem herdar de Plugin indiretamente, exceto
+    quando a base é ``object``, uma interface importada de ``src.interfaces`` (fora do
+    módulo de Plugin) ou uma classe local que também não herda de Plugin.
+    """
+
+    def __init__(self):
+        self.plugins: List[Dict[str, Any]] = []
+        self.static = True
+        self._imports: Dict[str, str] = {}
+        self._local_classes: Dict[str, ast.ClassDef] = {}
+
+    def visit_Module(self, node: ast.Module) -> None:
+        # Os imports e as classes do módulo são coletados antes das classes serem
+        # analisadas, para que as bases possam ser resolvidas independente da ordem
+        for item in node.body:
+            if isinstance(item, ast.Import):
+                for alias in item.names:
+                    if alias.asname:
+                        self._imports[alias.asname] = alias.name
+                    else:
+                        head = alias.name.split(".")[0]
+                        self._imports[head] = head
+            elif isinstance(item, ast.ImportFrom) and item.module and not item.level:
+                for alias in item.names:
+                    self._imports[alias.asname or alias.name] = f"{item.module}.{alias.name}"
+            elif isinstance(item, ast.ClassDef):
+                self._local_classes[item.name] = item
+        self.generic_visit(node)
+
+    @staticmethod
+    def _is_plugin_base(base: ast.expr) -> bool:
+        if isinstance(base, ast.Name):
+            return base.id == "Plugin"
+        if isinstance(base, ast.Attribute):
+            return base.attr == "Plugin"
+        return False
+
+    @staticmethod
+    def _literal_return(func: ast.FunctionDef) -> Any:
+        for node in func.body:
+            if isinstance(node, ast.Return) and node.value is not None:
+                try:
+                    return ast.literal_eval(node.value)
+                except ValueError:
+                    return None
+        return None
+
+    def _qualified_name(self, base: ast.expr) -> Optional[str]:
+        if isinstance(base, ast.Name):
+            return self._imports.get(base.id)
+        if isinstance(base, ast.Attribute):
+            owner = self._qualified_name(base.value)
+            return f"{owner}.{base.attr}" if owner else None
+        return None
+
+    def _is_safe_base(self, base: ast.expr, seen: Set[str]) -> bool:
+        """
+        Indica se a base certamente não herda de Plugin.
+
+        Args:
+            base: Expressão da base da classe
+            seen: Classes locais já visitadas, para evitar ciclos
+
+        Returns:
+            bool: True se a base for ``object``, uma interface que não é Plugin ou uma
+            classe local cujas bases também são seguras
+        """
+        if self._is_plugin_base(base):
+            return False
+        if isinstance(base, ast.Name):
+            if base.id == "object":
+                return True
+            local_class = self._local_classes.get(base.id)
+            if local_class is not None and base.id not in self._imports:
+                if base.id in seen:
+                    return False
+                seen.add(base.id)
+                return all(self._is_safe_base(parent, seen) for parent in local_class.bases)
+
+        qualified_name = self._qualified_name(base)
+        if qualified_name is None or not qualified_name.startswith(_INTERFACES_PACKAGE):
+            return False
+        return qualified_name.rsplit(".", 1)[0] != _PLUGIN_MODULE
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        if not any(self._is_plugin_base(base) for base in node.bases):
+            # Uma base definida em outro módulo pode ser subclasse de Plugin: só a importação resolve
+            if not all(self._is_safe_base(base, {node.name}) for base in node.bases):
+                self.static = False
+            return
+
+        methods = {
+            item.name: item for item in node.body
+            if isinstance(item, ast.FunctionDef)
+        }
+
+        metadata: Dict[str, Any] = {"class_name": node.name}
+        for prop in _STRING_PROPERTIES:
+            value = self._literal_return(methods[prop]) if prop in methods else None
+            if not isinstance(value, str):
+                self.static = False
+                return
+            metadata[prop] = value
+
+        extension_points = None
+        if "get_extension_points" in methods:
+            extension_points = self._literal_return(methods["get_extension_points"])
+        if not isinstance(extension_points, (list, tuple)) or not all(isinstance(ep, str) for ep in extension_points):
+            self.static = False
+            return
+        metadata["extension_points"] = list(extension_points)
+
+        self.plugins.append(metadata)
+
+
+class PluginIndex:
+    """
+    Índice persistente de metadados dos plugins de um diretório.
+
+    O índice é armazenado em JSON e guarda, para cada arquivo de plugin, o
+    ``mtime`` e o tamanho do arquivo junto com os metadados extraídos via AST.
+    Somente arquivos novos ou modificados são analisados novamente, de modo que
+    a descoberta de plugins custa uma chamada ``stat`` por arquivo no caso comum.
+    """
+
+    VERSION = 2
+
+    def __init__(self, index_file: str = os.path.join("cache", "plugins_index.json")):
+        """
+        Inicializa o índice de plugins.
+
+        Args:
+            index_file: Caminho do arquivo JSON onde o índice é persistido
+        """
+        self.index_file = index_file
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Carrega o índice persistido, descartando-o se estiver corrompido ou desatualizado.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Entradas do índice, indexadas pelo caminho do arquivo
+        """
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignorando índice de plugins inválido {self.index_file}: {e}")
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return {}
+        return data.get("files", {})
+
+    def _save(self) -> None:
+        """
+        Persiste o índice de forma atômica (escrita em arquivo temporário + ``os.replace``).
+        """
+        index_dir = os.path.dirname(self.index_file) or "."
+        try:
+            ensure_directory_exists(index_dir)
+            fd, temp_path = tempfile.mkstemp(dir=index_dir, prefix=".plugins_index_", suffix=".json")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({"version": self.VERSION, "files": self._entries}, f, indent=2)
+                os.replace(temp_path, self.index_file)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Não foi possível salvar o índice de plugins {self.index_file}: {e}")
+
+    @staticmethod
+    def _parse(module_path: str) -> Dict[str, Any]:
+        """
+        Extrai os metadados dos plugins de um arquivo sem importá-lo.
+
+        Args:
+            module_path: Caminho do arquivo Python do plugin
+
+        Returns:
+            Dict[str, Any]: Metadados extraídos (``static`` indica se todos foram resolvidos)
+        """
+        try:
+            with open(module_path, 'rb') as f:
+                tree = ast.parse(f.read(), filename=module_path)
+        except (OSError, SyntaxError, ValueError) as e:
+            logger.warning(f"Não foi possível analisar o plugin {module_path}: {e}")
+            return {"static": False, "plugins": []}
+
+        visitor = _PluginClassVisitor()
+        visitor.visit(tree)
+        return {"static": visitor.static, "plugins": visitor.plugins}
+
+    def refresh(self, plugin_dir: str) -> List[Dict[str, Any]]:
+        """
+        Atualiza o índice com o conteúdo atual do diretório de plugins.
+
+        Arquivos cujo ``mtime`` e tamanho não mudaram reutilizam a entrada persistida;
+        os demais são analisados novamente. Entradas de arquivos removidos são descartadas.
+
+        Args:
+            plugin_dir: Diretório onde procurar plugins
+
+        Returns:
+            List[Dict[str, Any]]: Uma entrada por arquivo, com as chaves ``module_name``,
+            ``module_path``, ``static`` e ``plugins``
+        """
+        ensure_directory_exists(plugin_dir)
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        changed = False
+
+        with os.scandir(plugin_dir) as it:
+            for dir_entry in sorted(it, key=lambda e: e.name):
+                filename = dir_entry.name
+                if not filename.endswith(".py") or filename.startswith("__") or not dir_entry.is_file():
+                    continue
+
+                module_path = os.path.join(plugin_dir, filename)
+                stat = dir_entry.stat()
+                cached = self._entries.get(module_path)
+
+                if cached and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+                    entries[module_path] = cached
+                    continue
+
+                entry = self._parse(module_path)
+                entry["module_name"] = filename[:-3]
+                entry["mtime_ns"] = stat.st_mtime_ns
+                entry["size"] = stat.st_size
+                entries[module_path] = entry
+                changed = True
+
+        if changed or entries.keys() != self._entries.keys():
+            self._entries = entries
+            self._save()
+
+        return [
+            {"module_path": module_path, **entry}
+            for module_path, entry in entries.items()
+        ]
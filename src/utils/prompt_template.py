@@ -0,0 +1,50 @@
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Marcador substituído pelo texto da transcrição nos modelos de prompt
+_PLACEHOLDER = "{transcription}"
+
+
+@lru_cache(maxsize=64)
+def split_template(template: str) -> Optional[Tuple[str, str]]:
+    """
+    Divide um modelo de prompt em prefixo e sufixo ao redor de ``{transcription}``.
+
+    Args:
+        template: Modelo de prompt no formato aceito por ``str.format``
+
+    Returns:
+        Optional[Tuple[str, str]]: O prefixo e o sufixo, ou None se o modelo tiver
+        outros campos, chaves escapadas ou nenhum marcador (casos tratados por ``str.format``)
+    """
+    if template.count(_PLACEHOLDER) != 1:
+        return None
+
+    prefix, suffix = template.split(_PLACEHOLDER)
+    if any(brace in part for part in (prefix, suffix) for brace in "{}"):
+        return None
+    return prefix, suffix
+
+
+def render_prompt(template: str, transcription: str) -> str:
+    """
+    Formata um modelo de prompt com o texto da transcrição.
+
+    Equivale a ``template.format(transcription=transcription)``, mas modelos com um
+    único marcador são resolvidos por concatenação, sem analisar o modelo a cada chamada.
+
+    Args:
+        template: Modelo de prompt no formato aceito por ``str.format``
+        transcription: Texto da transcrição
+
+    Returns:
+        str: O prompt formatado
+
+    Raises:
+        KeyError: Se o modelo referenciar outros campos
+        ValueError: Se o modelo for inválido
+    """
+    parts = split_template(template)
+    if parts is None:
+        return template.format(transcription=transcription)
+    return parts[0] + transcription + parts[1]
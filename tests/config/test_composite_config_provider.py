@@ -0,0 +1,44 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.config.composite_config_provider import CompositeConfigProvider
+from src.config.env_config_provider import EnvConfigProvider
+from src.config.user_preferences_provider import UserPreferencesProvider
+
+
+class TestCompositeConfigProviderUpdate(unittest.TestCase):
+    """Test cases for bulk updates through CompositeConfigProvider."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.preferences_file = os.path.join(self.temp_dir.name, "preferences.json")
+        self.env_provider = EnvConfigProvider()
+        self.user_provider = UserPreferencesProvider(self.preferences_file)
+        self.provider = CompositeConfigProvider([self.env_provider, self.user_provider])
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_update_sets_values_in_all_providers(self):
+        self.provider.update({"language_code": "en", "speakers_expected": 3})
+
+        self.assertEqual(self.provider.get("language_code"), "en")
+        self.assertEqual(self.env_provider.get("speakers_expected"), 3)
+        with open(self.preferences_file, "r", encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["language_code"], "en")
+
+    def test_update_saves_preferences_once(self):
+        with patch.object(self.user_provider, "_save_preferences") as mock_save:
+            self.provider.update({"language_code": "en", "speakers_expected": 3})
+
+        mock_save.assert_called_once()
+
+    def test_update_without_providers(self):
+        CompositeConfigProvider().update({"language_code": "en"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from src.exceptions import UnsupportedFormatError
+from src.formatters.formatter_factory import FormatterFactory
+from src.formatters.json_formatter import JSONFormatter
+from src.formatters.text_formatter import TextFormatter
+
+
+class TestFormatterFactory(unittest.TestCase):
+    """Test cases for the FormatterFactory class."""
+
+    def setUp(self):
+        self._formatters = dict(FormatterFactory._formatters)
+        self._instances = dict(FormatterFactory._instances)
+
+    def tearDown(self):
+        FormatterFactory._formatters.clear()
+        FormatterFactory._formatters.update(self._formatters)
+        FormatterFactory._instances.clear()
+        FormatterFactory._instances.update(self._instances)
+
+    def test_get_formatter_reuses_instance(self):
+        formatter = FormatterFactory.get_formatter("json")
+
+        self.assertIsInstance(formatter, JSONFormatter)
+        self.assertIs(formatter, FormatterFactory.get_formatter(" JSON "))
+
+    def test_register_formatter_invalidates_instance(self):
+        FormatterFactory.get_formatter("json")
+        FormatterFactory.register_formatter("JSON", TextFormatter)
+
+        self.assertIsInstance(FormatterFactory.get_formatter("json"), TextFormatter)
+
+    def test_get_supported_formats(self):
+        formats = FormatterFactory.get_supported_formats()
+
+        self.assertIsInstance(formats, tuple)
+        self.assertIn("html", formats)
+
+    def test_supports_streaming(self):
+        self.assertTrue(FormatterFactory.supports_streaming("json"))
+        self.assertTrue(FormatterFactory.supports_streaming("txt"))
+        self.assertFalse(FormatterFactory.supports_streaming("html"))
+
+    def test_unsupported_format(self):
+        with self.assertRaises(UnsupportedFormatError):
+            FormatterFactory.get_formatter("pdf")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import io
+import unittest
+
+from src.formatters.html_formatter import HTMLFormatter
+from src.models.transcription_result import TranscriptionResult, Utterance
+
+
+class TestHTMLFormatter(unittest.TestCase):
+    """Test cases for the HTMLFormatter class."""
+
+    def setUp(self):
+        self.formatter = HTMLFormatter()
+        self.transcription = TranscriptionResult(
+            utterances=[
+                Utterance(speaker="Speaker A", text="Olá <mundo>", start=65.4, end=70.0),
+                Utterance(speaker="Speaker B", text="Tudo bem?")
+            ],
+            text="Olá <mundo> Tudo bem?",
+            audio_file="audio.wav"
+        )
+
+    def test_format_escapes_and_structures_utterances(self):
+        result = self.formatter.format(self.transcription)
+
+        self.assertTrue(result.startswith("<!DOCTYPE html>\n<html>"))
+        self.assertTrue(result.endswith("</body>\n</html>"))
+        self.assertIn("<p>Arquivo de áudio: audio.wav</p>", result)
+        self.assertIn(
+            "<div class=\"transcription-utterance\">\n"
+            "<span class=\"transcription-timestamp\">[01:05]</span>\n"
+            "<span class=\"transcription-speaker transcription-speaker-Speaker_A\">Speaker A:</span> \n"
+            "<span class=\"transcription-text\">Olá &lt;mundo&gt;</span>\n"
+            "</div>",
+            result
+        )
+        self.assertNotIn("[00:", result)
+
+    def test_format_options(self):
+        result = self.formatter.format(self.transcription, {
+            "title": "Reunião",
+            "include_timestamps": False,
+            "include_metadata": False,
+            "css_class_prefix": "meet",
+            "speaker_colors": {"Speaker A": "red"}
+        })
+
+        self.assertIn("<title>Reunião</title>", result)
+        self.assertIn(".meet-speaker-Speaker_A { color: red; }", result)
+        self.assertNotIn("meet-timestamp\">", result)
+        self.assertNotIn("meet-metadata\">", result)
+
+    def test_format_to_stream_matches_format(self):
+        buf = io.StringIO()
+        self.formatter.format_to_stream(self.transcription, buf, {"title": "Reunião"})
+
+        self.assertEqual(buf.getvalue(), self.formatter.format(self.transcription, {"title": "Reunião"}))
+
+    def test_format_empty_transcription(self):
+        result = self.formatter.format(TranscriptionResult(utterances=[], text="", audio_file=""))
+        self.assertIn("Nenhuma transcrição disponível.", result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.exceptions import FormattingFailedError
+from src.formatters import json_formatter
+from src.formatters.json_formatter import JSONFormatter
+from src.models.transcription_result import TranscriptionResult, Utterance
+
+
+class TestJSONFormatter(unittest.TestCase):
+    """Test cases for the JSONFormatter class."""
+
+    def setUp(self):
+        self.formatter = JSONFormatter()
+        self.transcription = TranscriptionResult(
+            utterances=[
+                Utterance(speaker="Speaker A", text="Olá", start=1.5, end=2.0),
+                Utterance(speaker="Speaker B", text="Tudo bem?")
+            ],
+            text="Olá Tudo bem?",
+            audio_file="audio.wav"
+        )
+
+    def test_format_structure(self):
+        result = json.loads(self.formatter.format(self.transcription))
+
+        self.assertEqual(result["metadata"], {"audio_file": "audio.wav"})
+        self.assertEqual(result["text"], "Olá Tudo bem?")
+        self.assertEqual(result["utterances"], [
+            {"speaker": "Speaker A", "text": "Olá", "start": 1.5, "end": 2.0},
+            {"speaker": "Speaker B", "text": "Tudo bem?"}
+        ])
+
+    def test_format_options(self):
+        result = self.formatter.format(self.transcription, {
+            "pretty_print": False,
+            "include_metadata": False,
+            "include_full_text": False
+        })
+
+        self.assertNotIn("\n", result)
+        self.assertEqual(set(json.loads(result)), {"utterances"})
+
+    def test_format_without_orjson_keeps_unicode(self):
+        with patch.object(json_formatter, "orjson", None):
+            result = self.formatter.format(self.transcription)
+
+        self.assertIn("Olá", result)
+        self.assertIn("\n  \"metadata\"", result)
+
+    def test_format_to_stream_without_orjson(self):
+        buf = io.StringIO()
+        with patch.object(json_formatter, "orjson", None):
+            self.formatter.format_to_stream(self.transcription, buf)
+            expected = self.formatter.format(self.transcription)
+
+        self.assertEqual(buf.getvalue(), expected)
+
+    @unittest.skipIf(json_formatter.orjson is None, "orjson não instalado")
+    def test_format_does_not_depend_on_orjson(self):
+        for options in (None, {"pretty_print": False}):
+            with self.subTest(options=options):
+                with_orjson = self.formatter.format(self.transcription, options)
+                with patch.object(json_formatter, "orjson", None):
+                    without_orjson = self.formatter.format(self.transcription, options)
+
+                self.assertEqual(with_orjson, without_orjson)
+
+    def test_format_compact_uses_standard_separators(self):
+        result = self.formatter.format(self.transcription, {"pretty_print": False, "include_metadata": False})
+
+        self.assertTrue(result.startswith('{"text": "Olá Tudo bem?", "utterances": [{"speaker": '))
+
+    def test_format_stream_matches_format(self):
+        empty = TranscriptionResult(utterances=[], text="", audio_file="audio.wav")
+        for transcription in (self.transcription, empty):
+            for options in (None, {"pretty_print": False}, {"include_metadata": False, "include_full_text": False}):
+                with self.subTest(utterances=len(transcription.utterances), options=options):
+                    result = self.formatter.format_stream(
+                        iter(transcription.utterances), transcription.text, transcription.audio_file, options
+                    )
+                    self.assertEqual(result, self.formatter.format(transcription, options))
+
+    def test_save_to_file_streams_formatted_output(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "transcricao.json")
+            self.assertTrue(self.transcription.save_to_file(output_file))
+
+            with open(output_file, "r", encoding="utf-8") as f:
+                self.assertEqual(f.read(), self.formatter.format(self.transcription))
+
+    def test_failed_save_keeps_existing_file(self):
+        def fail_midway(transcription, stream, options=None):
+            stream.write("{")
+            raise ValueError("fala inválida")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "transcricao.json")
+            with open(output_file, "w", encoding="utf-8") as f:
+                f.write("conteúdo anterior")
+
+            with patch.object(JSONFormatter, "format_to_stream", side_effect=fail_midway):
+                with self.assertRaises(FormattingFailedError):
+                    self.transcription.save_to_file(output_file)
+
+            with open(output_file, "r", encoding="utf-8") as f:
+                self.assertEqual(f.read(), "conteúdo anterior")
+            self.assertEqual(os.listdir(temp_dir), ["transcricao.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
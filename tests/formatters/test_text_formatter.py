@@ -0,0 +1,46 @@
+import unittest
+
+from src.formatters.text_formatter import TextFormatter
+from src.formatters.timestamp import format_timestamp
+from src.models.transcription_result import TranscriptionResult, Utterance
+
+
+class TestTextFormatter(unittest.TestCase):
+    """Test cases for the TextFormatter class."""
+
+    def setUp(self):
+        self.formatter = TextFormatter()
+        self.transcription = TranscriptionResult(
+            utterances=[
+                Utterance(speaker="Speaker A", text="Olá", start=65.9, end=70.0),
+                Utterance(speaker="Speaker B", text="Tudo bem?")
+            ],
+            text="Olá Tudo bem?",
+            audio_file="audio.wav"
+        )
+
+    def test_format_default(self):
+        result = self.formatter.format(self.transcription)
+        self.assertEqual(result, "Speaker A: Olá\nSpeaker B: Tudo bem?")
+
+    def test_format_with_timestamps_and_affixes(self):
+        result = self.formatter.format(self.transcription, {
+            "include_timestamps": True,
+            "speaker_prefix": "<",
+            "speaker_suffix": "> "
+        })
+        self.assertEqual(result, "[01:05] <Speaker A> Olá\n<Speaker B> Tudo bem?")
+
+    def test_format_timestamp(self):
+        self.assertEqual(format_timestamp(0), "00:00")
+        self.assertEqual(format_timestamp(59.99), "00:59")
+        self.assertEqual(format_timestamp(3599), "59:59")
+        self.assertEqual(format_timestamp(4503.2), "75:03")
+
+    def test_format_timestamp_negative_start(self):
+        self.assertEqual(format_timestamp(-5), "00:00")
+        self.assertEqual(format_timestamp(-0.5), "00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.interfaces.plugin import Plugin, PluginRegistry
+
+PLUGIN_SOURCE = '''
+from src.interfaces.plugin import Plugin
+
+
+class EagerPlugin(Plugin):
+    @property
+    def name(self):
+        return "eager_plugin"
+
+    @property
+    def version(self):
+        return "1.0.0"
+
+    @property
+    def description(self):
+        return "Plugin de teste"
+
+    def initialize(self, config):
+        return True
+
+    def get_extension_points(self):
+        return ["output_formatter"]
+
+    def get_implementation(self, extension_point):
+        return "impl" if extension_point == "output_formatter" else None
+'''
+
+
+class TestPluginRegistryDiscovery(unittest.TestCase):
+    """Test cases for PluginRegistry.discover_plugins."""
+
+    def setUp(self):
+        self.plugin_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.plugin_dir, "eager_module.py"), "w", encoding="utf-8") as f:
+            f.write(PLUGIN_SOURCE)
+        PluginRegistry._instance = None
+        self.registry = PluginRegistry()
+
+    def tearDown(self):
+        PluginRegistry._instance = None
+        shutil.rmtree(self.plugin_dir, ignore_errors=True)
+        for module_name in ("eager_module", "reexport_module"):
+            sys.modules.pop(module_name, None)
+
+    def test_discover_plugins_registers_plugins(self):
+        self.assertEqual(self.registry.discover_plugins(self.plugin_dir), 1)
+        self.assertEqual(self.registry.get_implementation("output_formatter", "eager_plugin"), "impl")
+
+    def test_discovered_modules_are_registered_in_sys_modules(self):
+        self.registry.discover_plugins(self.plugin_dir)
+
+        module = sys.modules["eager_module"]
+        self.assertEqual(module.__file__, os.path.join(self.plugin_dir, "eager_module.py"))
+        self.assertIs(type(self.registry.get_plugin("eager_plugin")), module.EagerPlugin)
+
+    def test_existing_modules_are_not_shadowed(self):
+        json_module = sys.modules["json"]
+        module_path = os.path.join(self.plugin_dir, "json.py")
+        with open(module_path, "w", encoding="utf-8") as f:
+            f.write(PLUGIN_SOURCE)
+
+        self.registry.load_plugin_module("json", module_path)
+
+        self.assertIs(sys.modules["json"], json_module)
+
+    def test_imported_plugin_classes_are_not_registered_again(self):
+        with open(os.path.join(self.plugin_dir, "reexport_module.py"), "w", encoding="utf-8") as f:
+            f.write("from eager_module import EagerPlugin\n")
+
+        count = self.registry.load_plugin_module(
+            "reexport_module", os.path.join(self.plugin_dir, "reexport_module.py")
+        )
+
+        self.assertEqual(count, 0)
+        self.assertEqual(self.registry.get_plugins(), [])
+
+    def test_repeated_discovery_skips_unchanged_files(self):
+        self.registry.discover_plugins(self.plugin_dir)
+
+        with patch.object(PluginRegistry, "_import_module") as mock_import:
+            count = self.registry.discover_plugins(self.plugin_dir)
+
+        mock_import.assert_not_called()
+        self.assertEqual(count, 0)
+
+    def test_modified_file_is_loaded_again(self):
+        self.registry.discover_plugins(self.plugin_dir)
+        module_path = os.path.join(self.plugin_dir, "eager_module.py")
+        stat = os.stat(module_path)
+        os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with patch.object(PluginRegistry, "_import_module", wraps=PluginRegistry._import_module) as mock_import:
+            self.registry.discover_plugins(self.plugin_dir)
+
+        mock_import.assert_called_once()
+
+
+class TestPluginRegistryExtensionPoints(unittest.TestCase):
+    """Test cases for the extension point index of PluginRegistry."""
+
+    def setUp(self):
+        PluginRegistry._instance = None
+        self.registry = PluginRegistry()
+        self.plugin = MagicMock(spec=Plugin)
+        self.plugin.name = "mock_plugin"
+        self.plugin.get_extension_points.return_value = ["output_formatter"]
+        self.plugin.get_implementation.return_value = "impl"
+        self.registry.register_plugin(self.plugin)
+
+    def tearDown(self):
+        PluginRegistry._instance = None
+
+    def test_get_plugins_for_extension_point_returns_copy(self):
+        plugins = self.registry.get_plugins_for_extension_point("output_formatter")
+        plugins.clear()
+
+        self.assertEqual(self.registry.get_plugins_for_extension_point("output_formatter"), [self.plugin])
+        self.assertEqual(self.registry.get_plugins_for_extension_point("unknown"), [])
+
+    def test_get_plugin_for_extension_point(self):
+        self.assertIs(self.registry.get_plugin_for_extension_point("output_formatter", "mock_plugin"), self.plugin)
+        self.assertIsNone(self.registry.get_plugin_for_extension_point("audio_converter", "mock_plugin"))
+
+    def test_plugins_can_declare_new_extension_points(self):
+        plugin = MagicMock(spec=Plugin)
+        plugin.name = "custom_plugin"
+        plugin.get_extension_points.return_value = ["custom_point"]
+        self.registry.register_plugin(plugin)
+
+        self.assertEqual(self.registry.get_plugins_for_extension_point("custom_point"), [plugin])
+        self.assertIn("custom_point", self.registry.get_active_extension_points())
+
+    def test_unknown_extension_point_lookup_does_not_create_it(self):
+        self.registry.get_plugins_for_extension_point("unknown")
+        self.registry.get_plugin_for_extension_point("unknown", "mock_plugin")
+
+        self.assertNotIn("unknown", self.registry._extension_points)
+
+    def test_get_implementation_requires_extension_point(self):
+        self.assertEqual(self.registry.get_implementation("output_formatter", "mock_plugin"), "impl")
+        self.assertIsNone(self.registry.get_implementation("audio_converter", "mock_plugin"))
+
+
+class TestPluginRegistryThreadSafety(unittest.TestCase):
+    """Test cases for concurrent use of PluginRegistry."""
+
+    def setUp(self):
+        PluginRegistry._instance = None
+
+    def tearDown(self):
+        PluginRegistry._instance = None
+
+    def _run_threads(self, target, count=8):
+        barrier = threading.Barrier(count)
+        results = [None] * count
+
+        def worker(index):
+            barrier.wait()
+            results[index] = target()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_singleton_is_created_once(self):
+        instances = self._run_threads(PluginRegistry)
+        self.assertTrue(all(instance is instances[0] for instance in instances))
+
+    def test_concurrent_registration_of_same_plugin(self):
+        registry = PluginRegistry()
+        plugin = MagicMock(spec=Plugin)
+        plugin.name = "mock_plugin"
+        plugin.get_extension_points.return_value = ["output_formatter"]
+
+        results = self._run_threads(lambda: registry.register_plugin(plugin))
+
+        self.assertEqual(results.count(True), 1)
+        self.assertEqual(registry.get_plugins_for_extension_point("output_formatter"), [plugin])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.models import optimized_transcription_result
+from src.models.optimized_transcription_result import OptimizedTranscriptionResult, UtteranceIterator
+from src.formatters.formatter_factory import FormatterFactory
+from src.models.transcription_result import Utterance
+
+
+class TestOptimizedTranscriptionResult(unittest.TestCase):
+    """Test cases for OptimizedTranscriptionResult and UtteranceIterator."""
+
+    def setUp(self):
+        self.utterances = [
+            Utterance(speaker="A", text=f"fala {i}", start=float(i), end=i + 0.5)
+            for i in range(5)
+        ]
+        self.result = OptimizedTranscriptionResult(self.utterances, "texto", "audio.wav")
+
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        del self.result
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_iteration_returns_all_utterances(self):
+        self.assertEqual(list(self.result.utterances), self.utterances)
+        self.assertEqual(list(self.result.utterances), self.utterances)
+
+    def test_iteration_opens_file_once(self):
+        # list() asks for the length first; the count is computed once and cached
+        self.result.get_utterance_count()
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            list(self.result.utterances)
+
+        self.assertEqual(mock_open.call_count, 1)
+
+    def test_count_is_known_without_scanning_saved_file(self):
+        with patch("builtins.open") as mock_open:
+            self.assertEqual(self.result.get_utterance_count(), 5)
+        mock_open.assert_not_called()
+
+    def test_object_records_are_supported(self):
+        path = os.path.join(self.temp_dir, "utterances.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"speaker": "B", "text": "oi", "start": 1.0}\n\n')
+
+        self.assertEqual(list(UtteranceIterator(path)), [Utterance(speaker="B", text="oi", start=1.0)])
+
+    def test_iteration_handles_empty_file_and_missing_final_newline(self):
+        path = os.path.join(self.temp_dir, "utterances.jsonl")
+        open(path, "wb").close()
+        self.assertEqual(list(UtteranceIterator(path)), [])
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('["A","um",null,null]\n["B","dois",null,null]')
+        self.assertEqual([u.text for u in UtteranceIterator(path)], ["um", "dois"])
+
+    def test_count_is_lazy_and_known_after_iteration(self):
+        iterator = UtteranceIterator(self.result._utterances_file)
+        self.assertIsNone(iterator._total_count)
+
+        list(iterator)
+
+        with patch("builtins.open") as mock_open:
+            self.assertEqual(len(iterator), 5)
+        mock_open.assert_not_called()
+
+    def test_discarded_iterator_closes_its_mapping(self):
+        iterator = UtteranceIterator(self.result._utterances_file, chunk_size=2)
+        next(iterator)
+        mm = iterator._mm
+
+        del iterator
+
+        self.assertTrue(mm.closed)
+
+    def test_lines_are_decoded_in_batches(self):
+        iterator = UtteranceIterator(self.result._utterances_file, chunk_size=2)
+
+        with patch.object(optimized_transcription_result, "_loads",
+                          wraps=optimized_transcription_result._loads) as mock_loads:
+            self.assertEqual(list(iterator), self.utterances)
+            self.assertEqual(iterator.get_chunk(1, 3), self.utterances[1:4])
+
+        self.assertEqual(mock_loads.call_count, 4)
+
+    @unittest.skipIf(optimized_transcription_result.simdjson is None, "pysimdjson is not installed")
+    def test_simdjson_decoder_returns_python_objects(self):
+        self.assertEqual(
+            optimized_transcription_result._simdjson_loads(b'[["A","oi",1.0,null],{"speaker":"B"}]'),
+            [["A", "oi", 1.0, None], {"speaker": "B"}]
+        )
+
+    def test_count_and_chunks(self):
+        self.assertEqual(self.result.get_utterance_count(), 5)
+        self.assertEqual(self.result.get_utterances_chunk(1, 2), self.utterances[1:3])
+
+    def test_utterances_are_written_in_batches(self):
+        with patch.object(optimized_transcription_result, "_WRITE_BATCH_LINES", 2):
+            result = OptimizedTranscriptionResult(self.utterances, "texto", "audio.wav")
+
+        self.assertEqual(list(result.utterances), self.utterances)
+        self.assertEqual(result.get_utterances_chunk(3, 2), self.utterances[3:])
+
+    def test_non_ascii_text_round_trips(self):
+        utterances = [Utterance(speaker="Falante", text="Ação e reunião ✓")]
+        result = OptimizedTranscriptionResult(utterances, "texto", "audio.wav")
+
+        self.assertEqual(list(result.utterances), utterances)
+
+    def test_chunks_and_items_seek_to_records(self):
+        path = os.path.join(self.temp_dir, "utterances.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('\n["A","um",null,null]\n\n["B","dois",null,null]\n["C","três",null,null]\n')
+        iterator = UtteranceIterator(path)
+
+        self.assertEqual([u.text for u in iterator.get_chunk(1, 5)], ["dois", "três"])
+        self.assertEqual(iterator.get_chunk(3, 5), [])
+        self.assertEqual(iterator[0].speaker, "A")
+        self.assertEqual(iterator[-1].text, "três")
+        self.assertEqual(len(iterator), 3)
+        with self.assertRaises(IndexError):
+            iterator[3]
+
+    def test_formatted_text(self):
+        self.assertEqual(
+            self.result.to_formatted_text(),
+            "\n".join(f"A: fala {i}" for i in range(5))
+        )
+
+    def test_streaming_formats_do_not_materialize_utterances(self):
+        expected = self.result.to_standard_result()
+
+        with patch.object(OptimizedTranscriptionResult, "to_standard_result") as mock_standard:
+            for format_name in ("json", "txt"):
+                with self.subTest(format_name=format_name):
+                    self.assertEqual(
+                        self.result.format(format_name),
+                        FormatterFactory.get_formatter(format_name).format(expected)
+                    )
+        mock_standard.assert_not_called()
+
+        self.assertIn("fala 4", self.result.format("html"))
+
+    def test_formatted_text_is_cached(self):
+        text = self.result.to_formatted_text()
+
+        with patch("builtins.open") as mock_open:
+            self.assertIs(self.result.to_formatted_text(), text)
+        mock_open.assert_not_called()
+
+    def test_durations(self):
+        utterances = self.utterances + [
+            Utterance(speaker="B", text="oi", start=10.0, end=12.0),
+            Utterance(speaker="B", text="sem tempo"),
+        ]
+        result = OptimizedTranscriptionResult(utterances, "texto", "audio.wav")
+
+        self.assertEqual(result.total_duration(), 4.5)
+        self.assertEqual(result.duration_per_speaker(), {"A": 2.5, "B": 2.0})
+
+        empty = OptimizedTranscriptionResult([], "", "audio.wav")
+        self.assertEqual(empty.total_duration(), 0.0)
+        self.assertEqual(empty.duration_per_speaker(), {})
+
+    def test_constructors(self):
+        from_list = OptimizedTranscriptionResult.from_list(self.utterances, "texto", "audio.wav")
+        from_file = OptimizedTranscriptionResult.from_file(from_list._utterances_file, "texto", "audio.wav")
+
+        for result in (from_list, from_file):
+            self.assertEqual(list(result.utterances), self.utterances)
+            self.assertEqual((result.text, result.audio_file), ("texto", "audio.wav"))
+
+    def test_close_removes_temp_file(self):
+        with OptimizedTranscriptionResult(self.utterances, "texto", "audio.wav") as result:
+            path = result._utterances_file
+            self.assertTrue(os.path.exists(path))
+        self.assertFalse(os.path.exists(path))
+        result.close()
+
+        result = OptimizedTranscriptionResult(self.utterances, "texto", "audio.wav")
+        path = result._utterances_file
+        del result
+        self.assertFalse(os.path.exists(path))
+
+    def test_close_keeps_files_given_by_caller(self):
+        path = os.path.join(self.temp_dir, "utterances.jsonl")
+        shutil.copyfile(self.result._utterances_file, path)
+
+        for result in (OptimizedTranscriptionResult(path, "texto", "audio.wav"),
+                       OptimizedTranscriptionResult(self.result._utterances_file, "texto", "audio.wav")):
+            result.close()
+        self.assertTrue(os.path.exists(path))
+        self.assertTrue(os.path.exists(self.result._utterances_file))
+
+    def test_save_to_file_streams_formatted_output(self):
+        for format_name in ("txt", "json", "html"):
+            with self.subTest(format_name=format_name):
+                output_file = os.path.join(self.temp_dir, f"saida.{format_name}")
+                expected = self.result.format(format_name)
+
+                with patch.object(OptimizedTranscriptionResult, "format") as mock_format:
+                    self.assertTrue(self.result.save_to_file(output_file))
+                mock_format.assert_not_called()
+
+                with open(output_file, encoding="utf-8") as f:
+                    self.assertEqual(f.read(), expected)
+
+    def test_save_as_multiple_formats(self):
+        base = os.path.join(self.temp_dir, "saida")
+
+        results = self.result.save_as_multiple_formats(base, ["txt", "json", "html", "xyz"])
+
+        self.assertEqual(results, {"txt": True, "json": True, "html": True, "xyz": False})
+        for format_name in ("txt", "json", "html"):
+            formatter = FormatterFactory.get_formatter(format_name)
+            with open(f"{base}.{formatter.get_file_extension()}", encoding="utf-8") as f:
+                self.assertEqual(f.read(), self.result.format(format_name))
+        self.assertEqual(self.result.save_as_multiple_formats(base, []), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
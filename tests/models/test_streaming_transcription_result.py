@@ -0,0 +1,32 @@
+import unittest
+
+from src.models.streaming_transcription_result import StreamingSession, StreamingTranscriptionResult
+
+
+class TestStreamingSession(unittest.TestCase):
+    """Test cases for StreamingSession."""
+
+    def setUp(self):
+        self.session = StreamingSession()
+
+    def test_current_text_combines_finals_and_last_partial(self):
+        self.assertEqual(self.session.get_current_text(), "")
+
+        self.session.add_result(StreamingTranscriptionResult(text="Olá", is_final=True))
+        self.session.add_result(StreamingTranscriptionResult(text="tudo", is_final=False))
+        self.session.add_result(StreamingTranscriptionResult(text="tudo bem", is_final=False))
+        self.assertEqual(self.session.get_current_text(), "Olá tudo bem")
+
+        self.session.add_result(StreamingTranscriptionResult(text="tudo bem?", is_final=True))
+        self.assertEqual(self.session.get_current_text(), "Olá tudo bem? tudo bem")
+
+    def test_final_text_matches_join_of_final_results(self):
+        for text in ("", "um", "", "dois"):
+            self.session.add_result(StreamingTranscriptionResult(text=text, is_final=True))
+
+        self.assertEqual(self.session.get_current_text(), " ".join(r.text for r in self.session.final_results))
+        self.assertEqual(self.session.to_transcription_result().text, " um  dois")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import importlib
+import sys
+import unittest
+import warnings
+
+from src.patches import pydantic_patch
+import assemblyai.types
+
+
+class TestPydanticPatch(unittest.TestCase):
+    """Test cases for the pydantic/assemblyai compatibility patch."""
+
+    def test_raw_transcription_config_defaults(self):
+        config = assemblyai.types.RawTranscriptionConfig()
+        self.assertEqual(config.language_code, "pt")
+        self.assertTrue(config.speaker_labels)
+        self.assertEqual(config.speakers_expected, 2)
+
+        config = assemblyai.types.RawTranscriptionConfig(language_code="en_us", speakers_expected=3)
+        self.assertEqual(config.language_code, "en_us")
+        self.assertEqual(config.speakers_expected, 3)
+
+    def test_defaults_are_read_only(self):
+        with self.assertRaises(TypeError):
+            pydantic_patch.RAW_TRANSCRIPTION_CONFIG_DEFAULTS["language_code"] = "en_us"
+
+    def test_assemblyai_keeps_pydantic_v1_models(self):
+        import pydantic.v1
+
+        self.assertTrue(issubclass(assemblyai.types.RawTranscriptionConfig, pydantic.v1.BaseModel))
+
+    def test_pydantic_resolves_base_settings(self):
+        import pydantic
+        from pydantic_settings import BaseSettings
+
+        self.assertIs(pydantic.BaseSettings, BaseSettings)
+        self.assertIs(pydantic.__dict__["BaseSettings"], BaseSettings)
+
+    def test_pydantic_patch_is_applied_once(self):
+        import pydantic
+
+        patched_getattr = pydantic.__getattr__
+        base_settings = pydantic.__dict__.pop("BaseSettings", None)
+        try:
+            pydantic_patch.patch_pydantic_module(pydantic)
+
+            self.assertIs(pydantic.__getattr__, patched_getattr)
+        finally:
+            if base_settings is not None:
+                pydantic.BaseSettings = base_settings
+
+    def test_defaults_patch_is_applied_once(self):
+        patched_init = assemblyai.types.RawTranscriptionConfig.__init__
+
+        pydantic_patch.patch_raw_transcription_config_defaults(assemblyai.types)
+
+        self.assertIs(assemblyai.types.RawTranscriptionConfig.__init__, patched_init)
+
+    def test_finder_patches_module_when_loaded(self):
+        original_module = sys.modules.pop("assemblyai.types")
+        finder = pydantic_patch.PydanticFinder()
+        sys.meta_path.insert(0, finder)
+        try:
+            # Re-executing assemblyai.types repeats its pydantic deprecation warnings
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)
+                module = importlib.import_module("assemblyai.types")
+
+            self.assertIsNot(module, original_module)
+            self.assertTrue(module.RawTranscriptionConfig.__init__._automeetai_defaults)
+            self.assertEqual(module.RawTranscriptionConfig().speakers_expected, 2)
+        finally:
+            if finder in sys.meta_path:
+                sys.meta_path.remove(finder)
+            sys.modules["assemblyai.types"] = original_module
+            sys.modules["assemblyai"].types = original_module
+
+    def test_finder_removes_itself_once_all_modules_are_matched(self):
+        original_module = sys.modules.pop("assemblyai.types")
+        finder = pydantic_patch.PydanticFinder()
+        sys.meta_path.insert(0, finder)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)
+                importlib.import_module("assemblyai.types")
+
+            self.assertNotIn(finder, sys.meta_path)
+            self.assertIsNone(finder.find_spec("assemblyai.types", None))
+        finally:
+            if finder in sys.meta_path:
+                sys.meta_path.remove(finder)
+            sys.modules["assemblyai.types"] = original_module
+            sys.modules["assemblyai"].types = original_module
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+import base64
+import json
+import os
+import queue
+import tempfile
+import time
+import unittest
+import wave
+from unittest.mock import Mock, patch
+
+import websocket
+
+from src.services.assemblyai_streaming_transcription_service import AssemblyAIStreamingTranscriptionService
+
+
+class TestAssemblyAIStreamingTranscriptionService(unittest.TestCase):
+    """
+    Testes para o AssemblyAIStreamingTranscriptionService.
+
+    Os testes usam um WebSocket simulado e não acessam a API da AssemblyAI.
+    """
+
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.service = AssemblyAIStreamingTranscriptionService()
+        self.ws = Mock()
+
+    def _sent_audio(self):
+        return [
+            base64.b64decode(json.loads(call.args[0])["audio_data"])
+            for call in self.ws.send.call_args_list
+        ]
+
+    def test_pending_chunks_are_sent_in_one_message(self):
+        """Os fragmentos pendentes na fila são enviados em uma única mensagem."""
+        audio_queue = queue.Queue()
+        for chunk in (b"\x01" * 10, b"\x02" * 20, b"\x03" * 30, None):
+            audio_queue.put(chunk)
+
+        self.service._send_audio_loop(self.ws, audio_queue)
+
+        self.assertEqual(self._sent_audio(), [b"\x01" * 10 + b"\x02" * 20 + b"\x03" * 30])
+        self.assertEqual(self.ws.send.call_args.kwargs, {"opcode": websocket.ABNF.OPCODE_TEXT})
+
+    def test_batches_are_limited_by_size(self):
+        """Um novo lote é iniciado quando o tamanho máximo é atingido."""
+        chunk_size = AssemblyAIStreamingTranscriptionService.MAX_BATCH_BYTES // 2
+        audio_queue = queue.Queue()
+        for i in range(3):
+            audio_queue.put(bytes([i]) * chunk_size)
+        audio_queue.put(None)
+
+        self.service._send_audio_loop(self.ws, audio_queue)
+
+        self.assertEqual(self._sent_audio(), [
+            b"\x00" * chunk_size + b"\x01" * chunk_size,
+            b"\x02" * chunk_size,
+        ])
+
+    def _start_streaming(self, opens_connection):
+        def create_ws(url, on_open, **kwargs):
+            ws = Mock()
+            if opens_connection:
+                ws.run_forever.side_effect = lambda **run_kwargs: on_open(ws)
+            return ws
+
+        self.service.api_key = "test_api_key_12345678901234567890"
+        with patch("websocket.WebSocketApp", side_effect=create_ws):
+            return self.service.start_streaming()
+
+    def test_start_streaming_waits_for_connection(self):
+        """A sessão é iniciada assim que a conexão é aberta, sem espera fixa."""
+        self.assertTrue(self._start_streaming(opens_connection=True))
+        config_payload = self.service.ws.send.call_args.args[0]
+        self.assertEqual(json.loads(config_payload), {
+            "sample_rate": AssemblyAIStreamingTranscriptionService.RATE,
+            "language_code": self.service.streaming_config["language_code"],
+            "enable_speaker_diarization": self.service.streaming_config["speaker_labels"],
+        })
+        self.service.stop_streaming()
+
+    def test_stop_streaming_sends_all_audio_before_closing(self):
+        """Todo o áudio enfileirado é enviado antes do encerramento da sessão e do fechamento."""
+        events = []
+
+        def send(payload, opcode=None):
+            data = json.loads(payload)
+            if "audio_data" in data:
+                time.sleep(0.005)
+                events.append(("audio", base64.b64decode(data["audio_data"])))
+            elif "terminate_session" in data:
+                events.append(("terminate", None))
+
+        with patch.object(self.service, "MAX_QUEUED_CHUNKS", 4):
+            self.assertTrue(self._start_streaming(opens_connection=True))
+        self.service.ws.send.side_effect = send
+        self.service.ws.close.side_effect = lambda: events.append(("close", None))
+
+        chunks = [bytes([i % 256]) * 2048 for i in range(100)]
+        for chunk in chunks:
+            self.service.transcribe_chunk(chunk)
+        self.service.stop_streaming()
+
+        self.assertEqual([kind for kind, _ in events[-2:]], ["terminate", "close"])
+        self.assertEqual(b"".join(data for kind, data in events if kind == "audio"), b"".join(chunks))
+
+    def test_stream_file_waits_for_final_result_after_flush(self):
+        """A espera pelo resultado final só começa depois que todo o áudio foi enviado."""
+        fd, audio_file = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        self.addCleanup(os.remove, audio_file)
+        with wave.open(audio_file, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(16000)
+            wf.writeframes(b"\x00\x01" * 64000)
+
+        events = []
+
+        def send(payload, opcode=None):
+            if b"audio_data" in payload:
+                time.sleep(0.01)
+                events.append("audio")
+
+        def wait(timeout=None):
+            events.append("wait")
+            return False
+
+        self.assertTrue(self._start_streaming(opens_connection=True))
+        self.service.ws.send.side_effect = send
+        with patch.object(self.service, "start_streaming", return_value=True), \
+                patch.object(self.service._final_event, "wait", side_effect=wait):
+            self.service.stream_file(audio_file)
+
+        self.assertEqual(events.index("wait"), len(events) - 1)
+        self.assertEqual(events.count("audio"), 8)
+
+    def test_start_streaming_fails_on_connection_timeout(self):
+        """A sessão não é iniciada se a conexão não abrir dentro do tempo máximo."""
+        with patch.object(self.service, "CONNECT_TIMEOUT", 0.01):
+            self.assertFalse(self._start_streaming(opens_connection=False))
+
+        self.assertFalse(self.service.is_streaming())
+        self.service.ws.close.assert_called_once()
+
+    def test_received_results_are_passed_to_callback(self):
+        """Os resultados recebidos do WebSocket são repassados ao callback da captura."""
+        callback = Mock()
+        self.service.result_callback = callback
+
+        self.service._on_message(self.ws, json.dumps({"message_type": "PartialTranscript", "text": "olá"}))
+
+        callback.assert_called_once()
+        self.assertEqual(callback.call_args.args[0]["text"], "olá")
+        self.assertFalse(callback.call_args.args[0]["is_final"])
+
+    def test_stream_file_reads_batch_sized_chunks(self):
+        """O arquivo é lido em fragmentos de pelo menos MAX_BATCH_BYTES."""
+        fd, audio_file = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        self.addCleanup(os.remove, audio_file)
+        with wave.open(audio_file, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(16000)
+            wf.writeframes(b"\x00\x01" * 16000)
+
+        with patch.object(self.service, "start_streaming", return_value=True), \
+                patch.object(self.service, "transcribe_chunk", return_value=None) as mock_transcribe, \
+                patch.object(self.service, "stop_streaming"), \
+                patch.object(self.service, "FINAL_RESULT_TIMEOUT", 0):
+            self.service.stream_file(audio_file, chunk_size=1024)
+
+        sizes = [len(call.args[0]) for call in mock_transcribe.call_args_list]
+        batch = AssemblyAIStreamingTranscriptionService.MAX_BATCH_BYTES
+        self.assertEqual(sizes, [batch, 32000 - batch])
+
+
+if __name__ == "__main__":
+    unittest.main()
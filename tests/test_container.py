@@ -0,0 +1,46 @@
+import unittest
+
+from src.container import Container
+
+
+class _Service:
+    def __init__(self, config_provider=None):
+        self.config_provider = config_provider
+
+
+class TestContainer(unittest.TestCase):
+    """Test cases for the Container class."""
+
+    def setUp(self):
+        self.container = Container()
+
+    def test_registered_class_is_resolved_once(self):
+        self.container.register("service", _Service)
+
+        first = self.container.resolve("service", config_provider="a")
+        self.assertIs(first, self.container.resolve("service", config_provider="b"))
+
+    def test_resolver_creates_new_instance_per_call(self):
+        self.container.register_resolver("service", _Service)
+
+        first = self.container.resolve("service", config_provider="a")
+        second = self.container.resolve("service", config_provider="b")
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.config_provider, "b")
+
+    def test_registered_instance_takes_precedence(self):
+        instance = _Service()
+        self.container.register_resolver("service", _Service)
+        self.container.register_instance("service", instance)
+
+        self.assertIs(self.container.resolve("service"), instance)
+
+    def test_unknown_dependency(self):
+        with self.assertRaises(KeyError):
+            self.container.resolve("missing")
+        self.assertIsNone(self.container.get("missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
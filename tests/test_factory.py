@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.config.env_config_provider import EnvConfigProvider
+from src.factory import AutoMeetAIFactory
+from src.services.mock_transcription_service import MockTranscriptionService
+
+
+class TestFactoryCreateCache(unittest.TestCase):
+    """Verifica o cache de instâncias do método create da factory."""
+
+    def setUp(self):
+        self.factory = AutoMeetAIFactory()
+        self.kwargs = {
+            "transcription_service_type": "mock",
+            "include_text_generation": False,
+            "use_user_preferences": False,
+            "use_plugins": False,
+        }
+
+    def test_same_arguments_return_cached_instance(self):
+        first = self.factory.create(**self.kwargs)
+        second = self.factory.create(**self.kwargs)
+        self.assertIs(first, second)
+
+    def test_different_arguments_build_new_instance(self):
+        first = self.factory.create(**self.kwargs)
+        second = self.factory.create(use_cache=False, **self.kwargs)
+        self.assertIsNot(first, second)
+
+    def test_environment_change_builds_new_instance(self):
+        first = self.factory.create(**self.kwargs)
+        with patch.dict(os.environ, {"AUTOMEETAI_LANGUAGE_CODE": "en"}):
+            second = self.factory.create(**self.kwargs)
+        self.assertIsNot(first, second)
+
+    def test_preferences_file_change_builds_new_instance(self):
+        fd, preferences_file = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self.addCleanup(os.remove, preferences_file)
+        kwargs = dict(self.kwargs, use_user_preferences=True, user_preferences_file=preferences_file)
+        with open(preferences_file, "w", encoding="utf-8") as f:
+            f.write("{}")
+        first = self.factory.create(**kwargs)
+        with open(preferences_file, "w", encoding="utf-8") as f:
+            f.write('{"language_code": "en"}')
+        self.assertIsNot(first, self.factory.create(**kwargs))
+
+    def test_api_key_does_not_rewrite_preferences_file(self):
+        fd, preferences_file = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self.addCleanup(os.remove, preferences_file)
+        with open(preferences_file, "w", encoding="utf-8") as f:
+            f.write("{}")
+        kwargs = dict(
+            self.kwargs,
+            assemblyai_api_key="test_api_key_12345678901234567890",
+            use_user_preferences=True,
+            user_preferences_file=preferences_file,
+        )
+        mtime = os.stat(preferences_file).st_mtime_ns
+
+        first = self.factory.create(**kwargs)
+        second = self.factory.create(**kwargs)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.factory._create_cache), 1)
+        self.assertEqual(os.stat(preferences_file).st_mtime_ns, mtime)
+        with open(preferences_file, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "{}")
+        self.assertEqual(
+            first.config_provider.get("assemblyai_api_key"), "test_api_key_12345678901234567890"
+        )
+
+    def test_clear_cache(self):
+        first = self.factory.create(**self.kwargs)
+        self.factory.clear_cache()
+        self.assertIsNot(first, self.factory.create(**self.kwargs))
+
+
+class TestFactoryConfigProvider(unittest.TestCase):
+    """Verifica o provedor de configuração montado pela factory."""
+
+    def test_single_provider_is_used_directly(self):
+        automeetai = AutoMeetAIFactory().create(
+            assemblyai_api_key="test-key",
+            transcription_service_type="mock",
+            include_text_generation=False,
+            use_user_preferences=False,
+            use_plugins=False,
+        )
+        self.assertIsInstance(automeetai.config_provider, EnvConfigProvider)
+        self.assertEqual(automeetai.config_provider.get("assemblyai_api_key"), "test-key")
+
+
+class TestFactoryTranscriptionServiceDispatch(unittest.TestCase):
+    """Verifica a seleção do serviço de transcrição pelo tipo informado."""
+
+    def test_service_type_is_case_insensitive(self):
+        automeetai = AutoMeetAIFactory().create(
+            transcription_service_type="MOCK",
+            include_text_generation=False,
+            use_user_preferences=False,
+            use_plugins=False,
+        )
+        self.assertIsInstance(automeetai.transcription_service, MockTranscriptionService)
+
+    def test_services_are_not_shared_between_builds(self):
+        factory = AutoMeetAIFactory()
+        kwargs = {
+            "transcription_service_type": "mock",
+            "include_text_generation": False,
+            "use_user_preferences": False,
+            "use_plugins": False,
+        }
+        first = factory.create(**kwargs)
+        second = factory.create(use_cache=False, **kwargs)
+
+        self.assertIsNot(first.transcription_service, second.transcription_service)
+        self.assertIs(second.transcription_service.config_provider, second.config_provider)
+
+
+if __name__ == "__main__":
+    unittest.main()
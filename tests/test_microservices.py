@@ -1,5 +1,7 @@
+import json
 import os
 import sys
+import threading
 import unittest
 from unittest.mock import MagicMock
 from fastapi.testclient import TestClient
@@ -19,13 +21,17 @@ class TestTranscriptionService(unittest.TestCase):
     def setUp(self) -> None:
         """Patch the AutoMeetAI instance used by the service."""
         self.mock_app = MagicMock()
-        transcription_service.automeetai = self.mock_app
+        transcription_service.app.dependency_overrides[transcription_service.get_automeetai] = lambda: self.mock_app
         self.client = TestClient(transcription_service.app)
 
+    def tearDown(self) -> None:
+        transcription_service.app.dependency_overrides.clear()
+
     def test_health(self):
         response = self.client.get("/health")
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"status": "ok"})
+        self.assertEqual(transcription_service.get_automeetai.cache_info().currsize, 0)
 
     def test_transcribe(self):
         from src.models.transcription_result import TranscriptionResult, Utterance
@@ -44,18 +50,55 @@ class TestTranscriptionService(unittest.TestCase):
             headers={"X-API-Key": "testtoken123"},
         )
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json()["text"], "hello")
+        self.assertEqual(response.json(), {
+            "text": "hello",
+            "utterances": [{"speaker": "1", "text": "hello", "start": None, "end": None}],
+        })
         self.mock_app.process_video.assert_called_once()
 
+    @unittest.skipIf(transcription_service.msgspec is None, "msgspec is not installed")
+    def test_msgspec_response_encodes_utterances(self):
+        from src.models.transcription_result import Utterance
+
+        response = transcription_service.ResponseClass({"utterances": [Utterance(speaker="1", text="hi")]})
+        self.assertEqual(
+            json.loads(response.body),
+            {"utterances": [{"speaker": "1", "text": "hi", "start": None, "end": None}]},
+        )
+
+    def test_transcribe_streams_upload_to_worker(self):
+        from src.models.transcription_result import TranscriptionResult
+
+        data = b"x" * (transcription_service.UPLOAD_CHUNK_SIZE + 10)
+        received = {}
+
+        def process_video(video_file, transcription_config):
+            with open(video_file, "rb") as f:
+                received["data"] = f.read()
+            return TranscriptionResult(utterances=[], text="ok", audio_file=video_file)
+
+        self.mock_app.process_video.side_effect = process_video
+
+        response = self.client.post(
+            "/transcriptions",
+            files={"file": ("test.mp4", data, "video/mp4")},
+            headers={"X-API-Key": "testtoken123"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(received["data"], data)
+
 
 class TestAnalysisService(unittest.TestCase):
     """Tests for the analysis microservice."""
 
     def setUp(self) -> None:
         self.mock_app = MagicMock()
-        analysis_service.automeetai = self.mock_app
+        analysis_service.app.dependency_overrides[analysis_service.get_automeetai] = lambda: self.mock_app
         self.client = TestClient(analysis_service.app)
 
+    def tearDown(self) -> None:
+        analysis_service.app.dependency_overrides.clear()
+
     def test_health(self):
         response = self.client.get("/health")
         self.assertEqual(response.status_code, 200)
@@ -72,6 +115,54 @@ class TestAnalysisService(unittest.TestCase):
         self.assertEqual(response.json(), {"analysis": "summary"})
         self.mock_app.analyze_transcription.assert_called_once()
 
+    def test_analyze_rejects_invalid_api_key(self):
+        for headers in ({"X-API-Key": "wrongtoken"}, {}):
+            response = self.client.post("/analysis", json={"text": "hello"}, headers=headers)
+            self.assertEqual(response.status_code, 401)
+        self.mock_app.analyze_transcription.assert_not_called()
+
+    def test_identical_concurrent_analyses_share_one_call(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def analyze_transcription(**kwargs):
+            started.set()
+            release.wait(5)
+            return "summary"
+
+        self.mock_app.analyze_transcription.side_effect = analyze_transcription
+        request = analysis_service.AnalysisRequest(text="hello")
+        results = []
+
+        owner = threading.Thread(
+            target=lambda: results.append(analysis_service._run_analysis(self.mock_app, request))
+        )
+        owner.start()
+        started.wait(5)
+
+        # Release the running call only once the second request waits on it
+        future = analysis_service._IN_FLIGHT[("hello", request.system_prompt, request.user_prompt)]
+        waiting = threading.Event()
+        wait_result = future.result
+
+        def result():
+            waiting.set()
+            return wait_result()
+
+        future.result = result
+        waiter = threading.Thread(
+            target=lambda: results.append(analysis_service._run_analysis(self.mock_app, request))
+        )
+        waiter.start()
+        waiting.wait(5)
+        release.set()
+        owner.join()
+        waiter.join()
+
+        self.assertEqual(results, ["summary", "summary"])
+        self.mock_app.analyze_transcription.assert_called_once()
+        self.assertEqual(analysis_service._IN_FLIGHT, {})
+
 
 if __name__ == "__main__":
     unittest.main()
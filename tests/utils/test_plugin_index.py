@@ -0,0 +1,192 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.factory import AutoMeetAIFactory
+from src.interfaces.plugin import PluginRegistry
+from src.utils.plugin_index import PluginIndex
+
+PLUGIN_SOURCE = '''
+from src.interfaces.plugin import Plugin
+
+LOADED = True
+
+
+class LazyPlugin(Plugin):
+    @property
+    def name(self):
+        return "lazy_plugin"
+
+    @property
+    def version(self):
+        return "1.2.3"
+
+    @property
+    def description(self):
+        return "Plugin de teste"
+
+    def initialize(self, config):
+        self.config = config
+        return True
+
+    def get_extension_points(self):
+        return ["output_formatter"]
+
+    def get_implementation(self, extension_point):
+        return self.config.get("value") if extension_point == "output_formatter" else None
+'''
+
+DYNAMIC_PLUGIN_SOURCE = PLUGIN_SOURCE.replace('return "lazy_plugin"', 'return "dynamic_" + "plugin"')
+
+
+class TestPluginIndex(unittest.TestCase):
+    """Test cases for the persistent plugin metadata index."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.plugin_dir = os.path.join(self.temp_dir, "plugins")
+        self.index_file = os.path.join(self.temp_dir, "cache", "plugins_index.json")
+        os.makedirs(self.plugin_dir)
+        PluginRegistry._instance = None
+
+    def tearDown(self):
+        PluginRegistry._instance = None
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_plugin(self, filename, source=PLUGIN_SOURCE):
+        with open(os.path.join(self.plugin_dir, filename), "w", encoding="utf-8") as f:
+            f.write(source)
+
+    def test_refresh_extracts_metadata_without_import(self):
+        """Metadata is extracted statically and persisted to the index file."""
+        self._write_plugin("lazy_module.py")
+
+        with patch.object(PluginRegistry, "_import_module") as mock_import:
+            entries = PluginIndex(self.index_file).refresh(self.plugin_dir)
+
+        mock_import.assert_not_called()
+        self.assertEqual(len(entries), 1)
+        self.assertTrue(entries[0]["static"])
+        self.assertEqual(entries[0]["plugins"], [{
+            "class_name": "LazyPlugin",
+            "name": "lazy_plugin",
+            "version": "1.2.3",
+            "description": "Plugin de teste",
+            "extension_points": ["output_formatter"],
+        }])
+        self.assertTrue(os.path.exists(self.index_file))
+
+    def test_refresh_reuses_unchanged_entries(self):
+        """Unchanged files are not parsed again on a new refresh."""
+        self._write_plugin("lazy_module.py")
+        PluginIndex(self.index_file).refresh(self.plugin_dir)
+
+        with patch.object(PluginIndex, "_parse") as mock_parse:
+            entries = PluginIndex(self.index_file).refresh(self.plugin_dir)
+
+        mock_parse.assert_not_called()
+        self.assertEqual(entries[0]["plugins"][0]["name"], "lazy_plugin")
+
+    def test_non_literal_metadata_is_not_static(self):
+        """Plugins whose metadata is computed at runtime require an import."""
+        self._write_plugin("dynamic_module.py", DYNAMIC_PLUGIN_SOURCE)
+
+        entries = PluginIndex(self.index_file).refresh(self.plugin_dir)
+
+        self.assertFalse(entries[0]["static"])
+
+    def test_indirect_plugin_subclass_is_not_static(self):
+        """Classes derived from a plugin base defined in another module require an import."""
+        self._write_plugin("base_module.py", PLUGIN_SOURCE)
+        self._write_plugin("child_module.py", (
+            "from base_module import LazyPlugin\n\n\n"
+            "class ChildPlugin(LazyPlugin):\n"
+            "    @property\n"
+            "    def name(self):\n"
+            "        return \"child_plugin\"\n"
+        ))
+
+        entries = PluginIndex(self.index_file).refresh(self.plugin_dir)
+
+        child_entry = next(entry for entry in entries if entry["module_name"] == "child_module")
+        self.assertFalse(child_entry["static"])
+
+    def test_example_plugin_with_interface_base_is_static(self):
+        """The shipped example plugin, which bundles an AudioConverter, stays lazy."""
+        example_plugin = os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir, "plugins", "example_plugin.py"
+        )
+        shutil.copy(example_plugin, self.plugin_dir)
+
+        entries = PluginIndex(self.index_file).refresh(self.plugin_dir)
+
+        self.assertTrue(entries[0]["static"])
+        self.assertEqual([plugin["name"] for plugin in entries[0]["plugins"]], ["example_plugin"])
+
+    def test_local_subclass_of_plugin_is_not_static(self):
+        """Classes derived from a plugin defined in the same module require an import."""
+        self._write_plugin("local_module.py", PLUGIN_SOURCE + (
+            "\n\nclass ChildPlugin(LazyPlugin):\n"
+            "    pass\n"
+        ))
+
+        entries = PluginIndex(self.index_file).refresh(self.plugin_dir)
+
+        self.assertFalse(entries[0]["static"])
+
+    def test_factory_defers_plugin_import(self):
+        """The factory registers indexed plugins and imports them only on demand."""
+        self._write_plugin("lazy_module.py")
+        factory = AutoMeetAIFactory()
+
+        with patch.object(PluginRegistry, "_import_module", wraps=PluginRegistry._import_module) as mock_import:
+            count = factory.load_plugins(self.plugin_dir, index_file=self.index_file)
+
+            self.assertEqual(count, 1)
+            self.assertTrue(factory.plugins_loaded)
+            mock_import.assert_not_called()
+
+            factory.configure_plugins({"lazy_plugin": {"value": "impl"}})
+            mock_import.assert_called_once()
+
+        self.assertEqual(
+            factory.plugin_registry.get_implementation("output_formatter", "lazy_plugin"),
+            "impl"
+        )
+
+    def test_active_extension_points_include_lazy_plugins(self):
+        """Extension points of indexed plugins are known before their import."""
+        self._write_plugin("lazy_module.py")
+        factory = AutoMeetAIFactory()
+
+        with patch.object(PluginRegistry, "_import_module") as mock_import:
+            factory.load_plugins(self.plugin_dir, index_file=self.index_file)
+            active = factory.plugin_registry.get_active_extension_points()
+
+        mock_import.assert_not_called()
+        self.assertEqual(active, frozenset({"output_formatter"}))
+
+    def test_plugin_info_is_cached_per_registry_revision(self):
+        """Plugin info is reused until the registry revision changes."""
+        self._write_plugin("lazy_module.py")
+        factory = AutoMeetAIFactory()
+        factory.load_plugins(self.plugin_dir, index_file=self.index_file)
+
+        info = factory.get_plugin_info()
+        self.assertEqual(info, [{
+            "name": "lazy_plugin",
+            "version": "1.2.3",
+            "description": "Plugin de teste",
+            "extension_points": "output_formatter",
+        }])
+        self.assertIs(factory.get_plugin_info(), info)
+        self.assertEqual(factory.get_plugin_names(), ["lazy_plugin"])
+
+        factory.configure_plugins({})
+        self.assertIsNot(factory.get_plugin_info(), info)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from src.utils.prompt_template import render_prompt, split_template
+
+
+class TestPromptTemplate(unittest.TestCase):
+    """Test cases for prompt template rendering."""
+
+    def test_single_placeholder_is_split(self):
+        self.assertEqual(split_template("Analise:\n{transcription}\nFim"), ("Analise:\n", "\nFim"))
+
+    def test_other_templates_are_not_split(self):
+        for template in ("{transcription} {transcription}", "{{literal}} {transcription}", "{language}: {transcription}", "sem marcador"):
+            with self.subTest(template=template):
+                self.assertIsNone(split_template(template))
+
+    def test_render_matches_str_format(self):
+        text = "A: texto com {chaves}"
+        for template in ("Analise:\n{transcription}", "{{x}} {transcription}", "{transcription}|{transcription}", "fixo"):
+            with self.subTest(template=template):
+                self.assertEqual(render_prompt(template, text), template.format(transcription=text))
+
+    def test_render_rejects_unknown_fields(self):
+        with self.assertRaises(KeyError):
+            render_prompt("{language}: {transcription}", "texto")
+
+
+if __name__ == "__main__":
+    unittest.main()